@@ -54,6 +54,7 @@ class ConfigSchema:
     sentinel_tier1_model: str = ""  # Set in dev-kid.yml, e.g. "qwen3-coder:30b"
     sentinel_tier1_ollama_url: str = "http://localhost:11434"
     sentinel_tier1_max_iterations: int = 5
+    sentinel_tier1_probe_ttl: float = 30.0  # seconds an Ollama health probe is reused
 
     # Sentinel: Legacy Tier 2 (cloud) — only used when tiers_file is empty
     sentinel_tier2_model: str = (
@@ -87,6 +88,9 @@ class ConfigSchema:
     sentinel_placeholder_fail_on_detect: bool = True
     sentinel_placeholder_patterns: list = field(default_factory=list)
     sentinel_placeholder_exclude_paths: list = field(default_factory=list)
+    sentinel_placeholder_full_report: bool = (
+        False  # True = list every violation; False = stop at the first when failing
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -123,6 +127,7 @@ class ConfigSchema:
                     "model": self.sentinel_tier1_model,
                     "ollama_url": self.sentinel_tier1_ollama_url,
                     "max_iterations": self.sentinel_tier1_max_iterations,
+                    "probe_ttl": self.sentinel_tier1_probe_ttl,
                 },
                 "tier2": {
                     "model": self.sentinel_tier2_model,
@@ -140,6 +145,7 @@ class ConfigSchema:
                     "fail_on_detect": self.sentinel_placeholder_fail_on_detect,
                     "patterns": self.sentinel_placeholder_patterns,
                     "exclude_paths": self.sentinel_placeholder_exclude_paths,
+                    "full_report": self.sentinel_placeholder_full_report,
                 },
             },
         }
@@ -208,6 +214,7 @@ class ConfigSchema:
             sentinel_tier1_model=tier1.get("model", "qwen3-coder:30b"),
             sentinel_tier1_ollama_url=tier1.get("ollama_url", "http://localhost:11434"),
             sentinel_tier1_max_iterations=tier1.get("max_iterations", 5),
+            sentinel_tier1_probe_ttl=tier1.get("probe_ttl", 30.0),
             sentinel_tier2_model=tier2.get("model", "claude-sonnet-4-20250514"),
             sentinel_tier2_max_iterations=tier2.get("max_iterations", 10),
             sentinel_tier2_max_budget_usd=tier2.get("max_budget_usd", 2.0),
@@ -221,6 +228,7 @@ class ConfigSchema:
             sentinel_placeholder_fail_on_detect=placeholder.get("fail_on_detect", True),
             sentinel_placeholder_patterns=placeholder.get("patterns", []),
             sentinel_placeholder_exclude_paths=placeholder.get("exclude_paths", []),
+            sentinel_placeholder_full_report=placeholder.get("full_report", False),
         )
 
 
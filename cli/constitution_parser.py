@@ -6,11 +6,73 @@ This module provides the Constitution class for parsing .constitution.md files
 and validating code against constitutional rules.
 """
 
+import functools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Validation patterns, compiled once for every file and every wave
+_SECTION_RE = re.compile(r"^## (.+)$")
+_PRIVATE_DEF_RE = re.compile(r"\s*def\s+_[_\w]*\(")
+_PRIVATE_CLASS_RE = re.compile(r"\s*class\s+_[_\w]*")
+_DEF_PARAMS_RE = re.compile(r"def\s+\w+\s*\((.*?)\)")
+
+# Common secret keywords to detect (the first one found is reported)
+_SECRET_KEYWORDS = (
+    "password",
+    "passwd",
+    "pwd",
+    "api_key",
+    "apikey",
+    "api-key",
+    "secret",
+    "secret_key",
+    "token",
+    "auth_token",
+    "access_token",
+    "private_key",
+    "privatekey",
+    "client_secret",
+    "client-secret",
+)
+
+# Assignments containing any of these are not reported as hardcoded secrets
+_SECRET_SAFE_PATTERNS = (
+    "os.getenv",
+    "os.environ",
+    "environ.get",
+    "config.get",
+    "None",
+    '""',
+    "''",
+    "input(",
+    "getpass(",
+    "default=",
+    "help=",  # argparse defaults
+)
+
+# Below this many Python files, validate serially: a pool's startup costs
+# more than the line scans it would spread out. Kept equal to
+# sentinel.sql_utils.PARALLEL_MIN_FILES; this module cannot import the
+# optional sentinel package.
+_PARALLEL_MIN_FILES = 32
+
+
+@functools.lru_cache(maxsize=256)
+def _read_source(path: str, mtime_ns: int, size: int) -> str:
+    """Read a source file, memoized by its stat identity.
+
+    validate_output() re-checks the same generated files wave after wave;
+    (mtime_ns, size) changes whenever a file is rewritten, so unchanged files
+    are served from memory instead of being read and decoded again.
+    """
+    return Path(path).read_text()
+
 
 @dataclass
 class ConstitutionViolation:
@@ -55,6 +117,12 @@ class Constitution:
         "MIGRATION_NEEDS_ROLLBACK",
     }
 
+    # One "- RULE_ID" list-item pattern per SQL rule, compiled at class creation
+    _SQL_RULE_RES: Dict[str, "re.Pattern[str]"] = {
+        rule_id: re.compile(rf"^\s*[-*]\s+{re.escape(rule_id)}\s*$", re.MULTILINE)
+        for rule_id in SQL_RULE_IDS
+    }
+
     def __init__(self, file_path: str = "memory-bank/shared/.constitution.md"):
         """
         Load constitution from memory-bank/shared/.constitution.md
@@ -68,6 +136,8 @@ class Constitution:
         self.file_path = Path(file_path)
         self.sections: Dict[str, ConstitutionSection] = {}
         self.rules: Dict[str, str] = {}
+        # get_active_sql_rules result, keyed by the file's (mtime_ns, size)
+        self._sql_rules_cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
 
         if self.file_path.exists():
             try:
@@ -91,14 +161,13 @@ class Constitution:
         content = self.file_path.read_text(encoding="utf-8")
 
         # Extract sections (## Section Name)
-        section_pattern = r"^## (.+)$"
         current_section = None
         current_rules = []
         rule_dict = {}
 
         for line in content.split("\n"):
             # Check for section header
-            section_match = re.match(section_pattern, line.strip())
+            section_match = _SECTION_RE.match(line.strip())
             if section_match:
                 # Save previous section
                 if current_section:
@@ -204,7 +273,9 @@ class Constitution:
 
         return relevant_rules
 
-    def validate_output(self, files: List[str]) -> List[ConstitutionViolation]:
+    def validate_output(
+        self, files: List[str], workers: Optional[int] = None
+    ) -> List[ConstitutionViolation]:
         """
         Validate modified files against constitution rules
 
@@ -215,31 +286,62 @@ class Constitution:
         - Test coverage for new code
         - Security best practices
 
+        Large batches of Python files are validated in worker processes.
+
         Args:
             files: List of file paths to validate
+            workers: Worker process count (default: os.cpu_count())
 
         Returns:
-            List of violations found
+            List of violations found, in file order
         """
-        violations = []
+        results: Dict[int, List[ConstitutionViolation]] = {}
+        py_files: List[Tuple[int, str]] = []
 
-        for file_path in files:
+        for i, file_path in enumerate(files):
             # Convert to string if Path object
             file_str = str(file_path)
 
-            # Check if file exists
-            if not Path(file_str).exists():
+            # Filter on extension first so unsupported files are never
+            # stat'ed, then skip anything that is not an existing file
+            if not file_str.endswith((".py", ".sql", ".yml", ".yaml")):
+                continue
+            if not os.path.isfile(file_str):
                 continue
 
             # Dispatch by file type
             if file_str.endswith(".py"):
-                violations.extend(self.validate_file(file_str))
+                py_files.append((i, file_str))
             elif file_str.endswith(".sql"):
-                violations.extend(self.scan_sql_file(file_str))
-            elif file_str.endswith(".yml") or file_str.endswith(".yaml"):
-                violations.extend(self.scan_yaml_file(file_str))
-
-        return violations
+                results[i] = self.scan_sql_file(file_str)
+            else:
+                results[i] = self.scan_yaml_file(file_str)
+
+        found = self._validate_python_files([p for _, p in py_files], workers)
+        for (i, _), violations in zip(py_files, found):
+            results[i] = violations
+
+        return [v for i in sorted(results) for v in results[i]]
+
+    def _validate_python_files(
+        self, paths: List[str], workers: Optional[int] = None
+    ) -> List[List[ConstitutionViolation]]:
+        """Run validate_file over paths, on a process pool for large batches."""
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        if workers > 1 and len(paths) >= _PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(
+                            _validate_file_worker,
+                            repeat(self),
+                            paths,
+                            chunksize=max(1, len(paths) // (4 * workers)),
+                        )
+                    )
+            except (OSError, BrokenProcessPool):
+                pass  # no subprocesses here: validate serially
+        return [self.validate_file(p) for p in paths]
 
     def get_active_sql_rules(self) -> List[str]:
         """Return the list of SQL rule IDs that are enabled in the constitution.
@@ -250,24 +352,32 @@ class Constitution:
         Returns:
             List of active SQL rule ID strings.
         """
-        active: List[str] = []
-        if not self.file_path.exists():
-            return active
+        try:
+            st = self.file_path.stat()
+        except OSError:
+            return []
+        # Called once per scanned .sql/.yml file: re-read only when it changed
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._sql_rules_cache is not None and self._sql_rules_cache[0] == stamp:
+            return list(self._sql_rules_cache[1])
 
+        active: List[str] = []
         content = self.file_path.read_text(encoding="utf-8")
-        for rule_id in self.SQL_RULE_IDS:
+        for rule_id, pattern in self._SQL_RULE_RES.items():
             # Rule is active if it appears as a list item anywhere in the constitution
-            if re.search(
-                rf"^\s*[-*]\s+{re.escape(rule_id)}\s*$", content, re.MULTILINE
-            ):
+            if pattern.search(content):
                 active.append(rule_id)
-        return active
+        self._sql_rules_cache = (stamp, active)
+        return list(active)
 
-    def scan_sql_file(self, file_path: str) -> List["ConstitutionViolation"]:
+    def scan_sql_file(
+        self, file_path: str, cache: Optional[object] = None
+    ) -> List["ConstitutionViolation"]:
         """Scan a .sql file for active SQL constitution rule violations.
 
         Args:
             file_path: Path to the .sql file.
+            cache: Optional sentinel.sql_constitution.SQLScanCache shared across calls.
 
         Returns:
             List of ConstitutionViolation objects.
@@ -279,7 +389,7 @@ class Constitution:
         try:
             from sentinel.sql_constitution import SQLConstitutionScanner
 
-            scanner = SQLConstitutionScanner()
+            scanner = SQLConstitutionScanner(cache)
             sql_violations = scanner.scan_file(file_path, active_rules)
             return [
                 ConstitutionViolation(
@@ -293,11 +403,50 @@ class Constitution:
         except Exception:
             return []
 
-    def scan_yaml_file(self, file_path: str) -> List["ConstitutionViolation"]:
+    def scan_sql_files(
+        self, file_paths: List[str], cache: Optional[object] = None
+    ) -> List["ConstitutionViolation"]:
+        """Scan many .sql files at once, in file order.
+
+        Uses SQLConstitutionScanner.scan_paths, which spreads large batches
+        of uncached files over a process pool.
+
+        Args:
+            file_paths: Paths to the .sql files.
+            cache: Optional sentinel.sql_constitution.SQLScanCache shared across calls.
+
+        Returns:
+            List of ConstitutionViolation objects.
+        """
+        active_rules = self.get_active_sql_rules()
+        if not active_rules or not file_paths:
+            return []
+
+        try:
+            from sentinel.sql_constitution import SQLConstitutionScanner
+
+            scanner = SQLConstitutionScanner(cache)
+            sql_violations = scanner.scan_paths(file_paths, active_rules)
+            return [
+                ConstitutionViolation(
+                    file=v.file_path,
+                    line=v.line,
+                    rule=v.rule,
+                    message=v.message,
+                )
+                for v in sql_violations
+            ]
+        except Exception:
+            return []
+
+    def scan_yaml_file(
+        self, file_path: str, cache: Optional[object] = None
+    ) -> List["ConstitutionViolation"]:
         """Scan a dbt .yml schema file for active SQL constitution rule violations.
 
         Args:
             file_path: Path to the .yml file.
+            cache: Optional sentinel.sql_constitution.SQLScanCache shared across calls.
 
         Returns:
             List of ConstitutionViolation objects.
@@ -309,7 +458,7 @@ class Constitution:
         try:
             from sentinel.sql_constitution import DBTSchemaYAMLScanner
 
-            scanner = DBTSchemaYAMLScanner()
+            scanner = DBTSchemaYAMLScanner(cache)
             yml_violations = scanner.scan_yaml(file_path, active_rules)
             return [
                 ConstitutionViolation(
@@ -333,153 +482,235 @@ class Constitution:
         Returns:
             List of violations found
         """
-        violations = []
-        file_path_obj = Path(file_path)
-
-        if not file_path_obj.exists():
-            return violations
-
         # Only validate Python files for now
         if not file_path.endswith(".py"):
-            return violations
+            return []
 
-        content = file_path_obj.read_text()
-        lines = content.split("\n")
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return []
 
-        # Check code standards
-        code_section = self.sections.get("Code Standards", ConstitutionSection("", []))
+        source = _read_source(file_path, st.st_mtime_ns, st.st_size)
+        return self.validate_source(source, file_path)
 
-        for rule in code_section.rules:
-            # Type hints check
-            if "type hint" in rule.lower() or "type annotation" in rule.lower():
-                violations.extend(self._check_type_hints(file_path, lines, rule))
+    def validate_source(
+        self, source: str, filename: str = "<memory>"
+    ) -> List[ConstitutionViolation]:
+        """
+        Validate Python source text against constitution rules
 
-            # Docstring check
-            if "docstring" in rule.lower():
-                violations.extend(self._check_docstrings(file_path, lines, rule))
+        Same checks as validate_file() without reading from disk. The test
+        coverage check still looks for test files next to `filename`.
 
-        # Check testing standards
-        testing_section = self.sections.get(
-            "Testing Standards", ConstitutionSection("", [])
+        Args:
+            source: Python source code
+            filename: Path reported in violations and used for test lookup
+
+        Returns:
+            List of violations found
+        """
+        lines = source.split("\n")
+
+        code_rules = [
+            r.lower()
+            for r in self.sections.get(
+                "Code Standards", ConstitutionSection("", [])
+            ).rules
+        ]
+        testing_rules = [
+            r.lower()
+            for r in self.sections.get(
+                "Testing Standards", ConstitutionSection("", [])
+            ).rules
+        ]
+        security_rules = [
+            r.lower()
+            for r in self.sections.get(
+                "Security Standards", ConstitutionSection("", [])
+            ).rules
+        ]
+
+        def wants_type_hints(rule: str) -> bool:
+            return "type hint" in rule or "type annotation" in rule
+
+        def wants_secrets(rule: str) -> bool:
+            return "hardcoded" in rule or "secret" in rule
+
+        # One sweep over the lines feeds every line-based check; the results
+        # are then emitted per matching rule, in section order as before
+        type_hints, docstrings, secrets = self._scan_python_lines(
+            filename,
+            lines,
+            type_hints=any(map(wants_type_hints, code_rules)),
+            docstrings=any("docstring" in r for r in code_rules),
+            secrets=any(map(wants_secrets, security_rules)),
         )
 
-        for rule in testing_section.rules:
+        violations = []
+
+        # Check code standards
+        for rule in code_rules:
+            if wants_type_hints(rule):
+                violations.extend(type_hints)
+            if "docstring" in rule:
+                violations.extend(docstrings)
+
+        # Check testing standards
+        for rule in testing_rules:
             # Test coverage check (basic heuristic)
-            if "coverage" in rule.lower() or "test" in rule.lower():
-                violations.extend(self._check_test_coverage(file_path, lines, rule))
+            if "coverage" in rule or "test" in rule:
+                violations.extend(self._check_test_coverage(filename, lines, rule))
 
         # Check security standards
-        security_section = self.sections.get(
-            "Security Standards", ConstitutionSection("", [])
-        )
-
-        for rule in security_section.rules:
-            # Check for hardcoded secrets
-            if "hardcoded" in rule.lower() or "secret" in rule.lower():
-                violations.extend(self._check_hardcoded_secrets(file_path, lines, rule))
+        for rule in security_rules:
+            if wants_secrets(rule):
+                violations.extend(secrets)
 
         return violations
 
-    def _check_type_hints(
-        self, file_path: str, lines: List[str], rule: str
-    ) -> List[ConstitutionViolation]:
+    def _scan_python_lines(
+        self,
+        file_path: str,
+        lines: List[str],
+        type_hints: bool,
+        docstrings: bool,
+        secrets: bool,
+    ) -> Tuple[
+        List[ConstitutionViolation],
+        List[ConstitutionViolation],
+        List[ConstitutionViolation],
+    ]:
         """
-        Check for functions without type hints
+        Run the line-based checks in a single pass over the source
 
-        Validates that all public functions have:
-        - Return type annotations (->)
-        - Parameter type hints (for non-self/cls parameters)
+        Type hints: public functions need a return annotation (->) and hints
+        on every parameter except self/cls/*args/**kwargs; @property is exempt.
+        Docstrings: public functions and classes need one within the next
+        three lines. Secrets: string assignments mentioning a secret keyword,
+        unless they read from the environment or are empty.
+
+        Returns:
+            (type hint, docstring, hardcoded secret) violations
         """
-        violations = []
+        hint_violations: List[ConstitutionViolation] = []
+        doc_violations: List[ConstitutionViolation] = []
+        secret_violations: List[ConstitutionViolation] = []
 
         for i, line in enumerate(lines, 1):
-            # Skip private/dunder methods
-            if re.match(r"\s*def\s+_[_\w]*\(", line):
-                continue
+            stripped = line.strip()
+            is_def = stripped.startswith("def ")
+
+            if is_def or stripped.startswith("class "):
+                # Skip private/dunder functions and private classes
+                private = bool(_PRIVATE_DEF_RE.match(line)) or (
+                    not is_def and bool(_PRIVATE_CLASS_RE.match(line))
+                )
 
-            # Check for function definition
-            if line.strip().startswith("def "):
-                # Check if it's a simple property or setter
-                if "@property" in "\n".join(lines[max(0, i - 3) : i]):
-                    continue
+                if type_hints and is_def and not private:
+                    hint_violations.extend(self._type_hint_violations(
+                        file_path, lines, i, line
+                    ))
+
+                if docstrings and not private:
+                    # Check if next non-empty line is a docstring
+                    next_lines = lines[i : i + 3] if i < len(lines) else []
+                    if not any('"""' in l or "'''" in l for l in next_lines):
+                        entity_type = "Function" if is_def else "Class"
+                        doc_violations.append(
+                            ConstitutionViolation(
+                                file=file_path,
+                                line=i,
+                                rule="DOCSTRINGS_REQUIRED",
+                                message=f"{entity_type} missing docstring",
+                            )
+                        )
 
-                # Check for return type hint
-                if "->" not in line:
-                    violations.append(
+            if secrets:
+                keyword = self._secret_keyword(line, stripped)
+                if keyword:
+                    secret_violations.append(
                         ConstitutionViolation(
                             file=file_path,
                             line=i,
-                            rule="TYPE_HINTS_REQUIRED",
-                            message="Function missing return type hint",
+                            rule="NO_HARDCODED_SECRETS",
+                            message=f"Possible hardcoded secret: '{keyword}' assignment detected",
                         )
                     )
 
-                # Check for parameter type hints
-                # Extract function signature
-                func_match = re.search(r"def\s+\w+\s*\((.*?)\)", line)
-                if func_match:
-                    params = func_match.group(1).strip()
-                    # Skip if no parameters or only self/cls
-                    if params and params not in ["self", "cls"]:
-                        # Check if parameters have type hints
-                        param_list = [p.strip() for p in params.split(",")]
-                        for param in param_list:
-                            # Skip self, cls, *args, **kwargs
-                            if param in ["self", "cls"] or param.startswith("*"):
-                                continue
-                            # Check if parameter has type hint (:)
-                            if ":" not in param:
-                                violations.append(
-                                    ConstitutionViolation(
-                                        file=file_path,
-                                        line=i,
-                                        rule="TYPE_HINTS_REQUIRED",
-                                        message=f"Parameter '{param}' missing type hint",
-                                    )
-                                )
-
-        return violations
+        return hint_violations, doc_violations, secret_violations
 
-    def _check_docstrings(
-        self, file_path: str, lines: List[str], rule: str
+    @staticmethod
+    def _type_hint_violations(
+        file_path: str, lines: List[str], i: int, line: str
     ) -> List[ConstitutionViolation]:
-        """
-        Check for functions/classes without docstrings
+        """Type hint violations for the public `def` on line i (1-based)"""
+        # Check if it's a simple property or setter
+        if "@property" in "\n".join(lines[max(0, i - 3) : i]):
+            return []
 
-        Validates that all public functions and classes have docstrings.
-        Skips private methods (starting with _).
-        """
         violations = []
 
-        for i, line in enumerate(lines, 1):
-            # Skip private methods
-            if re.match(r"\s*def\s+_[_\w]*\(", line):
-                continue
-
-            # Skip private classes
-            if re.match(r"\s*class\s+_[_\w]*", line):
-                continue
-
-            if line.strip().startswith("def ") or line.strip().startswith("class "):
-                # Check if next non-empty line is a docstring
-                next_lines = lines[i : i + 3] if i < len(lines) else []
-                has_docstring = any('"""' in l or "'''" in l for l in next_lines)
+        # Check for return type hint
+        if "->" not in line:
+            violations.append(
+                ConstitutionViolation(
+                    file=file_path,
+                    line=i,
+                    rule="TYPE_HINTS_REQUIRED",
+                    message="Function missing return type hint",
+                )
+            )
 
-                if not has_docstring:
-                    entity_type = (
-                        "Function" if line.strip().startswith("def ") else "Class"
-                    )
-                    violations.append(
-                        ConstitutionViolation(
-                            file=file_path,
-                            line=i,
-                            rule="DOCSTRINGS_REQUIRED",
-                            message=f"{entity_type} missing docstring",
+        # Check for parameter type hints
+        # Extract function signature
+        func_match = _DEF_PARAMS_RE.search(line)
+        if func_match:
+            params = func_match.group(1).strip()
+            # Skip if no parameters or only self/cls
+            if params and params not in ["self", "cls"]:
+                # Check if parameters have type hints
+                param_list = [p.strip() for p in params.split(",")]
+                for param in param_list:
+                    # Skip self, cls, *args, **kwargs
+                    if param in ["self", "cls"] or param.startswith("*"):
+                        continue
+                    # Check if parameter has type hint (:)
+                    if ":" not in param:
+                        violations.append(
+                            ConstitutionViolation(
+                                file=file_path,
+                                line=i,
+                                rule="TYPE_HINTS_REQUIRED",
+                                message=f"Parameter '{param}' missing type hint",
+                            )
                         )
-                    )
 
         return violations
 
+    @staticmethod
+    def _secret_keyword(line: str, stripped: str) -> Optional[str]:
+        """First secret keyword in a string assignment on this line, if unsafe"""
+        # Skip comments and docstrings
+        if stripped.startswith("#"):
+            return None
+        if stripped.startswith('"""') or stripped.startswith("'''"):
+            return None
+
+        # Only assignments with a string literal can hardcode a secret
+        if "=" not in line or ('"' not in line and "'" not in line):
+            return None
+
+        # Exclude common safe patterns
+        if any(pattern in line for pattern in _SECRET_SAFE_PATTERNS):
+            return None
+
+        line_lower = line.lower()
+        for keyword in _SECRET_KEYWORDS:
+            if keyword in line_lower:
+                return keyword
+        return None
+
     def _check_test_coverage(
         self, file_path: str, lines: List[str], rule: str
     ) -> List[ConstitutionViolation]:
@@ -549,80 +780,6 @@ class Constitution:
 
         return violations
 
-    def _check_hardcoded_secrets(
-        self, file_path: str, lines: List[str], rule: str
-    ) -> List[ConstitutionViolation]:
-        """
-        Check for hardcoded secrets in code
-
-        Detects potential hardcoded credentials, API keys, passwords, and tokens.
-        Excludes safe patterns like os.getenv, environment variables, and empty values.
-        """
-        violations = []
-
-        # Common secret keywords to detect
-        secret_keywords = [
-            "password",
-            "passwd",
-            "pwd",
-            "api_key",
-            "apikey",
-            "api-key",
-            "secret",
-            "secret_key",
-            "token",
-            "auth_token",
-            "access_token",
-            "private_key",
-            "privatekey",
-            "client_secret",
-            "client-secret",
-        ]
-
-        for i, line in enumerate(lines, 1):
-            # Skip comments and docstrings
-            stripped_line = line.strip()
-            if stripped_line.startswith("#"):
-                continue
-            if stripped_line.startswith('"""') or stripped_line.startswith("'''"):
-                continue
-
-            line_lower = line.lower()
-
-            for keyword in secret_keywords:
-                if keyword in line_lower:
-                    # Check if it's an assignment with a string literal
-                    if "=" in line and ('"' in line or "'" in line):
-                        # Exclude common safe patterns
-                        safe_patterns = [
-                            "os.getenv",
-                            "os.environ",
-                            "environ.get",
-                            "config.get",
-                            "None",
-                            '""',
-                            "''",
-                            "input(",
-                            "getpass(",
-                            "default=",
-                            "help=",  # argparse defaults
-                        ]
-
-                        is_safe = any(pattern in line for pattern in safe_patterns)
-
-                        if not is_safe:
-                            violations.append(
-                                ConstitutionViolation(
-                                    file=file_path,
-                                    line=i,
-                                    rule="NO_HARDCODED_SECRETS",
-                                    message=f"Possible hardcoded secret: '{keyword}' assignment detected",
-                                )
-                            )
-                            break  # Only report once per line
-
-        return violations
-
     def validate_quality(self) -> Tuple[int, List[str]]:
         """
         Validate constitution quality and completeness
@@ -681,6 +838,13 @@ class Constitution:
         return score, recommendations
 
 
+def _validate_file_worker(
+    constitution: Constitution, file_path: str
+) -> List[ConstitutionViolation]:
+    """Process-pool entry point for Constitution.validate_file."""
+    return constitution.validate_file(file_path)
+
+
 def main():
     """Test/demo the Constitution parser"""
     import sys
@@ -62,6 +62,12 @@ class TaskOrchestrator:
         re.IGNORECASE,
     )
 
+    # Per-task metadata markers. The Constitution tag may sit on any line of
+    # the task block and is split with plain str ops; SENTINEL_MARK_RE is the
+    # author's `[S]` test-point marker, compiled once for _process_task.
+    CONSTITUTION_TAG = "- **Constitution**: "
+    SENTINEL_MARK_RE = re.compile(r"\s*\[S\]")
+
     def __init__(
         self,
         tasks_file: str = "tasks.md",
@@ -115,6 +121,10 @@ class TaskOrchestrator:
             print(f"❌ Error reading {self.tasks_file}: {e}")
             sys.exit(1)
 
+        self.parse_tasks_from_string(content)
+
+    def parse_tasks_from_string(self, content: str) -> None:
+        """Parse tasks.md-formatted text into Task objects (no file I/O)"""
         lines = content.split("\n")
 
         task_id = 1
@@ -190,9 +200,9 @@ class TaskOrchestrator:
 
         # [S] marker: the task-author denotes a real+compilable sentinel test-point
         # (predicate B). Strip it so the instruction passed downstream stays clean.
-        sentinel_point = bool(re.search(r"\[S\]", first_line))
+        sentinel_point = "[S]" in first_line
         if sentinel_point:
-            description = re.sub(r"\s*\[S\]", "", description, count=1)
+            description = self.SENTINEL_MARK_RE.sub("", description, count=1)
 
         # Full task block — used for dep extraction so sub-bullets and
         # second-line "Dependencies:" / "Requires:" hints are honored.
@@ -206,7 +216,7 @@ class TaskOrchestrator:
         # collision safety — it may be scheduled in parallel with a colliding
         # task and race-edit the same file. Surface it loudly rather than
         # silently treating the task as conflict-free.
-        if not file_locks and re.search(self._ACTION_VERBS, description, re.IGNORECASE):
+        if not file_locks and self._ACTION_VERBS_RE.search(description):
             snippet = description[:70] + ("…" if len(description) > 70 else "")
             print(
                 f"⚠️  T{task_id:03d}: names no detectable file — file-lock safety "
@@ -223,13 +233,11 @@ class TaskOrchestrator:
 
         # Extract constitution rules from subsequent lines
         constitution_rules = []
-        full_text = "\n".join(task_lines)
-        constitution_match = re.search(
-            r"- \*\*Constitution\*\*: (.+)", full_text, re.MULTILINE
-        )
-        if constitution_match:
-            rules_str = constitution_match.group(1)
-            constitution_rules = [r.strip() for r in rules_str.split(",")]
+        for line in task_lines:
+            _, tag, rules_str = line.partition(self.CONSTITUTION_TAG)
+            if tag and rules_str:
+                constitution_rules = [r.strip() for r in rules_str.split(",")]
+                break
 
         task = Task(
             id=f"T{task_id:03d}",
@@ -270,6 +278,7 @@ class TaskOrchestrator:
         r"edit|delete|remove|rename|move|wire|integrate|patch|extend|"
         r"scaffold|introduce|register|replace)\b"
     )
+    _ACTION_VERBS_RE = re.compile(_ACTION_VERBS, re.IGNORECASE)
 
     def _extract_file_references(self, description: str) -> List[str]:
         """Extract file paths from a task description.
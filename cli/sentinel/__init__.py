@@ -95,6 +95,9 @@ class SentinelResult:
     tier1_result: TierResult = field(default_factory=TierResult)
     tier2_result: TierResult = field(default_factory=TierResult)
     placeholder_violations: list = field(default_factory=list)
+    # True when the scan stopped at the first violation (fail_on_detect
+    # without full_report): placeholder_violations is not the full count
+    placeholder_scan_stopped_early: bool = False
     files_changed: list[dict] = field(default_factory=list)
     interface_reports: list = field(default_factory=list)
     cascade_triggered: bool = False
@@ -194,6 +197,7 @@ class ManifestData:
     tier1_result: TierResult = field(default_factory=TierResult)
     tier2_result: TierResult = field(default_factory=TierResult)
     placeholder_violations: list = field(default_factory=list)
+    placeholder_scan_stopped_early: bool = False
     files_changed: list[dict] = field(
         default_factory=list
     )  # [{path, lines_added, lines_removed}]
@@ -61,11 +61,15 @@ class InterfaceDiff:
     def compare(
         self,
         file_path: Path,
-        pre_content: str,
-        post_content: str,
+        pre_content: str | bytes,
+        post_content: str | bytes,
     ) -> "InterfaceChangeReport":
         """Compare public API between pre-run and post-run file content.
 
+        Content may be passed as raw bytes (e.g. a git blob or read_bytes()).
+        Python source is handed to ast.parse undecoded, which honours PEP 263
+        encoding cookies; other languages are decoded only when needed.
+
         Args:
             file_path: Path to the file (used only for extension detection).
             pre_content: File content before the micro-agent run.
@@ -95,15 +99,25 @@ class InterfaceDiff:
             )
         elif language in ("typescript", "javascript"):
             return self._compare_ts_js(
-                str(file_path), language, pre_content, post_content, empty_report
+                str(file_path),
+                language,
+                _as_text(pre_content),
+                _as_text(post_content),
+                empty_report,
             )
         elif language == "rust":
             return self._compare_rust(
-                str(file_path), pre_content, post_content, empty_report
+                str(file_path),
+                _as_text(pre_content),
+                _as_text(post_content),
+                empty_report,
             )
         elif language == "sql":
             return self._compare_sql(
-                str(file_path), pre_content, post_content, empty_report
+                str(file_path),
+                _as_text(pre_content),
+                _as_text(post_content),
+                empty_report,
             )
 
         return empty_report
@@ -115,8 +129,8 @@ class InterfaceDiff:
     def _compare_python(
         self,
         file_path: str,
-        pre: str,
-        post: str,
+        pre: str | bytes,
+        post: str | bytes,
         base: "InterfaceChangeReport",
     ) -> "InterfaceChangeReport":
         """Python AST-based comparison."""
@@ -300,12 +314,28 @@ class InterfaceDiff:
             return ""
 
 
+# Extensions compare() has a language branch for. Anything else (.md, .json,
+# .yml, ...) always yields an empty report, so callers can skip reading it.
+DIFFABLE_EXTENSIONS: frozenset[str] = frozenset(
+    ext
+    for ext, language in InterfaceDiff._EXT_MAP.items()
+    if language in ("python", "typescript", "javascript", "rust", "sql")
+)
+
+
 # ---------------------------------------------------------------------------
 # Symbol extraction helpers
 # ---------------------------------------------------------------------------
 
 
-def _extract_python_symbols(content: str) -> dict:
+def _as_text(content: str | bytes) -> str:
+    """Decode bytes content for the regex/DDL extractors; str passes through."""
+    if isinstance(content, bytes):
+        return content.decode("utf-8", errors="replace")
+    return content
+
+
+def _extract_python_symbols(content: str | bytes) -> dict:
     """Parse public functions and classes from Python source via AST."""
     tree = ast.parse(content)
     functions: dict[str, str] = {}
@@ -104,6 +104,7 @@ class ManifestWriter:
                 }
                 for v in data.placeholder_violations
             ],
+            "placeholder_scan_stopped_early": data.placeholder_scan_stopped_early,
             "files_changed": data.files_changed,
             "interface_changes": data.interface_changes,
             "tests_fixed": data.tests_fixed,
@@ -255,7 +256,12 @@ class ManifestWriter:
 
         # Placeholder violations
         if data.placeholder_violations:
-            lines.append("### Placeholder Violations")
+            if data.placeholder_scan_stopped_early:
+                lines.append(
+                    "### Placeholder Violations (first violation — scan stopped early)"
+                )
+            else:
+                lines.append("### Placeholder Violations")
             for v in data.placeholder_violations:
                 lines.append(
                     f"- `{v.file_path}:{v.line_number}` — `{v.matched_pattern}`"
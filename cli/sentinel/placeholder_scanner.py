@@ -13,7 +13,7 @@ import fnmatch
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Mapping
 
 if TYPE_CHECKING:
     from . import PlaceholderViolation, SentinelConfig
@@ -96,7 +96,12 @@ class PlaceholderScanner:
         self._pattern_strings = all_patterns
         self._exclude_paths = ALWAYS_EXCLUDE + exclude_paths
 
-    def scan(self, files: list[Path]) -> list[PlaceholderViolation]:
+    def scan(
+        self,
+        files: list[Path],
+        contents: Mapping[Path, bytes] | None = None,
+        stop_on_first: bool = False,
+    ) -> list[PlaceholderViolation]:
         """Scan the given files for placeholder violations.
 
         Rules:
@@ -107,6 +112,10 @@ class PlaceholderScanner:
 
         Args:
             files: File paths to scan.
+            contents: Optional pre-read file bytes keyed by path. Files found
+                here are not re-read from disk.
+            stop_on_first: Return as soon as one violation is found (for
+                callers that only need to know the files are not clean).
 
         Returns:
             List of PlaceholderViolation objects (empty = clean).
@@ -118,13 +127,15 @@ class PlaceholderScanner:
         for file_path in files:
             if self.is_excluded(file_path):
                 continue
-            if not file_path.exists() or not file_path.is_file():
-                continue
-
-            try:
-                text = file_path.read_text(encoding="utf-8", errors="replace")
-            except OSError:
-                continue
+            if contents is not None and file_path in contents:
+                text = contents[file_path].decode("utf-8", errors="replace")
+            else:
+                if not file_path.exists() or not file_path.is_file():
+                    continue
+                try:
+                    text = file_path.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
 
             lines = text.splitlines()
             for line_idx, line in enumerate(lines):
@@ -147,6 +158,8 @@ class PlaceholderScanner:
                                 context_lines=context,
                             )
                         )
+                        if stop_on_first:
+                            return violations
                         break  # One violation per line (first match wins)
 
         return violations
@@ -200,7 +213,9 @@ class PlaceholderScanner:
         return cls(patterns=extra_patterns, exclude_paths=extra_excludes)
 
 
-def scan_sql_file(path: str) -> list[SQLPlaceholderViolation]:
+def scan_sql_file(
+    path: str, content: str | None = None
+) -> list[SQLPlaceholderViolation]:
     """Scan a SQL file for SQL-specific placeholder patterns.
 
     Unlike the general PlaceholderScanner, this function is SQL-aware
@@ -208,18 +223,20 @@ def scan_sql_file(path: str) -> list[SQLPlaceholderViolation]:
 
     Args:
         path: Path to the .sql file to scan.
+        content: Optional already-read file text; skips the disk read.
 
     Returns:
         List of SQLPlaceholderViolation objects (empty = clean).
     """
-    file_path = Path(path)
-    if not file_path.exists():
-        return []
-
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return []
+    if content is None:
+        file_path = Path(path)
+        if not file_path.exists():
+            return []
+
+        try:
+            content = file_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return []
 
     violations: list[SQLPlaceholderViolation] = []
 
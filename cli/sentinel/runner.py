@@ -14,12 +14,61 @@ the complete pipeline:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
 import subprocess
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Collection, Iterable
+
+from . import InterfaceChangeReport, ManifestData, SentinelResult, TierResult
+from .cascade_analyzer import CascadeAnalyzer, ChangeRadiusEvaluator, WaveHaltError
+from .interface_diff import DIFFABLE_EXTENSIONS, InterfaceDiff
+from .manifest_writer import ManifestWriter
+from .placeholder_scanner import PlaceholderScanner
+from .placeholder_scanner import scan_sql_file as sql_placeholder_scan
+from .tier_runner import TierRunner, sentinel_health_check
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup — stdlib json is the fallback
+    _orjson = None
+
+try:
+    import pygit2 as _pygit2
+except ImportError:  # optional speedup — the git CLI is the fallback
+    _pygit2 = None
 
 if TYPE_CHECKING:
-    from . import SentinelConfig, SentinelResult
+    from . import SentinelConfig
+
+
+def _has_extension(lock: object) -> bool:
+    """True when a file_locks entry names a file with an extension.
+
+    Replaces a bare `"." in lock` test, which also let through directories
+    with dots ("a.b/c") and extensionless dotfiles/dirs (".git").
+    """
+    return bool(lock) and bool(os.path.splitext(str(lock))[1])
+
+
+def _print_lines(lines: Iterable[str]) -> None:
+    """Print many report lines with a single write instead of one per line."""
+    text = "\n".join(lines)
+    if text:
+        print(text)
+
+
+def _load_json_file(path: Path):
+    """Parse a JSON file, via orjson when installed (decodes + parses in C)."""
+    if _orjson is not None:
+        return _orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
 
 
 def _criterion_from_tasksmd(task: dict, project_root: Path) -> str:
@@ -29,11 +78,8 @@ def _criterion_from_tasksmd(task: dict, project_root: Path) -> str:
     the generated test must encode. Matches the task's original id(s) on a
     `- [ ]`/`- [x]` line, then collects the following indented `> ...` lines.
     """
-    import re as _re
-    import sys as _sys
-
     try:
-        _sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
         from resolver import resolve_tasks_file
 
         tf, _ = resolve_tasks_file()
@@ -45,7 +91,7 @@ def _criterion_from_tasksmd(task: dict, project_root: Path) -> str:
     tid = str(task.get("task_id", "")).replace("SENTINEL-", "")
     if tid:
         ids.add(tid)
-    m = _re.match(r"\s*(T\d+)", str(task.get("instruction", "")))
+    m = re.match(r"\s*(T\d+)", str(task.get("instruction", "")))
     if m:
         ids.add(m.group(1))
     for dep in task.get("dependencies", []) or []:
@@ -56,9 +102,9 @@ def _criterion_from_tasksmd(task: dict, project_root: Path) -> str:
     lines = Path(tf).read_text(encoding="utf-8", errors="ignore").split("\n")
     crits: list[str] = []
     for i, line in enumerate(lines):
-        if not _re.match(r"\s*- \[[ xX]\]", line):
+        if not re.match(r"\s*- \[[ xX]\]", line):
             continue
-        if not any(_re.search(rf"\b{_re.escape(i_)}\b", line) for i_ in ids):
+        if not any(re.search(rf"\b{re.escape(i_)}\b", line) for i_ in ids):
             continue
         for j in range(i + 1, min(i + 8, len(lines))):
             s = lines[j].strip()
@@ -69,6 +115,59 @@ def _criterion_from_tasksmd(task: dict, project_root: Path) -> str:
     return "  ".join(crits)
 
 
+# Overrides for the sentinel's read-only git queries: skip optional index
+# locks/refreshes (GIT_OPTIONAL_LOCKS), avoid locale setup, and never block on
+# a credential prompt. Merged over the live os.environ on each call, so later
+# PATH / HOME / GIT_DIR changes in the host process still reach git.
+_GIT_ENV_OVERRIDES: dict[str, str] = {
+    "GIT_OPTIONAL_LOCKS": "0",
+    "LC_ALL": "C",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+# Upper bound on threads used to read + interface-diff files in the cascade phase
+_MAX_DIFF_WORKERS = 8
+
+# (path, mtime_ns, size, HEAD blob digest) -> InterfaceChangeReport.
+# SentinelRunner is built per task, so the memo lives at module level to let
+# tasks in the same wave that lock the same file reuse its diff. Oldest entries
+# are evicted past _IFACE_CACHE_MAX; the lock covers the cascade thread pool.
+_IFACE_CACHE: dict[tuple, InterfaceChangeReport] = {}
+_IFACE_CACHE_MAX = 256
+_IFACE_CACHE_LOCK = threading.Lock()
+
+# Files whose presence/content decides the auto-detected test command. Their
+# mtimes form the cache key in _TEST_CMD_CACHE so an edit invalidates the entry.
+_TEST_MARKERS: tuple[str, ...] = (
+    "pyproject.toml",
+    "setup.py",
+    "package.json",
+    "Cargo.toml",
+)
+
+# resolved working_dir -> (marker mtimes, detected command). A wave constructs
+# one SentinelRunner per task against the same project root, so without this
+# every task re-stats the markers and re-parses package.json.
+_TEST_CMD_CACHE: dict[str, tuple[tuple, str | None]] = {}
+
+
+def _scan_markers(wdir: Path) -> dict[str, int]:
+    """Return {marker name: mtime_ns} for the _TEST_MARKERS files present in wdir.
+
+    One directory listing replaces a stat() probe per marker; only markers that
+    actually exist are stat'ed for their mtime.
+    """
+    markers: dict[str, int] = {}
+    try:
+        with os.scandir(wdir) as entries:
+            for entry in entries:
+                if entry.name in _TEST_MARKERS and entry.is_file():
+                    markers[entry.name] = entry.stat().st_mtime_ns
+    except OSError:
+        pass
+    return markers
+
+
 def detect_test_command(working_dir: Path, config: object = None) -> str | None:
     """Resolve the test command for a sentinel run.
 
@@ -77,6 +176,9 @@ def detect_test_command(working_dir: Path, config: object = None) -> str | None:
       2. Auto-detect from project markers (pyproject.toml, package.json, etc.)
       3. None if nothing found
 
+    Auto-detect results are cached per resolved working_dir and reused until
+    one of the marker files changes (mtime) or appears/disappears.
+
     Args:
         working_dir: Project root directory to inspect.
         config: Optional SentinelConfig with sentinel_test_command override.
@@ -89,25 +191,34 @@ def detect_test_command(working_dir: Path, config: object = None) -> str | None:
     if override:
         return override
 
-    # 2. Auto-detect
+    # 2. Auto-detect (cached)
     wdir = Path(working_dir)
+    key = str(wdir.resolve())
+    markers = _scan_markers(wdir)
+    mtimes = tuple(markers.get(name) for name in _TEST_MARKERS)
+    cached = _TEST_CMD_CACHE.get(key)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+
+    test_cmd = _autodetect_test_command(wdir, markers)
+    _TEST_CMD_CACHE[key] = (mtimes, test_cmd)
+    return test_cmd
+
 
+def _autodetect_test_command(wdir: Path, markers: Collection[str]) -> str | None:
+    """Return the test command matching the project markers present in wdir."""
     # Python
-    if (wdir / "pyproject.toml").exists() or (wdir / "setup.py").exists():
+    if "pyproject.toml" in markers or "setup.py" in markers:
         return "python -m pytest"
 
     # JavaScript / TypeScript
-    pkg_json = wdir / "package.json"
-    if pkg_json.exists():
+    if "package.json" in markers:
         try:
-            import json
-
-            pkg = json.loads(pkg_json.read_text(encoding="utf-8"))
-            deps = {
-                **pkg.get("dependencies", {}),
-                **pkg.get("devDependencies", {}),
-            }
-            if "vitest" in deps:
+            pkg = _load_json_file(wdir / "package.json")
+            # Probe both maps directly rather than merging them into a new dict
+            deps = pkg.get("dependencies") or {}
+            dev_deps = pkg.get("devDependencies") or {}
+            if "vitest" in deps or "vitest" in dev_deps:
                 return "npx vitest run"
             scripts = pkg.get("scripts", {})
             if "test" in scripts:
@@ -116,7 +227,7 @@ def detect_test_command(working_dir: Path, config: object = None) -> str | None:
             return "npm test"
 
     # Rust
-    if (wdir / "Cargo.toml").exists():
+    if "Cargo.toml" in markers:
         return "cargo test"
 
     return None
@@ -134,6 +245,90 @@ class SentinelRunner:
         """
         self._config = config
         self._project_root = Path(project_root)
+        self._repo = self._open_repo()
+        # path -> (mtime_ns, size, bytes): one disk read per file shared by
+        # the placeholder scans and the cascade diff (see _read_file)
+        self._file_cache: dict[Path, tuple[int, int, bytes]] = {}
+        # path -> project-relative string, shared by cascade + manifest phases
+        self._rel_cache: dict[Path, str] = {}
+        # Test command for this project root; resolved on first run() and
+        # reused by later runs (see _test_command)
+        self._test_cmd: str | None = None
+        self._test_cmd_resolved = False
+
+    def _test_command(self) -> str | None:
+        """Return the test command for this runner's project root (resolved once).
+
+        project_root and config are fixed for the runner's lifetime, so the
+        result cannot change between run() calls.
+        """
+        if not self._test_cmd_resolved:
+            self._test_cmd = detect_test_command(self._project_root, self._config)
+            self._test_cmd_resolved = True
+        return self._test_cmd
+
+    def _rel_path(self, path: Path) -> str:
+        """Return path relative to the project root as a string (memoized).
+
+        Raises:
+            ValueError: If an absolute path lies outside the project root.
+        """
+        rel = self._rel_cache.get(path)
+        if rel is None:
+            rel = (
+                str(path.relative_to(self._project_root))
+                if path.is_absolute()
+                else str(path)
+            )
+            self._rel_cache[path] = rel
+        return rel
+
+    def _read_file(self, path: Path) -> bytes:
+        """Return path's bytes, reusing the last read while its stat is unchanged.
+
+        The tier loop may rewrite files between the placeholder scan and the
+        cascade diff; a changed mtime/size forces a fresh read.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
+        st = path.stat()
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        data = path.read_bytes()
+        self._file_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    def _read_files(self, files: list[Path]) -> dict[Path, bytes]:
+        """Read every existing regular file in files via _read_file."""
+        contents: dict[Path, bytes] = {}
+        for f in files:
+            try:
+                if f.is_file():
+                    contents[f] = self._read_file(f)
+            except OSError:
+                continue
+        return contents
+
+    def _open_repo(self):
+        """Open the enclosing git repo in-process via pygit2, or None.
+
+        None (pygit2 not installed, not a repo, unborn HEAD) routes git lookups
+        through the git CLI instead.
+        """
+        if _pygit2 is None:
+            return None
+        try:
+            repo_path = _pygit2.discover_repository(str(self._project_root))
+            if repo_path is None:
+                return None
+            repo = _pygit2.Repository(repo_path)
+            if repo.is_bare or repo.head_is_unborn:
+                return None
+            return repo
+        except Exception:
+            return None
 
     def run(self, task: dict) -> "SentinelResult":
         """Execute the full sentinel pipeline for the given task.
@@ -153,14 +348,18 @@ class SentinelRunner:
         Returns:
             SentinelResult with result, should_halt_wave, and pipeline data.
         """
-        from . import SentinelResult, TierResult
-
         task_id = task.get("task_id", "UNKNOWN")
         sentinel_id = f"SENTINEL-{task_id}"
         file_locks = task.get("file_locks", [])
 
-        # Resolve files to scan / diff
-        files = [self._project_root / f for f in file_locks if f and "." in f]
+        # Resolve files to scan / diff. Deduplicate (order-preserving) so a path
+        # locked twice — or spelled "./a.py" and "a.py" — is only scanned,
+        # diffed and git-queried once in every downstream phase.
+        files = list(
+            dict.fromkeys(
+                self._project_root / f for f in file_locks if _has_extension(f)
+            )
+        )
 
         result_obj = SentinelResult(
             task_id=task_id,
@@ -175,27 +374,34 @@ class SentinelRunner:
         # Phase 1 (US2): Placeholder scan
         # ------------------------------------------------------------------
         try:
-            from .placeholder_scanner import PlaceholderScanner
-
             scanner = PlaceholderScanner.from_config(self._config)
-            violations = scanner.scan(files)
-            result_obj.placeholder_violations = violations
-
             fail_on_detect = getattr(
                 self._config, "sentinel_placeholder_fail_on_detect", True
             )
+            # One violation is enough to FAIL; enumerate all only on request
+            full_report = (
+                getattr(self._config, "sentinel_placeholder_full_report", False)
+                is True
+            )
+            stop_on_first = bool(fail_on_detect) and not full_report
+            contents = self._read_files(files)
+            violations = scanner.scan(files, contents, stop_on_first=stop_on_first)
+            result_obj.placeholder_violations = violations
+            result_obj.placeholder_scan_stopped_early = bool(violations) and stop_on_first
             if violations and fail_on_detect:
-                print(
-                    f"      🚫 Sentinel: {len(violations)} placeholder violation(s) detected"
+                if result_obj.placeholder_scan_stopped_early:
+                    found = "first placeholder violation (scan stopped early)"
+                else:
+                    found = f"{len(violations)} placeholder violation(s)"
+                print(f"      🚫 Sentinel: {found} detected")
+                _print_lines(
+                    f"         {v.file_path}:{v.line_number} — {v.matched_pattern}"
+                    for v in violations
                 )
-                for v in violations:
-                    print(
-                        f"         {v.file_path}:{v.line_number} — {v.matched_pattern}"
-                    )
                 result_obj.result = "FAIL"
                 result_obj.should_halt_wave = True
                 result_obj.error_message = (
-                    f"{len(violations)} placeholder violation(s) found in production code. "
+                    f"{found[0].upper()}{found[1:]} found in production code. "
                     "Fix before wave checkpoint."
                 )
                 self._safe_write_manifest(result_obj, files)
@@ -220,25 +426,38 @@ class SentinelRunner:
                 # matches how wave_executor.py imports its siblings.
                 from constitution_parser import Constitution
 
+                from .sql_constitution import SQLScanCache
+
                 constitution_path = (
                     self._project_root / "memory-bank" / "shared" / ".constitution.md"
                 )
                 if constitution_path.exists():
                     constitution = Constitution(str(constitution_path))
-                    sql_violations: list = []
-                    for f in sql_files:
-                        if f.suffix == ".sql":
-                            sql_violations.extend(constitution.scan_sql_file(str(f)))
-                        elif f.suffix in (".yml", ".yaml"):
-                            sql_violations.extend(constitution.scan_yaml_file(str(f)))
+                    # Unchanged files are re-scanned at every task checkpoint;
+                    # the on-disk cache turns those into a hash lookup.
+                    scan_cache = SQLScanCache(self._project_root / SQLScanCache.DB_REL)
+                    try:
+                        # .sql files go through the batch scan (process pool
+                        # for large batches); dbt .yml files one at a time
+                        sql_violations = constitution.scan_sql_files(
+                            [str(f) for f in sql_files if f.suffix == ".sql"],
+                            scan_cache,
+                        )
+                        for f in sql_files:
+                            if f.suffix in (".yml", ".yaml"):
+                                sql_violations.extend(
+                                    constitution.scan_yaml_file(str(f), scan_cache)
+                                )
+                    finally:
+                        scan_cache.close()
                     if sql_violations:
                         print(
                             f"      🚫 Sentinel: {len(sql_violations)} SQL constitution violation(s)"
                         )
-                        for v in sql_violations:
-                            print(
-                                f"         {v.file}:{v.line} [{v.rule}] — {v.message}"
-                            )
+                        _print_lines(
+                            f"         {v.file}:{v.line} [{v.rule}] — {v.message}"
+                            for v in sql_violations
+                        )
                         result_obj.result = "FAIL"
                         result_obj.should_halt_wave = True
                         result_obj.error_message = (
@@ -256,18 +475,22 @@ class SentinelRunner:
         sql_files_for_placeholder = [f for f in files if f.suffix == ".sql"]
         if sql_files_for_placeholder:
             try:
-                from .placeholder_scanner import scan_sql_file as sql_placeholder_scan
-
                 for sql_f in sql_files_for_placeholder:
-                    sql_ph_violations = sql_placeholder_scan(str(sql_f))
+                    try:
+                        sql_text = self._read_file(sql_f).decode(
+                            "utf-8", errors="replace"
+                        )
+                    except OSError:
+                        continue
+                    sql_ph_violations = sql_placeholder_scan(str(sql_f), sql_text)
                     if sql_ph_violations:
                         print(
                             f"      🚫 Sentinel: {len(sql_ph_violations)} SQL placeholder(s) in {sql_f.name}"
                         )
-                        for v in sql_ph_violations:
-                            print(
-                                f"         {v.file_path}:{v.line_number} [{v.pattern_type}] — {v.matched_text}"
-                            )
+                        _print_lines(
+                            f"         {v.file_path}:{v.line_number} [{v.pattern_type}] — {v.matched_text}"
+                            for v in sql_ph_violations
+                        )
                         result_obj.result = "FAIL"
                         result_obj.should_halt_wave = True
                         result_obj.error_message = "SQL placeholder code detected. Remove stubs before checkpoint."
@@ -293,7 +516,7 @@ class SentinelRunner:
             self._safe_write_manifest(result_obj, files)
             return result_obj
 
-        test_cmd = detect_test_command(self._project_root, self._config)
+        test_cmd = self._test_command()
         if not test_cmd:
             print(
                 f"      ℹ️  Sentinel SKIP: No test command found for {task_id} "
@@ -309,120 +532,124 @@ class SentinelRunner:
         # Phase 2b: Provider health check — warn and skip if no tier usable
         # ------------------------------------------------------------------
         try:
-            from .tier_runner import sentinel_health_check
-
             health = sentinel_health_check(self._config)
             if not health["any_tier_available"]:
                 print(f"      ⚠️  Sentinel SKIP: No providers available for {task_id}")
-                for w in health["warnings"]:
-                    print(f"         ❌ {w}")
+                _print_lines(f"         ❌ {w}" for w in health["warnings"])
                 print("      ℹ️  Fix provider config then re-run — skipping test loop")
                 result_obj.result = "SKIP"
                 self._safe_write_manifest(result_obj, files)
                 return result_obj  # SKIP, not FAIL — config issue not code issue
             if health["warnings"]:
-                for w in health["warnings"]:
-                    print(f"      ⚠️  {w}")
+                _print_lines(f"      ⚠️  {w}" for w in health["warnings"])
         except Exception as exc:
             print(f"      ⚠️  Provider health check error: {exc}")
 
-        # ------------------------------------------------------------------
-        # Phase 3 (US1): Tiered micro-agent test loop
-        # ------------------------------------------------------------------
+        # Cascade inputs that the tier loop cannot change (HEAD blobs, the
+        # execution plan) are fetched in the background while Phase 3 runs.
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
         try:
-            from .tier_runner import TierRunner
+            prefetch = prefetch_pool.submit(self._prefetch_cascade_inputs, files)
 
-            runner = TierRunner(self._config)
+            # ------------------------------------------------------------------
+            # Phase 3 (US1): Tiered micro-agent test loop
+            # ------------------------------------------------------------------
+            try:
+                runner = TierRunner(self._config)
 
-            objective = task.get(
-                "instruction", f"Verify task {task_id} output passes tests"
-            )
+                objective = task.get(
+                    "instruction", f"Verify task {task_id} output passes tests"
+                )
 
-            # The file(s) MUST be handed to ma-loop (PRD maloop_unification U1) —
-            # without a concrete target it authors junk into the tree. file_locks
-            # carry the relative source paths; ma-loop runs with cwd=project_root.
-            target_files = [str(f) for f in file_locks if f and "." in str(f)]
-
-            # U4: the measurable goal — the task's `> DONE:` criterion — so ma-loop
-            # generates a STRONG behavioral test (not a trivial/compile-only one).
-            criterion = _criterion_from_tasksmd(task, self._project_root)
-
-            tiers_file = getattr(self._config, "sentinel_tiers_file", "")
-
-            if tiers_file:
-                # ── N-tier path: delegate to micro-agent --tier-config ──
-                tr = runner.run_tiered(
-                    objective,
-                    test_cmd,
-                    self._config,
-                    self._project_root,
-                    target_files=target_files,
-                    criterion=criterion or None,
+                # The file(s) MUST be handed to ma-loop (PRD maloop_unification U1) —
+                # without a concrete target it authors junk into the tree. file_locks
+                # carry the relative source paths; ma-loop runs with cwd=project_root.
+                target_files = list(
+                    dict.fromkeys(str(f) for f in file_locks if _has_extension(f))
                 )
-                result_obj.tier_results = [tr]
-                # Populate legacy fields for manifest backward compat
-                result_obj.tier1_result = tr
 
-                if tr.passed:
-                    result_obj.result = "PASS"
-                    result_obj.tier_name_used = tr.tier_name
-                    print(
-                        f"      ✅ Tiered run passed via {tr.tier_name} "
-                        f"in {tr.iterations} iteration(s) (${tr.cost_usd:.2f})"
+                # U4: the measurable goal — the task's `> DONE:` criterion — so ma-loop
+                # generates a STRONG behavioral test (not a trivial/compile-only one).
+                criterion = _criterion_from_tasksmd(task, self._project_root)
+
+                tiers_file = getattr(self._config, "sentinel_tiers_file", "")
+
+                if tiers_file:
+                    # ── N-tier path: delegate to micro-agent --tier-config ──
+                    tr = runner.run_tiered(
+                        objective,
+                        test_cmd,
+                        self._config,
+                        self._project_root,
+                        target_files=target_files,
+                        criterion=criterion or None,
                     )
+                    result_obj.tier_results = [tr]
+                    # Populate legacy fields for manifest backward compat
+                    result_obj.tier1_result = tr
+
+                    if tr.passed:
+                        result_obj.result = "PASS"
+                        result_obj.tier_name_used = tr.tier_name
+                        print(
+                            f"      ✅ Tiered run passed via {tr.tier_name} "
+                            f"in {tr.iterations} iteration(s) (${tr.cost_usd:.2f})"
+                        )
+                    else:
+                        result_obj.result = "FAIL"
+                        result_obj.should_halt_wave = True
+                        result_obj.tier_name_used = tr.tier_name
+                        result_obj.error_message = (
+                            f"All tiers exhausted for {task_id}. "
+                            "Manual intervention required."
+                        )
+                        print("      ❌ All tiers exhausted — wave will halt")
                 else:
+                    # Legacy 2-tier micro-agent path REMOVED (2026-05-28): it entered
+                    # micro-agent's interactive onboarding TUI and hung 300s/tier in a
+                    # non-TTY context. The headless ma-loop path (run_tiered) requires a
+                    # tiers_file. Fail clearly instead of hanging.
                     result_obj.result = "FAIL"
                     result_obj.should_halt_wave = True
-                    result_obj.tier_name_used = tr.tier_name
                     result_obj.error_message = (
-                        f"All tiers exhausted for {task_id}. "
-                        "Manual intervention required."
+                        f"No sentinel.tiers_file configured for {task_id}; the legacy "
+                        "micro-agent tier path has been removed (it hung in non-TTY). "
+                        "Set sentinel.tiers_file to a ralph-tiers.json (project-local or "
+                        "~/.dev-kid/ralph-tiers.json)."
+                    )
+                    print(
+                        "      ❌ No tiers_file — legacy micro-agent path removed; "
+                        "configure sentinel.tiers_file"
+                    )
+            except Exception as exc:
+                # Distinguish expected test failures (should halt) from unexpected
+                # errors (import errors, I/O errors, etc.) which are non-fatal.
+                if isinstance(exc, subprocess.SubprocessError):
+                    result_obj.result = "ERROR"
+                    result_obj.should_halt_wave = True
+                    result_obj.error_message = f"Sentinel test loop error: {exc}"
+                    print(f"      ❌ Sentinel test error (halting wave): {exc}")
+                else:
+                    result_obj.result = "ERROR"
+                    result_obj.should_halt_wave = (
+                        False  # Non-fatal — don't block wave for infra issues
+                    )
+                    result_obj.error_message = (
+                        f"Sentinel infrastructure error (non-fatal): {exc}"
+                    )
+                    print(
+                        f"      ⚠️  Sentinel infra error (non-fatal, wave continues): {exc}"
                     )
-                    print("      ❌ All tiers exhausted — wave will halt")
-            else:
-                # Legacy 2-tier micro-agent path REMOVED (2026-05-28): it entered
-                # micro-agent's interactive onboarding TUI and hung 300s/tier in a
-                # non-TTY context. The headless ma-loop path (run_tiered) requires a
-                # tiers_file. Fail clearly instead of hanging.
-                result_obj.result = "FAIL"
-                result_obj.should_halt_wave = True
-                result_obj.error_message = (
-                    f"No sentinel.tiers_file configured for {task_id}; the legacy "
-                    "micro-agent tier path has been removed (it hung in non-TTY). "
-                    "Set sentinel.tiers_file to a ralph-tiers.json (project-local or "
-                    "~/.dev-kid/ralph-tiers.json)."
-                )
-                print(
-                    "      ❌ No tiers_file — legacy micro-agent path removed; "
-                    "configure sentinel.tiers_file"
-                )
-        except Exception as exc:
-            # Distinguish expected test failures (should halt) from unexpected
-            # errors (import errors, I/O errors, etc.) which are non-fatal.
-            if isinstance(exc, subprocess.SubprocessError):
-                result_obj.result = "ERROR"
-                result_obj.should_halt_wave = True
-                result_obj.error_message = f"Sentinel test loop error: {exc}"
-                print(f"      ❌ Sentinel test error (halting wave): {exc}")
-            else:
-                result_obj.result = "ERROR"
-                result_obj.should_halt_wave = (
-                    False  # Non-fatal — don't block wave for infra issues
-                )
-                result_obj.error_message = (
-                    f"Sentinel infrastructure error (non-fatal): {exc}"
-                )
-                print(
-                    f"      ⚠️  Sentinel infra error (non-fatal, wave continues): {exc}"
-                )
 
-        # ------------------------------------------------------------------
-        # Phase 4 (US3/US4): Interface diff, change radius, cascade (T033)
-        # ------------------------------------------------------------------
-        try:
-            self._run_cascade_phase(result_obj, files)
-        except Exception as exc:
-            print(f"      ⚠️  Cascade analysis error (non-fatal): {exc}")
+            # ------------------------------------------------------------------
+            # Phase 4 (US3/US4): Interface diff, change radius, cascade (T033)
+            # ------------------------------------------------------------------
+            try:
+                self._run_cascade_phase(result_obj, files, prefetch)
+            except Exception as exc:
+                print(f"      ⚠️  Cascade analysis error (non-fatal): {exc}")
+        finally:
+            prefetch_pool.shutdown(wait=False, cancel_futures=True)
 
         # ------------------------------------------------------------------
         # Phase 5 (US3): Manifest writing — always written (spec requirement)
@@ -431,43 +658,171 @@ class SentinelRunner:
 
         return result_obj
 
+    def _git(
+        self,
+        *args: str,
+        input: bytes | None = None,
+        text: bool = False,
+        timeout: int = 10,
+    ) -> subprocess.CompletedProcess:
+        """Run a read-only git command in the project root and capture its output.
+
+        Uses _GIT_ENV_OVERRIDES (no optional locks, C locale, no credential
+        prompts) over the current environment and closes stdin unless input
+        is supplied. Never raises on a non-zero exit; callers check returncode.
+        """
+        return subprocess.run(
+            ["git", *args],
+            input=input,
+            stdin=subprocess.DEVNULL if input is None else None,
+            capture_output=True,
+            text=text,
+            check=False,
+            timeout=timeout,
+            cwd=str(self._project_root),
+            env={**os.environ, **_GIT_ENV_OVERRIDES},
+        )
+
     def _compute_files_changed(self, files: list) -> list[dict]:
         """Return [{path, lines_added, lines_removed}] using real git diff --numstat.
 
         Shared by the change-radius evaluator and the manifest writer so both see
         the same line counts. Files with no diff (or git errors) report 0/0 but
-        are still listed if they exist on disk.
+        are still listed if they exist on disk. All paths go through a single
+        `git diff --numstat` call.
         """
-        import subprocess
+        rels = [self._rel_path(f) for f in files if f.exists()]
+        if not rels:
+            return []
+
+        stats: dict[str, tuple[int, int]] = {}
+        try:
+            # -z: paths verbatim (no core.quotePath escaping) so they match rels
+            diff_stat = self._git(
+                "diff",
+                "--numstat",
+                "-z",
+                "--no-renames",
+                "--relative",
+                "HEAD",
+                "--",
+                *rels,
+                text=True,
+            )
+            if diff_stat.returncode == 0:
+                for line in diff_stat.stdout.split("\0"):
+                    parts = line.split("\t", 2)
+                    if len(parts) != 3:
+                        continue
+                    # Binary files report "-" for both counts
+                    added = int(parts[0]) if parts[0].isdigit() else 0
+                    removed = int(parts[1]) if parts[1].isdigit() else 0
+                    stats[parts[2]] = (added, removed)
+        except Exception:
+            pass
 
         files_changed: list[dict] = []
-        for f in files:
-            if not f.exists():
-                continue
-            rel = str(f.relative_to(self._project_root)) if f.is_absolute() else str(f)
-            added, removed = 0, 0
-            try:
-                diff_stat = subprocess.run(
-                    ["git", "diff", "--numstat", "HEAD", "--", rel],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=10,
-                    cwd=str(self._project_root),
-                )
-                if diff_stat.returncode == 0 and diff_stat.stdout.strip():
-                    parts = diff_stat.stdout.strip().split()
-                    added = int(parts[0]) if parts and parts[0].isdigit() else 0
-                    removed = (
-                        int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-                    )
-            except Exception:
-                pass
+        for rel in rels:
+            added, removed = stats.get(rel, (0, 0))
             files_changed.append(
                 {"path": rel, "lines_added": added, "lines_removed": removed}
             )
         return files_changed
 
+    def _changed_since_head(self, rels: list[str]) -> set[str] | None:
+        """Return the subset of rels that differ from HEAD (modified or untracked).
+
+        Uses two git calls regardless of len(rels): `git diff --name-only HEAD`
+        for tracked changes (staged or not) and `git ls-files` to spot paths git
+        does not know about yet. Returns None if git fails, so callers treat
+        every file as changed.
+        """
+        if not rels:
+            return set()
+        try:
+            diff = self._git(
+                "diff",
+                "--name-only",
+                "-z",
+                "--no-renames",
+                "--relative",
+                "HEAD",
+                "--",
+                *rels,
+                text=True,
+            )
+            tracked = self._git("ls-files", "-z", "--", *rels, text=True)
+        except Exception:
+            return None
+        if diff.returncode != 0 or tracked.returncode != 0:
+            return None
+        known = set(filter(None, tracked.stdout.split("\0")))
+        changed = set(filter(None, diff.stdout.split("\0")))
+        changed.update(rel for rel in rels if rel not in known)
+        return changed
+
+    def _read_head_blobs(self, rels: list[str]) -> dict[str, bytes]:
+        """Return {rel: raw bytes at HEAD} for rels via a single `git cat-file --batch`.
+
+        One process serves every lookup instead of spawning `git show HEAD:<rel>`
+        per file. Paths missing at HEAD (new files) are omitted; any git error
+        yields an empty dict so callers fall back to empty pre-content.
+        """
+        if not rels:
+            return {}
+        if self._repo is not None:
+            blobs = self._read_head_blobs_pygit2(rels)
+            if blobs is not None:
+                return blobs
+        request = "".join(f"HEAD:{rel}\n" for rel in rels).encode("utf-8")
+        try:
+            proc = self._git("cat-file", "--batch", input=request)
+        except Exception:
+            return {}
+        if proc.returncode != 0:
+            return {}
+
+        # Response per request: "<sha> <type> <size>\n<content>\n", or
+        # "<object> missing\n" when HEAD has no such path.
+        out = proc.stdout
+        blobs: dict[str, bytes] = {}
+        pos = 0
+        for rel in rels:
+            eol = out.find(b"\n", pos)
+            if eol == -1:
+                break
+            header = out[pos:eol].split()
+            pos = eol + 1
+            if len(header) != 3 or not header[2].isdigit():
+                continue  # "<object> missing" / "ambiguous" — no content follows
+            size = int(header[2])
+            if header[1] == b"blob":
+                blobs[rel] = out[pos : pos + size]
+            pos += size + 1
+        return blobs
+
+    def _read_head_blobs_pygit2(self, rels: list[str]) -> dict[str, bytes] | None:
+        """In-process variant of _read_head_blobs using the pygit2 repo handle.
+
+        Returns None on any unexpected error so the git CLI path is used.
+        """
+        try:
+            workdir = Path(self._repo.workdir).resolve()
+            prefix = self._project_root.resolve().relative_to(workdir).as_posix()
+            tree = self._repo.head.peel(_pygit2.Tree)
+        except Exception:
+            return None
+        blobs: dict[str, bytes] = {}
+        for rel in rels:
+            key = Path(rel).as_posix() if prefix == "." else f"{prefix}/{rel}"
+            try:
+                obj = self._repo[tree[key].id]
+            except (KeyError, ValueError):
+                continue  # not at HEAD (new file)
+            if isinstance(obj, _pygit2.Blob):
+                blobs[rel] = obj.data
+        return blobs
+
     def _safe_write_manifest(
         self,
         result_obj: "SentinelResult",
@@ -479,75 +834,151 @@ class SentinelRunner:
         except Exception as exc:
             print(f"      ⚠️  Manifest write error (non-fatal): {exc}")
 
+    def _prefetch_cascade_inputs(
+        self, files: list
+    ) -> tuple[dict[str, bytes], set[str], dict]:
+        """Load the cascade inputs that do not depend on the tier loop's edits.
+
+        Returns (HEAD blobs, the relative paths they were looked up for, the
+        execution plan). Like the cascade phase, only files that already differ
+        from HEAD are looked up; files the tier loop changes later are read by
+        _run_cascade_phase. Runs on a background thread from run() so the
+        git/JSON I/O overlaps the test loop.
+        """
+        rels: list[str] = []
+        for f in files:
+            if f.suffix.lower() not in DIFFABLE_EXTENSIONS:
+                continue
+            try:
+                rels.append(self._rel_path(f))
+            except ValueError:
+                continue
+        changed = self._changed_since_head(rels)
+        if changed is not None:
+            rels = [rel for rel in rels if rel in changed]
+        return self._read_head_blobs(rels), set(rels), self._load_execution_plan()
+
+    def _load_execution_plan(self) -> dict:
+        """Load execution_plan.json for cross-wave detection (best-effort, {} on error)."""
+        try:
+            ep_path = self._project_root / "execution_plan.json"
+            if ep_path.exists():
+                return _load_json_file(ep_path)
+        except Exception:
+            pass
+        return {}
+
     def _run_cascade_phase(
         self,
         result_obj: "SentinelResult",
         files: list,
+        prefetch: "Future | None" = None,
     ) -> None:
         """Run InterfaceDiff, ChangeRadiusEvaluator, and CascadeAnalyzer.
 
-        Populates result_obj.interface_changes, cascade_triggered, and
-        cascade_tasks_annotated in place.
+        Populates result_obj.interface_changes, files_changed, cascade_triggered,
+        and cascade_tasks_annotated in place.
 
         Args:
             result_obj: SentinelResult to update with cascade information.
             files: Resolved file paths that may have been modified.
+            prefetch: Optional future from _prefetch_cascade_inputs; when it
+                fails or is absent the inputs are loaded here instead.
         """
-        from . import InterfaceChangeReport
-        from .cascade_analyzer import CascadeAnalyzer, ChangeRadiusEvaluator
-        from .interface_diff import InterfaceDiff
-
         if not files:
             print("      ℹ️  Cascade: no files to analyze — skipping")
             return
 
+        head_blobs: dict[str, bytes] | None = None
+        prefetched: set[str] = set()
+        execution_plan: dict | None = None
+        if prefetch is not None:
+            try:
+                head_blobs, prefetched, execution_plan = prefetch.result()
+            except Exception:
+                pass
+
         # --- Interface diff for each modified file ---
         differ = InterfaceDiff()
         interface_reports: list[InterfaceChangeReport] = []
+        existing: list[Path] = []
+        rels: list[str] = []
         for f in files:
-            if not f.exists():
+            # Non-code files (.md, .json, .yml, ...) have no interface to diff
+            if f.suffix.lower() not in DIFFABLE_EXTENSIONS or not f.exists():
                 continue
             try:
-                post_content = f.read_text(encoding="utf-8", errors="replace")
-                # Use git show HEAD:<file> as pre-content (fallback: empty)
-                import subprocess
-
-                rel = (
-                    str(f.relative_to(self._project_root))
-                    if f.is_absolute()
-                    else str(f)
-                )
-                git_result = subprocess.run(
-                    ["git", "show", f"HEAD:{rel}"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=10,
-                    cwd=str(self._project_root),
+                rel = self._rel_path(f)
+            except ValueError as exc:
+                print(f"      ⚠️  Interface diff skipped for {f.name}: {exc}")
+                continue
+            existing.append(f)
+            rels.append(rel)
+
+        # Files identical to HEAD cannot change the interface — skip their
+        # blob lookup and diff entirely (None = git unavailable, diff all).
+        changed = self._changed_since_head(rels)
+        if changed is not None:
+            keep = [i for i, rel in enumerate(rels) if rel in changed]
+            existing = [existing[i] for i in keep]
+            rels = [rels[i] for i in keep]
+
+        # HEAD:<file> as pre-content for every file in one git process
+        # (fallback: empty for new/untracked files or git errors)
+        if head_blobs is None:
+            pre_contents = self._read_head_blobs(rels)
+        else:
+            # Only files the tier loop changed after the prefetch are missing
+            missing = [rel for rel in rels if rel not in prefetched]
+            pre_contents = (
+                {**head_blobs, **self._read_head_blobs(missing)} if missing else head_blobs
+            )
+
+        def _diff_one(f: Path, rel: str) -> "InterfaceChangeReport | None":
+            try:
+                pre_content = pre_contents.get(rel, b"")
+                st = f.stat()
+                key = (
+                    str(f),
+                    st.st_mtime_ns,
+                    st.st_size,
+                    hashlib.blake2b(pre_content, digest_size=16).digest(),
                 )
-                pre_content = git_result.stdout if git_result.returncode == 0 else ""
+                with _IFACE_CACHE_LOCK:
+                    report = _IFACE_CACHE.get(key)
+                if report is not None:
+                    return report
+                # Bytes end to end — InterfaceDiff decodes only if it must
+                post_content = self._read_file(f)
                 report = differ.compare(f, pre_content, post_content)
-                interface_reports.append(report)
+                with _IFACE_CACHE_LOCK:
+                    if len(_IFACE_CACHE) >= _IFACE_CACHE_MAX:
+                        _IFACE_CACHE.pop(next(iter(_IFACE_CACHE)))
+                    _IFACE_CACHE[key] = report
+                return report
             except Exception as exc:
                 print(f"      ⚠️  Interface diff skipped for {f.name}: {exc}")
-                continue
+                return None
+
+        # Files are independent — read + diff them concurrently. map() keeps
+        # the reports in file_locks order so manifests stay deterministic.
+        if existing:
+            workers = min(_MAX_DIFF_WORKERS, len(existing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                reports = list(pool.map(_diff_one, existing, rels))
+            interface_reports = [r for r in reports if r is not None]
 
         # --- Change radius evaluation ---
         # Use REAL git diff line counts so the max_lines budget axis actually
         # fires. Previously this was hardcoded to zeros, which silently disabled
         # the line-radius guard (only file-count / interface / cross-wave worked).
         files_changed = self._compute_files_changed(files)
+        # Reused by _write_manifest — nothing edits the files in between
+        result_obj.files_changed = files_changed
 
-        # Load execution plan for cross-wave detection (best-effort)
-        execution_plan: dict = {}
-        try:
-            import json
-
-            ep_path = self._project_root / "execution_plan.json"
-            if ep_path.exists():
-                execution_plan = json.loads(ep_path.read_text(encoding="utf-8"))
-        except Exception:
-            pass
+        # Execution plan for cross-wave detection (best-effort)
+        if execution_plan is None:
+            execution_plan = self._load_execution_plan()
 
         evaluator = ChangeRadiusEvaluator(self._config)
         radius_report = evaluator.evaluate(
@@ -599,11 +1030,9 @@ class SentinelRunner:
         mode = getattr(self._config, "sentinel_mode", "auto")
 
         if mode == "human-gated":
-            from .cascade_analyzer import WaveHaltError as _CascadeHaltError
-
             try:
                 cascade.cascade_human_gated(affected_ids, result_obj.sentinel_id)
-            except _CascadeHaltError:
+            except WaveHaltError:
                 result_obj.should_halt_wave = True
                 result_obj.result = "FAIL"
                 return
@@ -627,18 +1056,16 @@ class SentinelRunner:
             task: Original task dict (for instruction / parent context).
             files: Resolved file paths that were scanned / modified.
         """
-        from datetime import datetime, timezone
-
-        from . import ManifestData, TierResult
-        from .manifest_writer import ManifestWriter
-
         sentinel_id = result_obj.sentinel_id
         output_dir = self._project_root / ".claude" / "sentinel" / sentinel_id
         writer = ManifestWriter(output_dir)
 
         # Collect git diff stats for each file (lines added/removed) — same
         # source the change-radius evaluator uses, so manifest and budget agree.
-        files_changed = self._compute_files_changed(files)
+        # The cascade phase already computed them when it ran.
+        files_changed = result_obj.files_changed or self._compute_files_changed(
+            files
+        )
 
         tier1 = result_obj.tier1_result or TierResult()
         tier2 = result_obj.tier2_result or TierResult()
@@ -669,6 +1096,9 @@ class SentinelRunner:
             # matched_text, context_lines). Pre-serialising to dicts caused
             # AttributeError because ManifestWriter uses attribute access, not keys.
             placeholder_violations=list(result_obj.placeholder_violations or []),
+            placeholder_scan_stopped_early=bool(
+                getattr(result_obj, "placeholder_scan_stopped_early", False)
+            ),
             files_changed=files_changed,
             interface_changes=interface_changes,
             fix_reason=getattr(result_obj, "error_message", "") or "",
@@ -13,23 +13,61 @@ Built-in rules (all opt-in via .constitution.md):
 Components:
   SQLConstitutionScanner  — scans .sql files
   DBTSchemaYAMLScanner    — scans dbt .yml schema files
+  SQLScanCache            — optional on-disk cache of scan results by content hash
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import mmap
+import os
 import re
+import sqlite3
+import warnings
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Collection, Iterable, Iterator, Optional, Union
+
+from .sql_utils import PARALLEL_MIN_FILES, strip_jinja, try_import_sqlglot
+
+# PyYAML is optional; without it the YAML scanner uses its regex fallback.
+# Prefer the libyaml-backed loader, several times faster than pure Python.
+try:
+    import yaml as _yaml
+except ImportError:  # pragma: no cover - depends on environment
+    _yaml = None
+_YAML_LOADER = (
+    getattr(_yaml, "CSafeLoader", None) or getattr(_yaml, "SafeLoader", None)
+    if _yaml is not None
+    else None
+)
+
+# sqlglot is optional; without it NO_SELECT_STAR uses its regex fallback.
+# Resolved once at import (this module is only loaded on the SQL scan path)
+# so scans read plain module globals instead of calling the import helper.
+_sqlglot, _sqlglot_exp = try_import_sqlglot()
 
-from .sql_utils import strip_jinja, try_import_sqlglot
+# google-re2 is optional; when installed the combined rule scanner runs on
+# RE2, whose DFA matching is linear-time on any input (no backtracking
+# blow-ups on adversarial SQL). Without it the stdlib engine is used.
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - depends on environment
+    _re2 = None
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SQLViolation:
     """A single constitution rule violation in a SQL or YAML file."""
 
@@ -42,19 +80,216 @@ class SQLViolation:
         return f"❌ VIOLATION [{self.rule}] {self.file_path}:{self.line}\n   {self.message}"
 
 
+# Violation messages. Fixed ones are shared by every violation; the rest are
+# templates formatted only with the one value they need.
+_MSG_SELECT_STAR = (
+    "SELECT * is forbidden. Explicitly list columns to prevent silent schema breakage."
+)
+_MSG_CREDENTIAL = (
+    "Hardcoded credential detected ({}). Use environment variables or a secrets vault."
+)
+_MSG_SQL_INCREMENTAL = (
+    "Incremental model '{}' is missing unique_key. Add unique_key='<column>' to config()."
+)
+_MSG_ROLLBACK = (
+    "Migration missing rollback section. "
+    "Add '-- rollback' marker followed by the reverse operation."
+)
+_MSG_DESCRIPTION = "Model '{}' has no description. Add a description: field."
+_MSG_YAML_INCREMENTAL = "Incremental model '{}' is missing unique_key in schema.yml config."
+
+
+# Files larger than this are skipped with a warning rather than scanned;
+# files from _MMAP_MIN_BYTES up are memory-mapped instead of read.
+MAX_SCAN_BYTES = 64 * 1024 * 1024
+_MMAP_MIN_BYTES = 1024 * 1024
+
+
+@contextmanager
+def _source_buffer(file_path: Path) -> Iterator[Optional[Union[bytes, mmap.mmap]]]:
+    """Yield a file's raw bytes, or None if it is missing, unreadable or too big.
+
+    Large files are memory-mapped, so hashing them for the scan cache (and a
+    cache hit) never copies the file into a Python bytes object.
+    """
+    try:
+        size = file_path.stat().st_size
+        if size > MAX_SCAN_BYTES:
+            warnings.warn(
+                f"{file_path} is {size} bytes (> {MAX_SCAN_BYTES}); "
+                "skipping SQL constitution scan",
+                stacklevel=3,
+            )
+            yield None
+            return
+        if size < _MMAP_MIN_BYTES:
+            data: Optional[Union[bytes, mmap.mmap]] = file_path.read_bytes()
+        else:
+            with open(file_path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        yield None
+        return
+    try:
+        yield data
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _decode_source(data: Union[bytes, mmap.mmap]) -> str:
+    """Decode file bytes like read_text(errors="replace"): UTF-8, universal newlines."""
+    text = str(data, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _scan_source(
+    path: str,
+    kind: str,
+    enabled_rules: frozenset[str],
+    cache: Optional["SQLScanCache"],
+    scan: Callable[[str, str, frozenset[str], bool], list[SQLViolation]],
+    fail_fast: bool = False,
+) -> list[SQLViolation]:
+    """Read path, serve it from cache when possible, else scan it.
+
+    fail_fast results are partial, so they are served from the cache but
+    never stored in it.
+    """
+    key = None
+    with _source_buffer(Path(path)) as data:
+        if data is None:
+            return []
+        if cache is not None:
+            key = cache.key(kind, path, data, enabled_rules)
+            cached = cache.get(key, path)
+            if cached is not None:
+                return cached[:1] if fail_fast else cached
+        raw_content = _decode_source(data)
+    violations = scan(raw_content, path, enabled_rules, fail_fast)
+    if key is not None and not fail_fast:
+        cache.put(key, violations)
+    return violations
+
+
+# ---------------------------------------------------------------------------
+# Scan result cache
+# ---------------------------------------------------------------------------
+
+# Bump whenever a rule's detection logic or message changes so stale cached
+# results are not served.
+_RULES_VERSION = 6
+
+
+class SQLScanCache:
+    """SQLite cache of scan results keyed by file content, path and rule set.
+
+    Sentinel checkpoints re-scan the same unchanged .sql/.yml files on every
+    task; a hit turns the scan into one hash and one lookup. Best-effort like
+    observability.db: any SQLite error disables the cache for this instance
+    and scanning carries on uncached.
+
+    Lives next to the other sentinel state under .claude/ (gitignored per
+    project); deleting the file just empties the cache.
+    """
+
+    DB_REL = ".claude/sentinel/.sql-scan-cache.db"
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = Path(db_path)
+        self._con: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    @staticmethod
+    def key(
+        kind: str, path: str, data: Union[bytes, mmap.mmap], enabled_rules: Collection[str]
+    ) -> bytes:
+        """Cache key for scanning data (the file bytes) at path with enabled_rules."""
+        # Results differ with and without sqlglot, so that is part of the key
+        engine = "sqlglot" if _sqlglot is not None else "regex"
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{_RULES_VERSION}\0{engine}\0{kind}\0{path}\0".encode())
+        h.update("\0".join(sorted(set(enabled_rules))).encode())
+        h.update(b"\0")
+        h.update(data)
+        return h.digest()
+
+    def get(self, key: bytes, path: str) -> Optional[list[SQLViolation]]:
+        """Return the cached violations for key (re-pointed at path), or None."""
+        con = self._connect()
+        if con is None:
+            return None
+        try:
+            row = con.execute(
+                "SELECT violations FROM scan_results WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            self.close(disable=True)
+            return None
+        if row is None:
+            return None
+        return [
+            SQLViolation(rule=rule, file_path=path, line=line, message=message)
+            for rule, line, message in json.loads(row[0])
+        ]
+
+    def put(self, key: bytes, violations: list[SQLViolation]) -> None:
+        """Store the violations found for key."""
+        con = self._connect()
+        if con is None:
+            return
+        payload = json.dumps([[v.rule, v.line, v.message] for v in violations])
+        try:
+            with con:
+                con.execute(
+                    "INSERT OR REPLACE INTO scan_results (key, violations) VALUES (?, ?)",
+                    (key, payload),
+                )
+        except sqlite3.Error:
+            self.close(disable=True)
+
+    def close(self, disable: bool = False) -> None:
+        """Close the connection; with disable=True stop using the cache."""
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+        self._disabled = self._disabled or disable
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._con is None and not self._disabled:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                con = sqlite3.connect(str(self._db_path))
+                con.execute("PRAGMA journal_mode=WAL")
+                con.execute("PRAGMA synchronous=NORMAL")
+                con.execute(
+                    "CREATE TABLE IF NOT EXISTS scan_results "
+                    "(key BLOB PRIMARY KEY, violations TEXT NOT NULL)"
+                )
+                self._con = con
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+        return self._con
+
+
 # ---------------------------------------------------------------------------
 # Credential patterns (regex — no AST needed for secret detection)
 # ---------------------------------------------------------------------------
 
-_CREDENTIAL_PATTERNS: list[re.Pattern] = [
-    re.compile(r"(?i)(password|passwd|pwd)\s*=\s*'[^']{4,}'"),
-    re.compile(r"(?i)(api_key|apikey|secret|token)\s*=\s*'[^']{8,}'"),
-    re.compile(r'(?i)(password|passwd|pwd)\s*=\s*"[^"]{4,}"'),
-    re.compile(r'(?i)(api_key|apikey|secret|token)\s*=\s*"[^"]{8,}"'),
-]
+# One alternation so the content is walked once instead of once per pattern.
+# Password-style keys need a 4+ char literal, token-style keys 8+.
+_CREDENTIAL_PATTERN = re.compile(
+    r"""(?P<pw>password|passwd|pwd)\s*=\s*(?:'[^']{4,}'|"[^"]{4,}")"""
+    r"""|(?P<key>api_key|apikey|secret|token)\s*=\s*(?:'[^']{8,}'|"[^"]{8,}")""",
+    re.IGNORECASE,
+)
 
 # SELECT * detection regex (fallback when sqlglot unavailable)
 _SELECT_STAR_REGEX = re.compile(r"\bSELECT\s+\*\s+FROM\b", re.IGNORECASE)
+# Any SELECT * (sqlglot decides whether it really selects every column)
+_SELECT_STAR_PREFIX = re.compile(r"\bSELECT\s+\*", re.IGNORECASE)
 
 # Incremental config detection
 _INCREMENTAL_PATTERN = re.compile(
@@ -62,13 +297,116 @@ _INCREMENTAL_PATTERN = re.compile(
 )
 _UNIQUE_KEY_PATTERN = re.compile(r"unique_key\s*=", re.IGNORECASE)
 
+# `- name: <value>` entries in dbt schema YAML (models, columns, tests ...)
+_YAML_NAME_ENTRY = re.compile(r"""^[ \t]*-[ \t]+name:[ \t]*['"]?([^'"\s#]+)""", re.MULTILINE)
+
+# Regex fallback for schema YAML PyYAML cannot read
+# Keys are found at the start of a line or inline after `{` / `,`, so flow
+# forms like `config: {materialized: incremental}` are still seen.
+_YAML_MODEL_NAME_RE = re.compile(r"^\s*-\s+\{?\s*name:\s+([^\s,}]+)")
+_YAML_DESCRIPTION_RE = re.compile(r"(?:^|[{,])[ \t]*description:[ \t]*[^\s,}]")
+_YAML_MATERIALIZED_RE = re.compile(
+    r"(?:^|[{,])[ \t]*materialized:[ \t]*['\"]?incremental\b['\"]?"
+)
+_YAML_UNIQUE_KEY_RE = re.compile(r"(?:^|[{,])[ \t]*unique_key:")
+
 # Rollback marker detection
 _ROLLBACK_MARKERS = re.compile(r"(?:--\s*(?:rollback|down|revert|undo))", re.IGNORECASE)
 
 
-def _line_of(content: str, char_offset: int) -> int:
-    """Return 1-based line number for a character offset in content."""
-    return content[:char_offset].count("\n") + 1
+# Lower-case substrings at least one of which must appear for a rule to be
+# able to fire. Clean files skip the rule's regex / sqlglot pass entirely.
+# MIGRATION_NEEDS_ROLLBACK has no entry: it fires on an *absent* marker.
+_RULE_TRIGGERS: dict[str, tuple[str, ...]] = {
+    "NO_SELECT_STAR": ("select",),
+    "NO_HARDCODED_CREDENTIALS": ("pass", "pwd", "api", "secret", "token"),
+    "INCREMENTAL_NEEDS_UNIQUE_KEY": ("incremental",),
+}
+
+
+def _may_match(rule: str, lowered: str) -> bool:
+    """Return False when lowered content cannot contain a violation of rule."""
+    triggers = _RULE_TRIGGERS.get(rule)
+    return triggers is None or any(t in lowered for t in triggers)
+
+
+# Token patterns behind the SQL rules, keyed by the group name scan_file
+# dispatches on. _rule_scanner() joins the ones the active rules need into a
+# single alternation so the file is walked once, not once per rule.
+_RULE_TOKENS: dict[str, str] = {
+    "star": _SELECT_STAR_PREFIX.pattern,
+    "credential": _CREDENTIAL_PATTERN.pattern,
+    "incremental": _INCREMENTAL_PATTERN.pattern,
+    "unique_key": _UNIQUE_KEY_PATTERN.pattern,
+    "rollback": _ROLLBACK_MARKERS.pattern,
+}
+_RULE_TOKEN_GROUPS: dict[str, tuple[str, ...]] = {
+    "NO_SELECT_STAR": ("star",),
+    "NO_HARDCODED_CREDENTIALS": ("credential",),
+    "INCREMENTAL_NEEDS_UNIQUE_KEY": ("incremental", "unique_key"),
+    "MIGRATION_NEEDS_ROLLBACK": ("rollback",),
+}
+# Literal substrings (lower-case) every match of a token must contain. A
+# token whose substrings are absent cannot match, so a plain `in` test on
+# the lowered content settles it and the group is left out of the scan.
+_TOKEN_LITERALS: dict[str, tuple[str, ...]] = {
+    "star": ("select", "*"),
+    "incremental": ("materialized", "incremental"),
+    "unique_key": ("unique_key",),
+    "rollback": ("--",),
+}
+
+
+def _token_groups(rules: frozenset[str], lowered: str) -> frozenset[str]:
+    """Return the token groups the rules need that can occur in lowered content."""
+    return frozenset(
+        g
+        for rule in rules
+        for g in _RULE_TOKEN_GROUPS.get(rule, ())
+        if all(lit in lowered for lit in _TOKEN_LITERALS.get(g, ()))
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _rule_scanner(wanted: frozenset[str]) -> Optional[re.Pattern]:
+    """Compile the combined regex for a set of token groups (cached)."""
+    if not wanted:
+        return None
+    pattern = "|".join(f"(?P<{g}>{p})" for g, p in _RULE_TOKENS.items() if g in wanted)
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, _re2.IGNORECASE)
+        except Exception:
+            pass  # syntax RE2 does not support: use the stdlib engine
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_NEWLINE = re.compile(r"\n")
+
+
+def _newline_offsets(content: str) -> list[int]:
+    """Return the sorted offsets of every newline in content.
+
+    Built once per file so each _line_of lookup is a bisect instead of
+    a rescan of the content prefix.
+    """
+    return [m.start() for m in _NEWLINE.finditer(content)]
+
+
+def _line_of(newlines: list[int], char_offset: int) -> int:
+    """Return 1-based line number for a character offset, given _newline_offsets()."""
+    return bisect_left(newlines, char_offset) + 1
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_sql(cleaned: str) -> tuple:
+    """Parse Jinja-stripped SQL with sqlglot, memoized by content.
+
+    Identical model bodies (re-scans of unchanged files across checkpoints)
+    reuse the parsed statements. Parse errors propagate and are not cached.
+    Callers must treat the returned ASTs as read-only.
+    """
+    return tuple(_sqlglot.parse(cleaned))  # type: ignore[union-attr]
 
 
 # ---------------------------------------------------------------------------
@@ -79,38 +417,160 @@ def _line_of(content: str, char_offset: int) -> int:
 class SQLConstitutionScanner:
     """Scans .sql files for active SQL constitution rule violations."""
 
-    def scan_file(self, path: str, enabled_rules: list[str]) -> list[SQLViolation]:
+    def __init__(self, cache: Optional[SQLScanCache] = None) -> None:
+        self._cache = cache
+
+    def scan_file(
+        self, path: str, enabled_rules: Collection[str], fail_fast: bool = False
+    ) -> list[SQLViolation]:
         """Scan a .sql file for violations of the enabled rules.
 
         Args:
             path: Path to the .sql file.
-            enabled_rules: List of rule IDs that are active in the constitution.
+            enabled_rules: Rule IDs that are active in the constitution.
+            fail_fast: Stop at the first violation (for callers that only
+                need to know whether the file is clean).
 
         Returns:
-            List of SQLViolation objects (empty = clean).
+            List of SQLViolation objects (empty = clean). With fail_fast, at
+            most one.
         """
-        file_path = Path(path)
-        if not file_path.exists():
-            return []
+        rules = frozenset(enabled_rules)
+        return _scan_source(
+            path, "sql", rules, self._cache, self._scan_content, fail_fast
+        )
+
+    def scan_paths(
+        self,
+        paths: Iterable[str | Path],
+        enabled_rules: Collection[str],
+        workers: Optional[int] = None,
+    ) -> list[SQLViolation]:
+        """Scan many .sql files, spreading uncached files over a process pool.
 
-        try:
-            raw_content = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            return []
+        Regex scanning holds the GIL, so files are scanned in worker
+        processes. Cache hits are served in this process; batches of fewer
+        than PARALLEL_MIN_FILES uncached files (or workers=1) are scanned
+        serially, as is everything if the pool cannot be started.
+
+        Args:
+            paths: Paths to the .sql files.
+            enabled_rules: Rule IDs that are active in the constitution.
+            workers: Worker process count (default: os.cpu_count()).
 
+        Returns:
+            Violations of all files, in path order.
+        """
+        rules = frozenset(enabled_rules)
+        results: dict[int, list[SQLViolation]] = {}
+        pending: list[tuple[int, str, Optional[bytes]]] = []
+        for i, p in enumerate(map(str, paths)):
+            key = None
+            if self._cache is not None:
+                with _source_buffer(Path(p)) as data:
+                    if data is None:
+                        results[i] = []
+                        continue
+                    key = self._cache.key("sql", p, data, rules)
+                cached = self._cache.get(key, p)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pending.append((i, p, key))
+
+        workers = workers or os.cpu_count() or 1
+        found: Optional[list[list[SQLViolation]]] = None
+        if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            workers = min(workers, len(pending))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    found = list(
+                        pool.map(
+                            _scan_sql_path,
+                            [p for _, p, _ in pending],
+                            repeat(rules),
+                            chunksize=max(1, len(pending) // (4 * workers)),
+                        )
+                    )
+            except (OSError, BrokenProcessPool):
+                found = None  # no subprocesses here: scan serially
+        if found is None:
+            found = [
+                SQLConstitutionScanner().scan_file(p, rules)
+                for _, p, _ in pending
+            ]
+
+        for (i, _, key), violations in zip(pending, found):
+            results[i] = violations
+            if key is not None:
+                self._cache.put(key, violations)
+        return [v for i in sorted(results) for v in results[i]]
+
+    def _scan_content(
+        self,
+        raw_content: str,
+        path: str,
+        enabled_rules: frozenset[str],
+        fail_fast: bool = False,
+    ) -> list[SQLViolation]:
         violations: list[SQLViolation] = []
+        lowered = raw_content.lower()
+        rules = frozenset(r for r in enabled_rules if _may_match(r, lowered))
+        # MIGRATION_NEEDS_ROLLBACK only applies to files in a migrations/ directory
+        if "MIGRATION_NEEDS_ROLLBACK" in rules and "migrations" not in path.replace("\\", "/"):
+            rules = rules - {"MIGRATION_NEEDS_ROLLBACK"}
+
+        # One pass over the content collects every token any active rule
+        # needs; the checks below only dispatch on the collected matches.
+        hits: dict[str, list[re.Match]] = {}
+        scanner = _rule_scanner(_token_groups(rules, lowered))
+        if scanner is not None:
+            for m in scanner.finditer(raw_content):
+                if fail_fast and m.lastgroup == "credential":
+                    # A credential is a violation on its own: stop scanning
+                    return self._check_no_hardcoded_credentials(
+                        path, [m], _newline_offsets(raw_content[: m.start()])
+                    )
+                hits.setdefault(m.lastgroup, []).append(m)
+        newlines = _newline_offsets(raw_content) if hits else []
 
-        if "NO_SELECT_STAR" in enabled_rules:
-            violations.extend(self._check_no_select_star(raw_content, path))
+        # Jinja-stripped SQL, computed once per file and only for the rules
+        # that parse it (the sqlglot path of NO_SELECT_STAR)
+        cleaned: Optional[str] = None
+        if "NO_SELECT_STAR" in rules and _sqlglot is not None:
+            cleaned = strip_jinja(raw_content)
 
-        if "NO_HARDCODED_CREDENTIALS" in enabled_rules:
-            violations.extend(self._check_no_hardcoded_credentials(raw_content, path))
+        if "NO_SELECT_STAR" in rules:
+            violations.extend(
+                self._check_no_select_star(
+                    raw_content, cleaned, path, hits.get("star", []), newlines
+                )
+            )
+            if fail_fast and violations:
+                return violations[:1]
 
-        if "INCREMENTAL_NEEDS_UNIQUE_KEY" in enabled_rules:
-            violations.extend(self._check_incremental_unique_key(raw_content, path))
+        if "NO_HARDCODED_CREDENTIALS" in rules:
+            violations.extend(
+                self._check_no_hardcoded_credentials(
+                    path, hits.get("credential", []), newlines
+                )
+            )
+            if fail_fast and violations:
+                return violations[:1]
+
+        if "INCREMENTAL_NEEDS_UNIQUE_KEY" in rules:
+            violations.extend(
+                self._check_incremental_unique_key(
+                    path, hits.get("incremental", []), hits.get("unique_key", []), newlines
+                )
+            )
+            if fail_fast and violations:
+                return violations
 
-        if "MIGRATION_NEEDS_ROLLBACK" in enabled_rules:
-            violations.extend(self._check_migration_rollback(raw_content, path))
+        if "MIGRATION_NEEDS_ROLLBACK" in rules:
+            violations.extend(
+                self._check_migration_rollback(path, hits.get("rollback", []))
+            )
 
         return violations
 
@@ -118,99 +578,133 @@ class SQLConstitutionScanner:
     # Rule implementations
     # ------------------------------------------------------------------
 
-    def _check_no_select_star(self, content: str, path: str) -> list[SQLViolation]:
+    def _check_no_select_star(
+        self,
+        content: str,
+        cleaned: Optional[str],
+        path: str,
+        stars: list[re.Match],
+        newlines: list[int],
+    ) -> list[SQLViolation]:
         violations: list[SQLViolation] = []
-        cleaned = strip_jinja(content)
-        sqlglot_mod, exp = try_import_sqlglot()
+        exp = _sqlglot_exp
 
-        if sqlglot_mod is not None:
+        if _sqlglot is not None:
+            if cleaned is None:
+                cleaned = strip_jinja(content)
             try:
-                statements = sqlglot_mod.parse(cleaned)  # type: ignore[attr-defined]
+                statements = _parse_sql(cleaned)
+                # sqlglot's AST carries no source positions: map its stars to
+                # the raw-text SELECT * matches in occurrence order (extra
+                # stars reuse the last).
+                star_lines = [_line_of(newlines, m.start()) for m in stars]
                 for stmt in statements:
                     if stmt is None:
                         continue
                     for select in stmt.find_all(exp.Select):  # type: ignore[attr-defined]
                         for expr in select.expressions:
                             if isinstance(expr, exp.Star):  # type: ignore[attr-defined]
-                                # Find approximate line by searching raw content
-                                m = re.search(r"\bSELECT\s+\*", content, re.IGNORECASE)
-                                line = _line_of(content, m.start()) if m else 1
+                                n = len(violations)
+                                line = star_lines[min(n, len(star_lines) - 1)] if star_lines else 1
                                 violations.append(
                                     SQLViolation(
                                         rule="NO_SELECT_STAR",
                                         file_path=path,
                                         line=line,
-                                        message="SELECT * is forbidden. Explicitly list columns to prevent silent schema breakage.",
+                                        message=_MSG_SELECT_STAR,
                                     )
                                 )
                 return violations
             except Exception:
                 pass  # fall through to regex
 
-        # Regex fallback
-        for m in _SELECT_STAR_REGEX.finditer(content):
+        # Regex fallback: only stars directly followed by FROM count
+        for m in stars:
+            if not _SELECT_STAR_REGEX.match(content, m.start()):
+                continue
             violations.append(
                 SQLViolation(
                     rule="NO_SELECT_STAR",
                     file_path=path,
-                    line=_line_of(content, m.start()),
-                    message="SELECT * is forbidden. Explicitly list columns to prevent silent schema breakage.",
+                    line=_line_of(newlines, m.start()),
+                    message=_MSG_SELECT_STAR,
                 )
             )
         return violations
 
     def _check_no_hardcoded_credentials(
-        self, content: str, path: str
+        self, path: str, credentials: list[re.Match], newlines: list[int]
     ) -> list[SQLViolation]:
         violations: list[SQLViolation] = []
-        for pattern in _CREDENTIAL_PATTERNS:
-            for m in pattern.finditer(content):
-                keyword = m.group(1).upper()
-                violations.append(
-                    SQLViolation(
-                        rule="NO_HARDCODED_CREDENTIALS",
-                        file_path=path,
-                        line=_line_of(content, m.start()),
-                        message=f"Hardcoded credential detected ({keyword}). Use environment variables or a secrets vault.",
-                    )
+        for m in credentials:
+            keyword = (m.group("pw") or m.group("key")).upper()
+            violations.append(
+                SQLViolation(
+                    rule="NO_HARDCODED_CREDENTIALS",
+                    file_path=path,
+                    line=_line_of(newlines, m.start()),
+                    message=_MSG_CREDENTIAL.format(keyword),
                 )
+            )
         return violations
 
     def _check_incremental_unique_key(
-        self, content: str, path: str
+        self,
+        path: str,
+        incrementals: list[re.Match],
+        unique_keys: list[re.Match],
+        newlines: list[int],
     ) -> list[SQLViolation]:
-        if not _INCREMENTAL_PATTERN.search(content):
+        if not incrementals or unique_keys:
             return []
-        if _UNIQUE_KEY_PATTERN.search(content):
-            return []
-        m = _INCREMENTAL_PATTERN.search(content)
-        line = _line_of(content, m.start()) if m else 1
+        line = _line_of(newlines, incrementals[0].start())
         model_name = Path(path).stem
         return [
             SQLViolation(
                 rule="INCREMENTAL_NEEDS_UNIQUE_KEY",
                 file_path=path,
                 line=line,
-                message=f"Incremental model '{model_name}' is missing unique_key. Add unique_key='<column>' to config().",
+                message=_MSG_SQL_INCREMENTAL.format(model_name),
             )
         ]
 
-    def _check_migration_rollback(self, content: str, path: str) -> list[SQLViolation]:
-        # Only applies to files in a migrations/ directory
-        if "migrations" not in str(path).replace("\\", "/"):
-            return []
-        if _ROLLBACK_MARKERS.search(content):
+    def _check_migration_rollback(
+        self, path: str, rollbacks: list[re.Match]
+    ) -> list[SQLViolation]:
+        # scan_file only calls this for files in a migrations/ directory
+        if rollbacks:
             return []
         return [
             SQLViolation(
                 rule="MIGRATION_NEEDS_ROLLBACK",
                 file_path=path,
                 line=1,
-                message="Migration missing rollback section. Add '-- rollback' marker followed by the reverse operation.",
+                message=_MSG_ROLLBACK,
             )
         ]
 
 
+def _scan_sql_path(path: str, enabled_rules: frozenset[str]) -> list[SQLViolation]:
+    """Process-pool worker for SQLConstitutionScanner.scan_paths (uncached)."""
+    return SQLConstitutionScanner().scan_file(path, enabled_rules)
+
+
+# ---------------------------------------------------------------------------
+# dbt schema.yml model entries
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _SchemaModel:
+    """The fields of one dbt model entry the YAML rules look at."""
+
+    name: str
+    line: int
+    has_description: bool
+    is_incremental: bool
+    has_unique_key: bool
+
+
 # ---------------------------------------------------------------------------
 # dbt YAML schema scanner
 # ---------------------------------------------------------------------------
@@ -219,38 +713,49 @@ class SQLConstitutionScanner:
 class DBTSchemaYAMLScanner:
     """Scans dbt schema .yml files for MODEL_DESCRIPTION_REQUIRED and INCREMENTAL_NEEDS_UNIQUE_KEY."""
 
-    def scan_yaml(self, path: str, enabled_rules: list[str]) -> list[SQLViolation]:
+    def __init__(self, cache: Optional[SQLScanCache] = None) -> None:
+        self._cache = cache
+
+    def scan_yaml(
+        self, path: str, enabled_rules: Collection[str], fail_fast: bool = False
+    ) -> list[SQLViolation]:
         """Scan a dbt schema .yml file for active rule violations.
 
         Args:
             path: Path to the .yml file.
-            enabled_rules: List of active rule IDs.
+            enabled_rules: Active rule IDs.
+            fail_fast: Stop at the first violation.
 
         Returns:
-            List of SQLViolation objects.
+            List of SQLViolation objects. With fail_fast, at most one.
         """
-        file_path = Path(path)
-        if not file_path.exists():
-            return []
-
-        try:
-            raw_content = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            return []
-
+        rules = frozenset(enabled_rules)
+        return _scan_source(
+            path, "yaml", rules, self._cache, self._scan_content, fail_fast
+        )
+
+    def _scan_content(
+        self,
+        raw_content: str,
+        path: str,
+        enabled_rules: frozenset[str],
+        fail_fast: bool = False,
+    ) -> list[SQLViolation]:
         violations: list[SQLViolation] = []
 
-        # Try PyYAML first; fall back to regex line scanning
+        # PyYAML first; regex line scanning when it is missing or the file
+        # does not parse
+        models = None
         data = self._load_yaml(raw_content)
-
         if data is not None:
-            violations.extend(
-                self._check_yaml_parsed(data, path, raw_content, enabled_rules)
-            )
+            models = self._models_from_data(data, raw_content)
+
+        if models is not None:
+            violations.extend(self._check_models(models, path, enabled_rules))
         else:
             violations.extend(self._check_yaml_regex(raw_content, path, enabled_rules))
 
-        return violations
+        return violations[:1] if fail_fast else violations
 
     # ------------------------------------------------------------------
     # YAML loading
@@ -259,60 +764,84 @@ class DBTSchemaYAMLScanner:
     @staticmethod
     def _load_yaml(content: str) -> Optional[dict]:
         """Attempt to load YAML; return None if PyYAML unavailable or parse error."""
+        if _yaml is None:
+            return None
         try:
-            import yaml
-
-            return yaml.safe_load(content)
+            return _yaml.load(content, Loader=_YAML_LOADER)
         except Exception:
             return None
 
-    # ------------------------------------------------------------------
-    # Parsed YAML checks
-    # ------------------------------------------------------------------
+    @staticmethod
+    def _name_lines(content: str) -> dict[str, int]:
+        """Map each `- name:` value to the line of its first occurrence.
 
-    def _check_yaml_parsed(
-        self, data: dict, path: str, raw_content: str, enabled_rules: list[str]
-    ) -> list[SQLViolation]:
-        violations: list[SQLViolation] = []
-        models: list[dict] = []
+        One pass over the raw YAML replaces a per-model regex search.
+        """
+        name_lines: dict[str, int] = {}
+        matches = list(_YAML_NAME_ENTRY.finditer(content))
+        newlines = _newline_offsets(content) if matches else []
+        for m in matches:
+            name_lines.setdefault(m.group(1), _line_of(newlines, m.start()))
+        return name_lines
+
+    def _models_from_data(self, data: object, raw_content: str) -> list[_SchemaModel]:
+        """Reduce a PyYAML-loaded schema document to _SchemaModel entries."""
+        models: list = []
         if isinstance(data, dict):
             models = data.get("models", []) or []
+        name_lines = self._name_lines(raw_content) if models else {}
 
+        entries: list[_SchemaModel] = []
         for model in models:
             if not isinstance(model, dict):
                 continue
             name = model.get("name", "<unnamed>")
             description = model.get("description", "")
-
-            if "MODEL_DESCRIPTION_REQUIRED" in enabled_rules:
-                if not description or not str(description).strip():
+            config = model.get("config", {}) or {}
+            entries.append(
+                _SchemaModel(
+                    name=str(name),
                     # Find approximate line in raw YAML for the model name
-                    m = re.search(rf"- name:\s*{re.escape(name)}", raw_content)
-                    line = _line_of(raw_content, m.start()) if m else 1
-                    violations.append(
-                        SQLViolation(
-                            rule="MODEL_DESCRIPTION_REQUIRED",
-                            file_path=path,
-                            line=line,
-                            message=f"Model '{name}' has no description. Add a description: field.",
-                        )
+                    line=name_lines.get(str(name), 1),
+                    has_description=bool(description and str(description).strip()),
+                    is_incremental=config.get("materialized") == "incremental",
+                    has_unique_key=bool(config.get("unique_key")),
+                )
+            )
+        return entries
+
+    # ------------------------------------------------------------------
+    # Model checks
+    # ------------------------------------------------------------------
+
+    def _check_models(
+        self, models: list[_SchemaModel], path: str, enabled_rules: frozenset[str]
+    ) -> list[SQLViolation]:
+        violations: list[SQLViolation] = []
+        for model in models:
+            if "MODEL_DESCRIPTION_REQUIRED" in enabled_rules and not model.has_description:
+                violations.append(
+                    SQLViolation(
+                        rule="MODEL_DESCRIPTION_REQUIRED",
+                        file_path=path,
+                        line=model.line,
+                        message=_MSG_DESCRIPTION.format(model.name),
                     )
+                )
 
-            if "INCREMENTAL_NEEDS_UNIQUE_KEY" in enabled_rules:
-                config = model.get("config", {}) or {}
-                if config.get("materialized") == "incremental" and not config.get(
-                    "unique_key"
-                ):
-                    m = re.search(rf"- name:\s*{re.escape(name)}", raw_content)
-                    line = _line_of(raw_content, m.start()) if m else 1
-                    violations.append(
-                        SQLViolation(
-                            rule="INCREMENTAL_NEEDS_UNIQUE_KEY",
-                            file_path=path,
-                            line=line,
-                            message=f"Incremental model '{name}' is missing unique_key in schema.yml config.",
-                        )
+            if (
+                "INCREMENTAL_NEEDS_UNIQUE_KEY" in enabled_rules
+                and model.is_incremental
+                and not model.has_unique_key
+            ):
+                violations.append(
+                    SQLViolation(
+                        rule="INCREMENTAL_NEEDS_UNIQUE_KEY",
+                        file_path=path,
+                        line=model.line,
+                        message=_MSG_YAML_INCREMENTAL.format(model.name),
                     )
+                )
 
         return violations
 
@@ -321,51 +850,44 @@ class DBTSchemaYAMLScanner:
     # ------------------------------------------------------------------
 
     def _check_yaml_regex(
-        self, content: str, path: str, enabled_rules: list[str]
+        self, content: str, path: str, enabled_rules: frozenset[str]
     ) -> list[SQLViolation]:
-        """Minimal regex-based YAML scanning when PyYAML is unavailable."""
-        violations: list[SQLViolation] = []
-        lines = content.splitlines()
-
-        model_name_pattern = re.compile(r"^\s*-\s+name:\s+(\S+)")
-        description_pattern = re.compile(r"^\s+description:\s*\S+")
-        materialized_pattern = re.compile(r"materialized:\s*['\"]?incremental['\"]?")
-        unique_key_pattern = re.compile(r"unique_key:")
-
-        i = 0
-        while i < len(lines):
-            m = model_name_pattern.match(lines[i])
-            if m:
-                model_name = m.group(1)
-                line_no = i + 1
-                # Look ahead for description within next ~10 lines
-                block_end = min(i + 15, len(lines))
-                block = lines[i:block_end]
-                block_text = "\n".join(block)
-
-                if "MODEL_DESCRIPTION_REQUIRED" in enabled_rules:
-                    if not description_pattern.search(block_text):
-                        violations.append(
-                            SQLViolation(
-                                rule="MODEL_DESCRIPTION_REQUIRED",
-                                file_path=path,
-                                line=line_no,
-                                message=f"Model '{model_name}' has no description. Add a description: field.",
-                            )
-                        )
+        """Line-based scan for schema YAML PyYAML cannot read.
 
-                if "INCREMENTAL_NEEDS_UNIQUE_KEY" in enabled_rules:
-                    if materialized_pattern.search(
-                        block_text
-                    ) and not unique_key_pattern.search(block_text):
-                        violations.append(
-                            SQLViolation(
-                                rule="INCREMENTAL_NEEDS_UNIQUE_KEY",
-                                file_path=path,
-                                line=line_no,
-                                message=f"Incremental model '{model_name}' is missing unique_key.",
-                            )
-                        )
-            i += 1
+        One pass over the lines: a `- name:` entry opens a model block that
+        stays open until a line at or left of its dash. Deeper `- name:`
+        entries (columns, tests) belong to the open model, and only keys at
+        the model's own indent (or inline on its `- name:` line) count as its
+        description. Keys are also matched inside inline flow mappings.
+        """
+        models: list[_SchemaModel] = []
+        model: Optional[_SchemaModel] = None
+        dash_indent = key_indent = 0
 
-        return violations
+        for line_no, line in enumerate(content.splitlines(), 1):
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            indent = len(line) - len(stripped)
+            if model is not None and indent <= dash_indent:
+                model = None
+            if model is None:
+                m = _YAML_MODEL_NAME_RE.match(line)
+                if m is None:
+                    continue
+                model = _SchemaModel(m.group(1), line_no, False, False, False)
+                models.append(model)
+                dash_indent = indent
+                key_indent = line.index("name:", indent)
+                # Inline keys after the name: `- name: x, description: ...`
+                rest, model_level = line[m.end():], True
+            else:
+                rest, model_level = stripped, indent == key_indent
+            if model_level and _YAML_DESCRIPTION_RE.search(rest):
+                model.has_description = True
+            if _YAML_MATERIALIZED_RE.search(rest):
+                model.is_incremental = True
+            if _YAML_UNIQUE_KEY_RE.search(rest):
+                model.has_unique_key = True
+
+        return self._check_models(models, path, enabled_rules)
@@ -6,28 +6,40 @@ captured from git HEAD) and wave end (current file content).
 
 Components:
   DDLParser         — parse CREATE TABLE DDL → column signatures (sqlglot + regex fallback)
-  SchemaSnapshot    — capture pre-wave state; persist to .claude/schema_snapshots/
+  SchemaSnapshot    — capture pre-wave state; persist to .claude/schema_snapshots/ (gzipped JSON)
   SchemaDiff        — compare pre/post snapshots; classify changes as breaking/non-breaking
   AffectedModelFinder — given a removed column, find downstream dbt models that reference it
 """
 
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
 import json
+import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
-from .sql_utils import strip_jinja, try_import_sqlglot
+from .sql_utils import PARALLEL_MIN_FILES, strip_jinja, try_import_sqlglot
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup — stdlib json is the fallback
+    _orjson = None
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColumnDef:
     """Represents a single column in a table schema."""
 
@@ -37,7 +49,7 @@ class ColumnDef:
     is_pk: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaChange:
     """Represents a single schema change between pre- and post-wave states."""
 
@@ -58,23 +70,28 @@ class SchemaDiffReport:
     wave_id: int
     has_breaking_changes: bool
     changes: list[SchemaChange] = field(default_factory=list)
+    files_skipped: int = 0  # files byte-identical to their pre-wave version
+    # Breaking subset of changes, split out once at construction
+    _breaking: list[SchemaChange] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._breaking = [c for c in self.changes if c.is_breaking]
 
     def format_blocking_message(self) -> str:
         """Format a human-readable message for blocking checkpoint output."""
         lines = [f"⚠️  Schema Breaking Changes Detected in Wave {self.wave_id}:"]
-        for c in self.changes:
-            if c.is_breaking:
-                affected = (
-                    f"\n   Affected downstream models: {', '.join(c.affected_models)}"
-                    if c.affected_models
-                    else ""
-                )
-                lines.append(
-                    f"   {c.file_path}: {c.table_name}.{c.column_name} {c.change_type}"
-                    + affected
-                )
+        for c in self._breaking:
+            affected = (
+                f"\n   Affected downstream models: {', '.join(c.affected_models)}"
+                if c.affected_models
+                else ""
+            )
+            lines.append(
+                f"   {c.file_path}: {c.table_name}.{c.column_name} {c.change_type}"
+                + affected
+            )
         lines.append(
-            f"\n🚫 Checkpoint BLOCKED: {sum(1 for c in self.changes if c.is_breaking)} "
+            f"\n🚫 Checkpoint BLOCKED: {len(self._breaking)} "
             "breaking schema change(s)\n"
             "   Review changes and mark tasks [x] only after resolving downstream impact."
         )
@@ -85,32 +102,130 @@ class SchemaDiffReport:
 # DDL Parser
 # ---------------------------------------------------------------------------
 
-# Regex fallback for CREATE TABLE column extraction
-_COL_REGEX = re.compile(
-    r"""
-    ^\s*
-    (\w+)                           # column name
-    \s+
-    ([\w]+(?:\s*\(\s*[\d,\s]+\))?)  # data type (optionally with precision)
-    (?:\s+(NOT\s+NULL|NULL))?       # nullable
-    (?:\s+.*)?                      # other constraints
-    \s*,?\s*$
-    """,
-    re.VERBOSE | re.IGNORECASE,
-)
-
 _TABLE_NAME_REGEX = re.compile(
     # Captures the fully-qualified name (e.g. mydb.myschema.orders or just orders)
     r"CREATE\s+(?:TABLE|VIEW)\s+(?:IF\s+NOT\s+EXISTS\s+)?((?:\w+\.)*\w+)",
     re.IGNORECASE,
 )
-
-_PRIMARY_KEY_REGEX = re.compile(r"\bPRIMARY\s+KEY\b", re.IGNORECASE)
-
-
-def _is_narrowing_type_change(old_type: str, new_type: str) -> bool:
-    """Return True if changing from old_type to new_type is a narrowing (breaking) change."""
-    narrowing_pairs = [
+# Zero-width split points at each CREATE TABLE / CREATE VIEW
+_CREATE_BOUNDARY_REGEX = re.compile(r"(?=CREATE\s+(?:TABLE|VIEW)\b)", re.IGNORECASE)
+_PK_TABLE_REGEX = re.compile(r"PRIMARY\s+KEY\s*\(([^)]+)\)", re.IGNORECASE)
+
+# Leading keywords of table-level constraint entries in a column list
+_CONSTRAINT_KEYWORDS = frozenset({"UNIQUE", "INDEX", "KEY", "CONSTRAINT"})
+_KEY_CONSTRAINT_KEYWORDS = frozenset({"PRIMARY", "FOREIGN"})
+
+
+def _word_end(text: str, start: int = 0) -> int:
+    """Return the index just past the run of word characters at text[start:]."""
+    i = start
+    while i < len(text) and (text[i].isalnum() or text[i] == "_"):
+        i += 1
+    return i
+
+
+def _split_top_level(body: str) -> list[str]:
+    """Split a column list on commas outside parentheses (e.g. DECIMAL(10,2))."""
+    # str.split/count do the per-character work; segments are re-joined
+    # while the running paren depth is non-zero
+    parts: list[str] = []
+    pending: list[str] = []
+    depth = 0
+    for seg in body.split(","):
+        pending.append(seg)
+        depth += seg.count("(") - seg.count(")")
+        if depth == 0:
+            parts.append(",".join(pending) if len(pending) > 1 else seg)
+            pending = []
+    if pending:
+        parts.append(",".join(pending))
+    return parts
+
+
+def _constraint_words(suffix: str) -> list[str]:
+    """Uppercased words of a column suffix that can form constraint keywords.
+
+    Scanning stops at the first `--` / `/*` comment or quoted literal, and
+    parenthesised groups (CHECK (...), DEFAULT (...)) are skipped, so
+    `DEFAULT 'NOT NULL'` or `-- NOT NULL later` do not read as constraints.
+    """
+    cut = len(suffix)
+    for marker in ("--", "/*", "'", '"'):
+        pos = suffix.find(marker)
+        if pos != -1 and pos < cut:
+            cut = pos
+    text = suffix[:cut]
+    if "(" in text:
+        kept: list[str] = []
+        depth = 0
+        for ch in text:
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth = max(depth - 1, 0)
+                ch = " "
+            if depth == 0:
+                kept.append(ch)
+            else:
+                kept.append(" ")
+        text = "".join(kept)
+    return text.upper().split()
+
+
+def _has_keyword_pair(words: list[str], first: str, second: str) -> bool:
+    """True if `first second` appear as adjacent words."""
+    return any(
+        w == first and nxt == second for w, nxt in zip(words, words[1:])
+    )
+
+
+def _tokenize_coldef(line: str) -> Optional[tuple[str, str, bool, bool]]:
+    """Split one column-list entry into (name, data_type, nullable, is_pk).
+
+    Returns None for table-level constraints and entries that do not start
+    with `<name> <type>`. The type is a word optionally followed by a
+    parenthesised argument such as (10,2) or (MAX); the constraint words
+    after it are checked for NOT NULL and PRIMARY KEY.
+    """
+    fields = line.split(None, 1)
+    if len(fields) != 2:
+        return None
+    name, rest = fields
+    first = name[: _word_end(name)].upper()
+    if first in _CONSTRAINT_KEYWORDS or (
+        first in _KEY_CONSTRAINT_KEYWORDS and rest[:3].upper() == "KEY"
+    ):
+        return None
+    if _word_end(name) != len(name):
+        return None
+
+    type_end = _word_end(rest)
+    if type_end == 0:
+        return None
+    end = type_end
+    paren = end
+    while paren < len(rest) and rest[paren].isspace():
+        paren += 1
+    if paren < len(rest) and rest[paren] == "(":
+        close = rest.find(")", paren)
+        inner = rest[paren + 1 : close]
+        if close != -1 and inner.strip() and "(" not in inner:
+            end = close + 1
+    elif end < len(rest) and not rest[end].isspace():
+        return None
+    data_type = rest[:end]
+
+    words = _constraint_words(rest[end:])
+    return (
+        name,
+        data_type,
+        not _has_keyword_pair(words, "NOT", "NULL"),
+        _has_keyword_pair(words, "PRIMARY", "KEY"),
+    )
+
+
+_NARROWING_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    [
         ("bigint", "int"),
         ("bigint", "smallint"),
         ("bigint", "tinyint"),
@@ -123,28 +238,56 @@ def _is_narrowing_type_change(old_type: str, new_type: str) -> bool:
         ("text", "varchar"),
         ("text", "char"),
     ]
-    old_norm = old_type.lower().split("(")[0].strip()
-    new_norm = new_type.lower().split("(")[0].strip()
+)
+
+
+# VARCHAR(MAX) / NVARCHAR(MAX): wider than any explicit length
+_MAX_PRECISION = 2**31 - 1
+
+
+def _type_precision(type_str: str) -> Optional[int]:
+    """Leading precision/length of a parameterised type: VARCHAR(100) → 100."""
+    start = type_str.find("(") + 1
+    end = type_str.find(",", start)
+    if end < 0:
+        end = type_str.find(")", start)
+    arg = (type_str[start:end] if end >= 0 else type_str[start:]).strip()
+    if arg.upper() == "MAX":
+        return _MAX_PRECISION
+    try:
+        return int(arg)
+    except ValueError:
+        return None
+
+
+def _is_narrowing_type_change(old_type: str, new_type: str) -> bool:
+    """Return True if changing from old_type to new_type is a narrowing (breaking) change."""
+    old_norm = old_type.partition("(")[0].strip().lower()
+    new_norm = new_type.partition("(")[0].strip().lower()
 
     # Check if precision is shrinking for same base type (e.g. VARCHAR(100) → VARCHAR(50))
     if old_norm == new_norm and "(" in old_type and "(" in new_type:
-        try:
-            old_prec = int(re.search(r"\((\d+)", old_type).group(1))  # type: ignore
-            new_prec = int(re.search(r"\((\d+)", new_type).group(1))  # type: ignore
+        old_prec = _type_precision(old_type)
+        new_prec = _type_precision(new_type)
+        if old_prec is not None and new_prec is not None:
             return new_prec < old_prec
-        except (AttributeError, ValueError):
-            pass
 
-    return (old_norm, new_norm) in narrowing_pairs
+    return (old_norm, new_norm) in _NARROWING_PAIRS
 
 
 class DDLParser:
     """Parse CREATE TABLE / CREATE VIEW DDL into column signatures.
 
     Uses sqlglot AST when available; falls back to regex for basic DDL.
-    Strips Jinja tokens before parsing (for dbt model files).
+    Strips Jinja tokens before parsing (for dbt model files). Parses are
+    memoized by cleaned SQL, so the pre-wave snapshot, the post-wave diff and
+    the interface diff of an unchanged file share one parse.
     """
 
+    def __init__(self) -> None:
+        # Resolved once per parser instead of on every parse_ddl call
+        self._sqlglot, self._exp = try_import_sqlglot()
+
     def parse_ddl(self, sql: str) -> dict[str, list[ColumnDef]]:
         """Parse DDL SQL and return a dict of table_name → [ColumnDef, ...].
 
@@ -156,11 +299,56 @@ class DDLParser:
             Returns empty dict on parse failure rather than raising.
         """
         cleaned = strip_jinja(sql)
-        sqlglot_mod, exp = try_import_sqlglot()
+        tables = _parse_cleaned(cleaned, self._sqlglot, self._exp)
+        # Fresh dict and lists per call; the ColumnDefs themselves are frozen
+        return {name: list(cols) for name, cols in tables.items()}
+
+    def parse_many(
+        self, sources: list[str], workers: Optional[int] = None
+    ) -> list[dict[str, list[ColumnDef]]]:
+        """parse_ddl for many files, spreading the parses over a process pool.
+
+        sqlglot parsing holds the GIL, so batches of at least
+        PARALLEL_MIN_FILES distinct sources are parsed in worker processes.
+        The regex fallback is cheaper than shipping its input to a worker and
+        stays serial by default, as does everything if the pool cannot start.
+
+        Args:
+            sources: SQL strings (may contain Jinja tokens).
+            workers: Worker process count (default: os.cpu_count() with
+                sqlglot, 1 without).
+
+        Returns:
+            One parse_ddl result per source, in order.
+        """
+        cleaned = [strip_jinja(sql) for sql in sources]
+        unique = list(dict.fromkeys(cleaned))
+        if workers is None:
+            workers = (os.cpu_count() or 1) if self._sqlglot is not None else 1
+
+        parsed: Optional[list[dict[str, tuple[ColumnDef, ...]]]] = None
+        if workers > 1 and len(unique) >= PARALLEL_MIN_FILES:
+            workers = min(workers, len(unique))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    parsed = list(
+                        pool.map(
+                            _parse_worker,
+                            unique,
+                            repeat(self._sqlglot is not None),
+                            chunksize=max(1, len(unique) // (4 * workers)),
+                        )
+                    )
+            except (OSError, BrokenProcessPool):
+                parsed = None  # no subprocesses here: parse serially
+        if parsed is None:
+            parsed = [_parse_cleaned(c, self._sqlglot, self._exp) for c in unique]
 
-        if sqlglot_mod is not None:
-            return self._parse_with_sqlglot(cleaned, sqlglot_mod, exp)
-        return self._parse_with_regex(cleaned)
+        by_cleaned = dict(zip(unique, parsed))
+        return [
+            {name: list(cols) for name, cols in by_cleaned[c].items()}
+            for c in cleaned
+        ]
 
     @staticmethod
     def _parse_with_sqlglot(
@@ -227,7 +415,7 @@ class DDLParser:
         result: dict[str, list[ColumnDef]] = {}
 
         # Split on CREATE TABLE / CREATE VIEW boundaries
-        blocks = re.split(r"(?=CREATE\s+(?:TABLE|VIEW)\b)", sql, flags=re.IGNORECASE)
+        blocks = _CREATE_BOUNDARY_REGEX.split(sql)
 
         for block in blocks:
             if not block.strip():
@@ -237,59 +425,33 @@ class DDLParser:
                 continue
             table_name = m.group(1)
 
-            # Extract the parenthesised column list
-            paren_match = re.search(r"\((.+)\)", block, re.DOTALL)
-            if not paren_match:
+            # Extract the parenthesised column list: first "(" to last ")"
+            open_idx = block.find("(")
+            close_idx = block.rfind(")")
+            if open_idx < 0 or close_idx <= open_idx + 1:
                 continue
 
-            body = paren_match.group(1)
+            body = block[open_idx + 1 : close_idx]
             # Find PRIMARY KEY column list if table-level
             pk_cols: set[str] = set()
-            pk_table = re.search(r"PRIMARY\s+KEY\s*\(([^)]+)\)", body, re.IGNORECASE)
+            pk_table = _PK_TABLE_REGEX.search(body)
             if pk_table:
                 pk_cols = {
                     c.strip().strip("\"'`") for c in pk_table.group(1).split(",")
                 }
 
             cols: list[ColumnDef] = []
-            # Split on commas that are NOT inside parentheses (e.g. DECIMAL(10,2))
-            _parts: list[str] = []
-            _depth = 0
-            _cur: list[str] = []
-            for _ch in body:
-                if _ch == "(":
-                    _depth += 1
-                    _cur.append(_ch)
-                elif _ch == ")":
-                    _depth -= 1
-                    _cur.append(_ch)
-                elif _ch == "," and _depth == 0:
-                    _parts.append("".join(_cur))
-                    _cur = []
-                else:
-                    _cur.append(_ch)
-            if _cur:
-                _parts.append("".join(_cur))
-            for raw_line in _parts:
-                raw_line = raw_line.strip()
-                # Skip constraint lines
-                if re.match(
-                    r"(?:PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|INDEX|KEY|CONSTRAINT)\b",
-                    raw_line,
-                    re.IGNORECASE,
-                ):
+            for raw_line in _split_top_level(body):
+                coldef = _tokenize_coldef(raw_line)
+                if coldef is None:
                     continue
-                m2 = _COL_REGEX.match(raw_line)
-                if not m2:
-                    continue
-                col_name = m2.group(1)
-                dtype = m2.group(2).strip()
-                nullable_str = (m2.group(3) or "").upper()
-                nullable = "NOT NULL" not in nullable_str
-                is_pk = col_name in pk_cols or bool(_PRIMARY_KEY_REGEX.search(raw_line))
+                col_name, dtype, nullable, is_pk = coldef
                 cols.append(
                     ColumnDef(
-                        name=col_name, data_type=dtype, nullable=nullable, is_pk=is_pk
+                        name=col_name,
+                        data_type=dtype,
+                        nullable=nullable,
+                        is_pk=is_pk or col_name in pk_cols,
                     )
                 )
 
@@ -299,11 +461,84 @@ class DDLParser:
         return result
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_cleaned(
+    cleaned: str, sqlglot_mod: object, exp: object
+) -> dict[str, tuple[ColumnDef, ...]]:
+    """Parse Jinja-stripped DDL, memoized by content and parser choice.
+
+    sqlglot_mod / exp are the try_import_sqlglot() pair; None selects the
+    regex parser.
+    """
+    if sqlglot_mod is not None:
+        tables = DDLParser._parse_with_sqlglot(cleaned, sqlglot_mod, exp)
+    else:
+        tables = DDLParser._parse_with_regex(cleaned)
+    return {name: tuple(cols) for name, cols in tables.items()}
+
+
+def _parse_worker(
+    cleaned: str, use_sqlglot: bool
+) -> dict[str, tuple[ColumnDef, ...]]:
+    """Process-pool entry point for DDLParser.parse_many.
+
+    Module objects cannot be pickled, so the worker resolves sqlglot itself.
+    """
+    sqlglot_mod, exp = try_import_sqlglot() if use_sqlglot else (None, None)
+    return _parse_cleaned(cleaned, sqlglot_mod, exp)
+
+
 # ---------------------------------------------------------------------------
 # Schema Snapshot
 # ---------------------------------------------------------------------------
 
 
+def _fingerprint(content: bytes) -> str:
+    """Content fingerprint stored per file in the pre-wave snapshot."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _read_head_blobs(paths: list[str]) -> dict[str, bytes]:
+    """Return {path: raw bytes at HEAD} via a single `git cat-file --batch`.
+
+    Paths missing at HEAD are omitted; any git error yields an empty dict.
+    """
+    if not paths:
+        return {}
+    request = "".join(f"HEAD:{p}\n" for p in paths).encode("utf-8")
+    try:
+        proc = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=request,
+            capture_output=True,
+            check=False,
+            timeout=15,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return {}
+    if proc.returncode != 0:
+        return {}
+
+    # Response per request: "<sha> <type> <size>\n<content>\n", or
+    # "<object> missing\n" when HEAD has no such path.
+    out = proc.stdout
+    blobs: dict[str, bytes] = {}
+    pos = 0
+    for path in paths:
+        eol = out.find(b"\n", pos)
+        if eol == -1:
+            break
+        header = out[pos:eol].split()
+        pos = eol + 1
+        if len(header) != 3 or not header[2].isdigit():
+            continue
+        size = int(header[2])
+        if header[1] == b"blob":
+            blobs[path] = out[pos : pos + size]
+        pos += size + 1
+    return blobs
+
+
 class SchemaSnapshot:
     """Captures and persists pre-wave SQL schema state."""
 
@@ -318,8 +553,10 @@ class SchemaSnapshot:
     ) -> None:
         """Capture SQL schema state before wave execution and persist to disk.
 
-        For each SQL file, reads the version committed at HEAD (git show HEAD:{path}).
-        New files (not in HEAD) are recorded as empty schema.
+        Reads the version of every SQL file committed at HEAD through one
+        `git cat-file --batch` process. New files (not in HEAD) are recorded as
+        empty schema. A fingerprint of each committed file lets
+        SchemaDiff.compare_post_wave skip files the wave left untouched.
 
         Args:
             wave_id: Current wave number.
@@ -333,21 +570,22 @@ class SchemaSnapshot:
 
         parser = DDLParser()
         snapshot: dict = {}
+        fingerprints: dict[str, str] = {}
+        blobs = _read_head_blobs(sql_files)
 
+        committed: list[str] = []
         for file_path in sql_files:
-            result = subprocess.run(
-                ["git", "show", f"HEAD:{file_path}"],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=15,
-            )
-            if result.returncode != 0:
-                # New file not yet committed — empty pre-state
-                snapshot[file_path] = {}
-                continue
-
-            tables = parser.parse_ddl(result.stdout)
+            blob = blobs.get(file_path)
+            # New files not yet committed have an empty pre-state
+            snapshot[file_path] = {}
+            if blob is not None:
+                fingerprints[file_path] = _fingerprint(blob)
+                committed.append(file_path)
+
+        parsed = parser.parse_many(
+            [blobs[p].decode("utf-8", errors="replace") for p in committed]
+        )
+        for file_path, tables in zip(committed, parsed):
             snapshot[file_path] = {
                 table_name: [
                     [col.name, col.data_type, col.nullable, col.is_pk] for col in cols
@@ -355,18 +593,19 @@ class SchemaSnapshot:
                 for table_name, cols in tables.items()
             }
 
-        out_file = snapshot_path / f"wave_{wave_id}_pre.json"
-        out_file.write_text(
-            json.dumps(
-                {
-                    "wave_id": wave_id,
-                    "captured_at": _time.strftime("%Y-%m-%dT%H:%M:%S"),
-                    "files": snapshot,
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        payload = {
+            "wave_id": wave_id,
+            "captured_at": _time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": snapshot,
+            "fingerprints": fingerprints,
+        }
+        if _orjson is not None:
+            encoded = _orjson.dumps(payload)
+        else:
+            encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        # Compact JSON, gzipped: column names and types repeat heavily
+        out_file = snapshot_path / f"wave_{wave_id}_pre.json.gz"
+        out_file.write_bytes(gzip.compress(encoded, compresslevel=3))
 
     @classmethod
     def load_pre_wave(
@@ -376,14 +615,28 @@ class SchemaSnapshot:
 
         Returns empty dict if snapshot not found.
         """
-        snap_file = Path(snapshot_dir) / f"wave_{wave_id}_pre.json"
-        if not snap_file.exists():
-            return {}
+        return cls._load_snapshot(wave_id, snapshot_dir).get("files", {})
+
+    @classmethod
+    def _load_snapshot(cls, wave_id: int, snapshot_dir: str) -> dict:
+        """Load the whole snapshot document ({} if missing or unreadable).
+
+        Prefers the gzipped snapshot; plain wave_{N}_pre.json files written by
+        earlier versions are still read.
+        """
+        base = Path(snapshot_dir) / f"wave_{wave_id}_pre.json"
         try:
-            data = json.loads(snap_file.read_text(encoding="utf-8"))
-            return data.get("files", {})
+            gz_file = base.with_name(base.name + ".gz")
+            if gz_file.exists():
+                raw = gzip.decompress(gz_file.read_bytes())
+            elif base.exists():
+                raw = base.read_bytes()
+            else:
+                return {}
+            data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
         except Exception:
             return {}
+        return data if isinstance(data, dict) else {}
 
 
 # ---------------------------------------------------------------------------
@@ -411,42 +664,67 @@ class SchemaDiff:
         Returns:
             SchemaDiffReport with all changes classified.
         """
-        pre_snapshot = SchemaSnapshot.load_pre_wave(wave_id, snapshot_dir)
+        snapshot = SchemaSnapshot._load_snapshot(wave_id, snapshot_dir)
+        pre_snapshot: dict = snapshot.get("files", {})
+        fingerprints: dict = snapshot.get("fingerprints", {})
         parser = DDLParser()
         changes: list[SchemaChange] = []
+        files_skipped = 0
+        # Breaking changes whose downstream models are looked up in one pass
+        # over models/ once every file has been diffed
+        pending: list[tuple[SchemaChange, tuple[str, str]]] = []
+        # (file_path, snapshot entry, current content) of files to parse
+        to_diff: list[tuple[str, Optional[dict], str]] = []
+
+        # Basename -> first snapshot key with that basename, for callers that
+        # pass paths relative to a different directory than the snapshot did
+        basename_index: dict[str, str] = {}
+        for _key in pre_snapshot:
+            basename_index.setdefault(Path(_key).name, _key)
 
         for file_path in sql_files:
-            current_content = (
-                Path(file_path).read_text(encoding="utf-8")
-                if Path(file_path).exists()
-                else ""
-            )
-            post_tables = parser.parse_ddl(current_content)
+            path = Path(file_path)
+            # EAFP: a missing file is an OSError here, not an extra stat call
+            try:
+                raw: Optional[bytes] = path.read_bytes()
+            except OSError:
+                raw = None
             # Lookup snapshot entry: try exact key first, then basename fallback
-            _snap_entry = pre_snapshot.get(file_path)
-            if _snap_entry is None:
-                _basename = Path(file_path).name
-                for _key, _val in pre_snapshot.items():
-                    if Path(_key).name == _basename:
-                        _snap_entry = _val
-                        break
-            pre_tables: dict = {
-                tbl: [ColumnDef(c[0], c[1], c[2], c[3]) for c in cols]
+            _snap_key: Optional[str] = (
+                file_path
+                if file_path in pre_snapshot
+                else basename_index.get(path.name)
+            )
+            _snap_entry = pre_snapshot.get(_snap_key) if _snap_key is not None else None
+
+            # Byte-identical to the snapshotted version: nothing can differ
+            if raw is not None and fingerprints.get(_snap_key) == _fingerprint(raw):
+                files_skipped += 1
+                continue
+
+            current_content = raw.decode("utf-8") if raw is not None else ""
+            to_diff.append((file_path, _snap_entry, current_content))
+
+        parsed = parser.parse_many([content for _, _, content in to_diff])
+        for (file_path, _snap_entry, _), post_tables in zip(to_diff, parsed):
+            # Only names and types are compared: read them straight from the
+            # snapshot's [name, type, nullable, pk] rows
+            pre_tables: dict[str, dict[str, str]] = {
+                tbl: {c[0]: c[1] for c in cols}
                 for tbl, cols in (_snap_entry or {}).items()
             }
 
             # Detect dropped tables
             for tbl in pre_tables:
                 if tbl not in post_tables:
-                    changes.append(
-                        SchemaChange(
-                            file_path=file_path,
-                            table_name=tbl,
-                            change_type="TABLE_DROPPED",
-                            is_breaking=True,
-                            affected_models=AffectedModelFinder.find_affected(tbl, ""),
-                        )
+                    change = SchemaChange(
+                        file_path=file_path,
+                        table_name=tbl,
+                        change_type="TABLE_DROPPED",
+                        is_breaking=True,
                     )
+                    changes.append(change)
+                    pending.append((change, (tbl, "")))
 
             # Detect added tables
             for tbl in post_tables:
@@ -461,28 +739,26 @@ class SchemaDiff:
                     )
                     continue
 
-                pre_cols = {c.name: c for c in pre_tables[tbl]}
-                post_cols = {c.name: c for c in post_tables[tbl]}
+                pre_cols = pre_tables[tbl]
+                post_cols = {c.name: c.data_type for c in post_tables[tbl]}
 
                 # Removed columns (breaking)
-                for col_name, col in pre_cols.items():
+                for col_name, col_type in pre_cols.items():
                     if col_name not in post_cols:
-                        affected = AffectedModelFinder.find_affected(tbl, col_name)
-                        changes.append(
-                            SchemaChange(
-                                file_path=file_path,
-                                table_name=tbl,
-                                change_type="COLUMN_REMOVED",
-                                column_name=col_name,
-                                old_value=col.data_type,
-                                new_value=None,
-                                is_breaking=True,
-                                affected_models=affected,
-                            )
+                        change = SchemaChange(
+                            file_path=file_path,
+                            table_name=tbl,
+                            change_type="COLUMN_REMOVED",
+                            column_name=col_name,
+                            old_value=col_type,
+                            new_value=None,
+                            is_breaking=True,
                         )
+                        changes.append(change)
+                        pending.append((change, (tbl, col_name)))
 
                 # Added columns (non-breaking)
-                for col_name, col in post_cols.items():
+                for col_name, col_type in post_cols.items():
                     if col_name not in pre_cols:
                         changes.append(
                             SchemaChange(
@@ -491,7 +767,7 @@ class SchemaDiff:
                                 change_type="COLUMN_ADDED",
                                 column_name=col_name,
                                 old_value=None,
-                                new_value=col.data_type,
+                                new_value=col_type,
                                 is_breaking=False,
                             )
                         )
@@ -499,8 +775,8 @@ class SchemaDiff:
                 # Type changes
                 for col_name in pre_cols:
                     if col_name in post_cols:
-                        old_t = pre_cols[col_name].data_type
-                        new_t = post_cols[col_name].data_type
+                        old_t = pre_cols[col_name]
+                        new_t = post_cols[col_name]
                         if old_t.lower() != new_t.lower():
                             is_breaking = _is_narrowing_type_change(old_t, new_t)
                             changes.append(
@@ -515,9 +791,19 @@ class SchemaDiff:
                                 )
                             )
 
+        if pending:
+            affected = AffectedModelFinder.find_affected_bulk(
+                [ref for _, ref in pending]
+            )
+            for change, ref in pending:
+                change.affected_models = list(affected[ref])
+
         has_breaking = any(c.is_breaking for c in changes)
         return SchemaDiffReport(
-            wave_id=wave_id, has_breaking_changes=has_breaking, changes=changes
+            wave_id=wave_id,
+            has_breaking_changes=has_breaking,
+            changes=changes,
+            files_skipped=files_skipped,
         )
 
 
@@ -525,13 +811,57 @@ class SchemaDiff:
 # Affected Model Finder
 # ---------------------------------------------------------------------------
 
+_WORD = re.compile(r"\w+")
+# Any ref('x') / source('s', 'x') target
+_MODEL_REF = re.compile(
+    r"""ref\s*\(\s*['"]([^'"]+)['"]\s*\)|"""
+    r"""source\s*\(\s*['"][^'"]+['"]\s*,\s*['"]([^'"]+)['"]\s*\)""",
+    re.IGNORECASE,
+)
+# (model stem, lower-cased content, words of the content) per indexed file
+_IndexedModel = tuple[str, str, frozenset[str]]
+
+
+@functools.lru_cache(maxsize=4096)
+def _affected_patterns(
+    table_name: str, column_name: str
+) -> tuple[re.Pattern, Optional[re.Pattern]]:
+    """Compiled (table ref, column word) patterns for find_affected.
+
+    str patterns, so IGNORECASE and \\b follow Unicode rules for non-ASCII
+    names, the same as lookup()'s word sets.
+    """
+    table = re.escape(table_name)
+    table_ref_pattern = re.compile(
+        rf"""(?:ref\s*\(\s*['"]({table})['"]\s*\)|"""
+        rf"""source\s*\(\s*['"][^'"]+['"]\s*,\s*['"]{table}['"]\s*\))""",
+        re.IGNORECASE,
+    )
+    col_pattern = (
+        re.compile(rf"\b{re.escape(column_name)}\b", re.IGNORECASE)
+        if column_name
+        else None
+    )
+    return table_ref_pattern, col_pattern
+
 
 class AffectedModelFinder:
     """Scans dbt model files to find downstream models referencing a column."""
 
+    @staticmethod
+    def list_model_files(models_dir: str = "models") -> list[Path]:
+        """All model .sql files under models_dir ([] if it does not exist)."""
+        models_path = Path(models_dir)
+        if not models_path.exists():
+            return []
+        return list(models_path.rglob("*.sql"))
+
     @staticmethod
     def find_affected(
-        table_name: str, column_name: str, models_dir: str = "models"
+        table_name: str,
+        column_name: str,
+        models_dir: str = "models",
+        model_files: Optional[list[Path]] = None,
     ) -> list[str]:
         """Return model names that reference table_name and column_name.
 
@@ -539,27 +869,21 @@ class AffectedModelFinder:
             table_name: Name of the table/model whose column was changed.
             column_name: Name of the removed/changed column (empty → any column).
             models_dir: Directory containing dbt model .sql files.
+            model_files: Listing from list_model_files(models_dir), so callers
+                checking many columns walk the models tree only once.
 
         Returns:
             List of model base names (without .sql extension).
         """
-        models_path = Path(models_dir)
-        if not models_path.exists():
-            return []
+        if model_files is None:
+            model_files = AffectedModelFinder.list_model_files(models_dir)
 
-        table_ref_pattern = re.compile(
-            rf"""(?:ref\s*\(\s*['"]({re.escape(table_name)})['"]\s*\)|"""
-            rf"""source\s*\(\s*['"][^'"]+['"]\s*,\s*['"]{re.escape(table_name)}['"]\s*\))""",
-            re.IGNORECASE,
-        )
-        col_pattern = (
-            re.compile(rf"\b{re.escape(column_name)}\b", re.IGNORECASE)
-            if column_name
-            else None
-        )
+        table_ref_pattern, col_pattern = _affected_patterns(table_name, column_name)
 
         affected: list[str] = []
-        for sql_file in models_path.rglob("*.sql"):
+        for sql_file in model_files:
+            # Decoded, not matched on mmap'd bytes: bytes patterns would make
+            # IGNORECASE and \b ASCII-only for non-ASCII table/column names
             try:
                 content = sql_file.read_text(encoding="utf-8", errors="replace")
             except OSError:
@@ -571,3 +895,85 @@ class AffectedModelFinder:
             affected.append(sql_file.stem)
 
         return affected
+
+    @staticmethod
+    def build_index(
+        models_dir: str = "models", model_files: Optional[list[Path]] = None
+    ) -> dict[str, list[_IndexedModel]]:
+        """Scan models_dir once and index model files by the tables they use.
+
+        Args:
+            models_dir: Directory containing dbt model .sql files.
+            model_files: Optional precomputed list_model_files(models_dir).
+
+        Returns:
+            Dict mapping each lower-cased ref()/source() target to the
+            (stem, lower-cased content, words) of every model file using it.
+        """
+        index: dict[str, list[_IndexedModel]] = {}
+        if model_files is None:
+            model_files = AffectedModelFinder.list_model_files(models_dir)
+        for sql_file in model_files:
+            # Read, not mmap'd: every indexed file keeps its decoded text and
+            # word set. One _MODEL_REF pass per file
+            # serves any number of tables, so there is no multi-pattern
+            # search for an Aho-Corasick automaton to speed up.
+            try:
+                content = sql_file.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            targets = {
+                (m.group(1) or m.group(2)).lower()
+                for m in _MODEL_REF.finditer(content)
+            }
+            if not targets:
+                continue
+            content_lower = content.lower()
+            entry = (sql_file.stem, content_lower, frozenset(_WORD.findall(content_lower)))
+            for target in targets:
+                index.setdefault(target, []).append(entry)
+        return index
+
+    @staticmethod
+    def lookup(
+        index: dict[str, list[_IndexedModel]], table_name: str, column_name: str
+    ) -> list[str]:
+        """find_affected answered from a build_index() result."""
+        column = column_name.lower()
+        word_column = bool(column) and _WORD.fullmatch(column) is not None
+        affected: list[str] = []
+        for stem, content_lower, words in index.get(table_name.lower(), ()):
+            if column:
+                if word_column:
+                    if column not in words:
+                        continue
+                elif not re.search(rf"\b{re.escape(column)}\b", content_lower):
+                    continue
+            affected.append(stem)
+        return affected
+
+    @staticmethod
+    def find_affected_bulk(
+        refs: list[tuple[str, str]],
+        models_dir: str = "models",
+        model_files: Optional[list[Path]] = None,
+    ) -> dict[tuple[str, str], list[str]]:
+        """find_affected for many (table_name, column_name) pairs at once.
+
+        Model files are read and indexed once (build_index); every pair is
+        then answered in memory.
+
+        Args:
+            refs: (table_name, column_name) pairs; empty column → any column.
+            models_dir: Directory containing dbt model .sql files.
+            model_files: Optional precomputed list_model_files(models_dir).
+
+        Returns:
+            Dict mapping each pair to the model base names referencing it.
+        """
+        if not refs:
+            return {}
+        index = AffectedModelFinder.build_index(models_dir, model_files)
+        return {
+            ref: AffectedModelFinder.lookup(index, ref[0], ref[1]) for ref in refs
+        }
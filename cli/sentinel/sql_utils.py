@@ -6,42 +6,83 @@ Used by sql_schema_diff, sql_constitution, and dbt_graph modules.
 
 from __future__ import annotations
 
+import functools
 import re
 import warnings
 from typing import Any, Optional, Tuple
 
+# Batches with fewer files than this are parsed/scanned serially. Forking
+# four workers costs ~25 ms before any work is done (far more under spawn,
+# where each worker re-imports sqlglot), while a model file parses in
+# ~0.5 ms with the regex fallback and a few ms with sqlglot. Shared by the
+# SQL scan and the schema diff; constitution_parser uses the same value.
+PARALLEL_MIN_FILES = 32
+
 # ---------------------------------------------------------------------------
 # Jinja stripping
 # ---------------------------------------------------------------------------
 
-_REF_PATTERN = re.compile(r"\{\{\s*ref\s*\(\s*['\"](\w+)['\"]\s*\)\s*\}\}", re.DOTALL)
+# Matched against a single {{ ... }} token, never the whole file
+_REF_PATTERN = re.compile(r"\{\{\s*ref\s*\(\s*['\"](\w+)['\"]\s*\)\s*\}\}")
 _SOURCE_PATTERN = re.compile(
-    r"\{\{\s*source\s*\(\s*['\"](\w+)['\"],\s*['\"](\w+)['\"]\s*\)\s*\}\}", re.DOTALL
+    r"\{\{\s*source\s*\(\s*['\"](\w+)['\"],\s*['\"](\w+)['\"]\s*\)\s*\}\}"
 )
-_JINJA_BLOCK = re.compile(r"\{\{.*?\}\}", re.DOTALL)
-_JINJA_TAG = re.compile(r"\{%.*?%\}", re.DOTALL)
 
 
+@functools.lru_cache(maxsize=128)
 def strip_jinja(sql: str) -> str:
     """Replace Jinja template tokens with valid SQL placeholders.
 
-    Transformations (in order):
+    Memoized: the constitution scan and the schema diff strip the same
+    model files, so repeat calls on identical text reuse the result.
+
+    Transformations:
       1. {{ ref('model') }}         → model
       2. {{ source('src', 'tbl') }} → src__tbl
       3. Remaining {{ ... }}        → 1
       4. {% ... %}                  → (removed)
 
+    The string is walked once, jumping between '{' characters with
+    str.find; unterminated tokens are left as they are.
+
     Args:
         sql: Raw dbt SQL that may contain Jinja syntax.
 
     Returns:
         SQL string with Jinja replaced by syntactically valid SQL tokens.
     """
-    sql = _REF_PATTERN.sub(lambda m: m.group(1), sql)
-    sql = _SOURCE_PATTERN.sub(lambda m: f"{m.group(1)}__{m.group(2)}", sql)
-    sql = _JINJA_BLOCK.sub("1", sql)
-    sql = _JINJA_TAG.sub("", sql)
-    return sql
+    out: list[str] = []
+    start = 0
+    i = sql.find("{")
+    while i != -1:
+        nxt = sql[i + 1 : i + 2]
+        if nxt == "{":
+            end = sql.find("}}", i + 2)
+            if end != -1:
+                end += 2
+                token = sql[i:end]
+                out.append(sql[start:i])
+                m = _REF_PATTERN.fullmatch(token)
+                if m:
+                    out.append(m.group(1))
+                else:
+                    m = _SOURCE_PATTERN.fullmatch(token)
+                    out.append(f"{m.group(1)}__{m.group(2)}" if m else "1")
+                start = i = end
+                i = sql.find("{", i)
+                continue
+        elif nxt == "%":
+            end = sql.find("%}", i + 2)
+            if end != -1:
+                out.append(sql[start:i])
+                start = i = end + 2
+                i = sql.find("{", i)
+                continue
+        i = sql.find("{", i + 1)
+    if not out:
+        return sql
+    out.append(sql[start:])
+    return "".join(out)
 
 
 # ---------------------------------------------------------------------------
@@ -49,9 +90,13 @@ def strip_jinja(sql: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def try_import_sqlglot() -> Tuple[Optional[Any], Optional[Any]]:
     """Attempt to import sqlglot and its expressions module.
 
+    The result is cached, so the import (and dialect registration) is paid
+    once per process rather than once per scanned file.
+
     Returns:
         (sqlglot_module, expressions_module) tuple, or (None, None) if not installed.
         Emits a single UserWarning when sqlglot is unavailable.
@@ -12,15 +12,62 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup — stdlib json is the fallback
+    _orjson = None
+
+# Upper bound on threads reading manifests concurrently
+_LOAD_WORKERS = 8
+
 
 def _find_manifests(project_root: Path) -> list[Path]:
-    """Find all manifest.json files in .claude/sentinel/."""
+    """Find all manifest.json files in .claude/sentinel/, oldest first.
+
+    One scandir over the run directories (is_dir() comes from the directory
+    listing) and one stat per manifest, which both confirms it exists and
+    supplies the mtime to sort on.
+    """
     sentinel_dir = project_root / ".claude" / "sentinel"
-    if not sentinel_dir.exists():
+    found: list[tuple[float, str]] = []
+    try:
+        with os.scandir(sentinel_dir) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                manifest = os.path.join(entry.path, "manifest.json")
+                try:
+                    found.append((os.stat(manifest).st_mtime, manifest))
+                except OSError:
+                    continue
+    except OSError:
         return []
-    return sorted(sentinel_dir.glob("*/manifest.json"), key=lambda p: p.stat().st_mtime)
+    found.sort()
+    return [Path(manifest) for _, manifest in found]
+
+
+def _load_manifest(path: Path):
+    """Parse one manifest.json (orjson when installed); None if unreadable."""
+    try:
+        raw = path.read_bytes()
+        return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+
+
+def _load_manifests(manifests: list[Path]) -> list:
+    """Load manifests concurrently, keeping order and dropping unreadable ones."""
+    if len(manifests) <= 1:
+        loaded = [_load_manifest(p) for p in manifests]
+    else:
+        workers = min(_LOAD_WORKERS, len(manifests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            loaded = list(pool.map(_load_manifest, manifests))
+    return [data for data in loaded if data is not None]
 
 
 def _shorten(text: str, max_len: int = 20) -> str:
@@ -37,12 +84,7 @@ def render_table(manifests: list[Path]) -> None:
         return
 
     rows = []
-    for m_path in manifests:
-        try:
-            data = json.loads(m_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-
+    for data in _load_manifests(manifests):
         task_id = data.get("task_id", "?")
         sentinel_id = data.get("sentinel_id", "?")
         result = data.get("result", "?")
@@ -59,7 +101,9 @@ def render_table(manifests: list[Path]) -> None:
         files_n = len(fc)
         lines_n = sum(f.get("lines_added", 0) + f.get("lines_removed", 0) for f in fc)
 
-        placeholders = len(data.get("placeholder_violations", []))
+        placeholders = str(len(data.get("placeholder_violations", [])))
+        if data.get("placeholder_scan_stopped_early"):
+            placeholders += "+"
         duration = t1.get("duration_sec", 0.0) + t2.get("duration_sec", 0.0)
 
         rows.append(
@@ -70,7 +114,7 @@ def render_table(manifests: list[Path]) -> None:
                 "iter": str(iterations),
                 "files": str(files_n),
                 "lines": str(lines_n),
-                "phold": str(placeholders),
+                "phold": placeholders,
                 "result": result,
                 "dur": f"{duration:.0f}s",
                 "cost": f"${cost:.3f}",
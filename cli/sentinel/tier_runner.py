@@ -19,6 +19,8 @@ import shutil
 import subprocess
 import sys
 import time
+import urllib.error
+import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -62,7 +64,7 @@ def sentinel_health_check(config) -> dict:
 
     # Check Ollama
     ollama_url = getattr(config, "sentinel_tier1_ollama_url", "http://localhost:11434")
-    tier1_available = check_ollama_available(ollama_url)
+    tier1_available = check_ollama_available(ollama_url, _probe_ttl(config))
     if not tier1_available:
         warnings.append(f"Ollama not reachable at {ollama_url}")
 
@@ -181,11 +183,17 @@ def sentinel_health_check(config) -> dict:
     }
 
 
-def _run_streaming_tee(cmd, env, timeout, log_path, prefix="      │ ma: "):
+def _run_streaming_tee(
+    cmd, env, timeout, log_path, prefix="      │ ma: ", on_line=None
+):
     """Run cmd streaming stdout+stderr LIVE — tee each line to log_path AND echo
     to console in real time. Makes micro-agent observable instead of a black box
     (origin 2026-05-26 — capture_output=True hid all output for up to 300s).
 
+    on_line(line) is called for every line as it arrives; if it returns True
+    the process is killed and the output so far is returned (e.g. to stop a
+    run whose streamed cost already exceeds the budget).
+
     Returns (returncode, combined_output_str). Raises subprocess.TimeoutExpired
     on timeout (so callers' existing except blocks keep working).
     """
@@ -214,9 +222,13 @@ def _run_streaming_tee(cmd, env, timeout, log_path, prefix="      │ ma: "):
                 lf.flush()
                 # echo to console live (trimmed) so the wave run is watchable
                 print(f"{prefix}{line.rstrip()[:200]}", flush=True)
+                if on_line is not None and on_line(line):
+                    proc.kill()
+                    break
         proc.wait()
     finally:
         timer.cancel()
+        proc.stdout.close()
     if timed_out["v"]:
         raise subprocess.TimeoutExpired(cmd, timeout, output="".join(lines))
     return proc.returncode, "".join(lines)
@@ -233,48 +245,132 @@ def _check_ollama_model(base_url: str, model_name: str) -> bool:
         True if the model exists in Ollama's model list.
     """
     try:
-        result = subprocess.run(
-            ["curl", "-sf", f"{base_url}/api/tags"],
-            timeout=5,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return False
-        data = json.loads(result.stdout)
+        with urllib.request.urlopen(f"{base_url}/api/tags", timeout=5) as resp:
+            data = json.load(resp)
         available = {m.get("name", "") for m in data.get("models", [])}
         return model_name in available
     except Exception:
         return False
 
 
-def check_ollama_available(base_url: str) -> bool:
+# Seconds a health probe result is reused; overridable per call / via
+# sentinel.tier1.probe_ttl. run_tiered probes once per tier, so one run against
+# a down server would otherwise pay the probe timeout for every local tier.
+_PROBE_TTL = 30.0
+# base_url -> (time.monotonic() of the probe, reachable)
+_OLLAMA_PROBE_CACHE: dict[str, tuple[float, bool]] = {}
+
+
+def invalidate_probe_cache(base_url: "str | None" = None) -> None:
+    """Forget cached Ollama probe results (all of them when base_url is None).
+
+    run_tiered calls this when a local tier fails with a connection error, so
+    the next tier probes the server again instead of trusting a cached
+    "available".
+    """
+    if base_url is None:
+        _OLLAMA_PROBE_CACHE.clear()
+    else:
+        _OLLAMA_PROBE_CACHE.pop(base_url, None)
+
+
+# Lower-cased fragments of the errors ma-loop prints when it loses the model
+# server (Node fetch / undici and Python HTTP clients)
+_CONNECTION_ERROR_MARKERS = (
+    "econnrefused",
+    "econnreset",
+    "connection refused",
+    "connection reset",
+    "fetch failed",
+    "failed to connect",
+)
+
+
+def _is_connection_error(*outputs: str) -> bool:
+    """True if any of the given outputs reports a lost server connection."""
+    return any(
+        marker in text.lower()
+        for text in outputs
+        if text
+        for marker in _CONNECTION_ERROR_MARKERS
+    )
+
+
+def check_ollama_available(base_url: str, ttl: float = _PROBE_TTL) -> bool:
     """Check whether the Ollama server is reachable.
 
-    Uses `curl -sf` for a lightweight HEAD-style probe to /api/tags.
+    Sends `HEAD /` in-process with urllib (no curl subprocess): Ollama answers
+    it without serializing its model list the way /api/tags does. The result
+    is cached per base_url for ttl seconds (ttl <= 0 always probes).
 
     Args:
         base_url: Ollama server base URL (e.g. "http://192.168.0.159:11434").
+        ttl: Seconds a previous probe result for base_url stays valid.
 
     Returns:
-        True if the server responds with exit code 0, False otherwise.
+        True if the server answers with a 2xx/3xx status (or 405 for a server
+        that rejects HEAD), False otherwise.
     """
+    cached = _OLLAMA_PROBE_CACHE.get(base_url)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    request = urllib.request.Request(f"{base_url}/", method="HEAD")
     try:
-        result = subprocess.run(
-            ["curl", "-sf", f"{base_url}/api/tags"],
-            timeout=5,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            available = 200 <= resp.status < 400
+    except urllib.error.HTTPError as exc:
+        # The server answered, it just refuses HEAD on /
+        available = exc.code == 405
     except Exception:
-        return False
+        available = False
+    _OLLAMA_PROBE_CACHE[base_url] = (time.monotonic(), available)
+    return available
+
+
+def _probe_ttl(config) -> float:
+    """sentinel_tier1_probe_ttl from config, or the module default."""
+    try:
+        return float(getattr(config, "sentinel_tier1_probe_ttl", _PROBE_TTL))
+    except (TypeError, ValueError):
+        return _PROBE_TTL
+
+
+# Cloud providers a tier's role models may name: model prefix → env vars, any
+# one of which must be set. Checked in this order after Ollama reachability.
+_PROVIDER_KEYS = (
+    ("google/", ("GOOGLE_API_KEY", "GEMINI_API_KEY")),
+    ("openai/", ("OPENAI_API_KEY",)),
+    ("groq/", ("GROQ_API_KEY",)),
+    ("cerebras/", ("CEREBRAS_API_KEY",)),
+    ("anthropic/", ("ANTHROPIC_API_KEY",)),
+)
+
+
+def _tier_skip_reason(models: dict, ollama_url: str, ttl: float) -> "str | None":
+    """Why a tier's role models cannot run here (first missing provider), or None."""
+
+    def roles_for(prefix: str) -> list:
+        return [r for r, m in models.items() if m and m.startswith(prefix)]
+
+    roles = roles_for("ollama/")
+    if roles and not check_ollama_available(ollama_url, ttl):
+        return f"Ollama not reachable at {ollama_url} (needed for: {', '.join(roles)})"
+    for prefix, keys in _PROVIDER_KEYS:
+        roles = roles_for(prefix)
+        if roles and not any(os.environ.get(k) for k in keys):
+            return f"{' / '.join(keys)} not set (needed for: {', '.join(roles)})"
+    return None
 
 
 class TierRunner:
-    """Runs the micro-agent in either Tier 1 (Ollama) or Tier 2 (cloud)."""
+    """Runs the micro-agent in either Tier 1 (Ollama) or Tier 2 (cloud).
+
+    One objective at a time: there is deliberately no batch API running
+    several run_tiered calls concurrently. Every run edits and re-tests the
+    shared working tree, and the global BudgetTracker has no lock, so
+    concurrent lanes would race on files and on its check-then-record spend.
+    """
 
     def __init__(self, config: "SentinelConfig") -> None:
         self._config = config
@@ -408,7 +504,20 @@ class TierRunner:
         )  # (tier_name, reason) — for end-of-run summary
         tier_history: list[dict] = []  # Phase B: passed to handoff request if reached
         recovery_done = False  # Goal-2: at most one cross-file recovery hop per run
-
+        ollama_url = getattr(
+            config, "sentinel_tier1_ollama_url", "http://localhost:11434"
+        )
+        # One subprocess env for the whole run, shared read-only by every tier
+        # and the recovery hop, instead of re-copying os.environ per tier.
+        tier_env = {**os.environ, "OLLAMA_BASE_URL": ollama_url}
+
+        # Tiers run strictly one after another — never speculatively in
+        # parallel. Every tier edits the same target file in the working tree
+        # and re-runs the same test command, so a concurrent cheaper and stronger
+        # tier would race on the file and judge each other's half-written
+        # edits; a later tier is also meant to start from the earlier tier's
+        # failure (tier_history → handoff). Latency is bounded per tier by the
+        # streaming timeout below and overall by max_total_duration_min.
         for tier_idx, tier in enumerate(tiers):
             tier_name = tier.get("name", f"tier-{tier_idx}")
             models = tier.get("models", {})
@@ -583,69 +692,7 @@ class TierRunner:
 
             # Per-role provider-key validation — report exactly which role(s) need which
             # missing provider so the user knows why a tier was skipped.
-            env = {**os.environ}
-            ollama_url = getattr(
-                config, "sentinel_tier1_ollama_url", "http://localhost:11434"
-            )
-            roles_needing_ollama = [
-                r for r, m in models.items() if m and m.startswith("ollama/")
-            ]
-            roles_needing_google = [
-                r for r, m in models.items() if m and m.startswith("google/")
-            ]
-            roles_needing_openai = [
-                r for r, m in models.items() if m and m.startswith("openai/")
-            ]
-            roles_needing_groq = [
-                r for r, m in models.items() if m and m.startswith("groq/")
-            ]
-            roles_needing_cerebras = [
-                r for r, m in models.items() if m and m.startswith("cerebras/")
-            ]
-            roles_needing_anthropic = [
-                r for r, m in models.items() if m and m.startswith("anthropic/")
-            ]
-            has_google_key = bool(
-                os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
-            )
-            has_openai_key = bool(os.environ.get("OPENAI_API_KEY"))
-            has_groq_key = bool(os.environ.get("GROQ_API_KEY"))
-            has_cerebras_key = bool(os.environ.get("CEREBRAS_API_KEY"))
-            has_anthropic_key = bool(os.environ.get("ANTHROPIC_API_KEY"))
-
-            skip_reason = None
-            if roles_needing_ollama:
-                env["OLLAMA_BASE_URL"] = ollama_url
-                if not check_ollama_available(ollama_url):
-                    skip_reason = (
-                        f"Ollama not reachable at {ollama_url} "
-                        f"(needed for: {', '.join(roles_needing_ollama)})"
-                    )
-            if not skip_reason and roles_needing_google and not has_google_key:
-                skip_reason = (
-                    f"GOOGLE_API_KEY / GEMINI_API_KEY not set "
-                    f"(needed for: {', '.join(roles_needing_google)})"
-                )
-            if not skip_reason and roles_needing_openai and not has_openai_key:
-                skip_reason = (
-                    f"OPENAI_API_KEY not set "
-                    f"(needed for: {', '.join(roles_needing_openai)})"
-                )
-            if not skip_reason and roles_needing_groq and not has_groq_key:
-                skip_reason = (
-                    f"GROQ_API_KEY not set "
-                    f"(needed for: {', '.join(roles_needing_groq)})"
-                )
-            if not skip_reason and roles_needing_cerebras and not has_cerebras_key:
-                skip_reason = (
-                    f"CEREBRAS_API_KEY not set "
-                    f"(needed for: {', '.join(roles_needing_cerebras)})"
-                )
-            if not skip_reason and roles_needing_anthropic and not has_anthropic_key:
-                skip_reason = (
-                    f"ANTHROPIC_API_KEY not set "
-                    f"(needed for: {', '.join(roles_needing_anthropic)})"
-                )
+            skip_reason = _tier_skip_reason(models, ollama_url, _probe_ttl(config))
             if skip_reason:
                 print(f"      ⚠️  {tier_name}: skipping — {skip_reason}")
                 skipped_tiers.append((tier_name, skip_reason))
@@ -717,11 +764,30 @@ class TierRunner:
                 returncode = 1
 
             result = _Res()
+            # Metrics parsed while ma-loop streams, so a paid tier can be
+            # stopped as soon as its reported cost passes the remaining budget
+            streamed = {"iterations": 0, "cost_usd": 0.0, "duration_sec": 0.0}
+            remaining_budget = max_cost - total_cost
+
+            def _over_budget(line: str) -> bool:
+                _update_parsed_inplace(streamed, line)
+                return not tier_is_free and streamed["cost_usd"] > remaining_budget
+
             try:
                 _timeout = max(10, min(300, (max_duration * 60) - elapsed_total + 30))
                 _rc, _out = _run_streaming_tee(
-                    cmd, {**env, "OLLAMA_BASE_URL": ollama_url}, _timeout, _log_path
+                    cmd,
+                    tier_env,
+                    _timeout,
+                    _log_path,
+                    on_line=_over_budget,
                 )
+                if not tier_is_free and streamed["cost_usd"] > remaining_budget:
+                    print(
+                        f"      🛑 {tier_name} stopped: streamed cost "
+                        f"${streamed['cost_usd']:.2f} exceeds remaining budget "
+                        f"${remaining_budget:.2f}"
+                    )
                 result.returncode = _rc
                 result.stdout = _out
                 # keep the legacy except path happy if it referenced .stderr
@@ -752,7 +818,9 @@ class TierRunner:
 
             tier_elapsed = time.time() - tier_start
             parsed = _parse_micro_agent_output(result.stdout)
-            tier_cost = parsed.get("cost_usd", 0.0)
+            # The stdout parse keeps the first Cost: figure; the streamed value
+            # is the running total, so a budget-killed tier records its real spend
+            tier_cost = max(parsed.get("cost_usd", 0.0), streamed["cost_usd"])
             passed = result.returncode == 0
 
             # #6 — don't trust micro-agent's exit code alone. Independently
@@ -794,7 +862,7 @@ class TierRunner:
                     )
                     if _recover_external_file(
                         b_file, b_objective, test_cmd, project_root,
-                        {**env, "OLLAMA_BASE_URL": ollama_url},
+                        tier_env,
                         tier, ollama_url, max_iter, _log_dir,
                     ):
                         passed, confirm_tail = _run_test_command(
@@ -877,6 +945,15 @@ class TierRunner:
                 for line in result.stdout.strip().splitlines()[-3:]:
                     print(f"      │ {tier_name} stdout: {line}")
 
+            # A local tier that lost the server outdates the cached probe: make
+            # the next Ollama tier probe again instead of trusting it for the TTL
+            if (
+                not passed
+                and any((m or "").startswith("ollama/") for m in models.values())
+                and _is_connection_error(result.stdout, result.stderr)
+            ):
+                invalidate_probe_cache(ollama_url)
+
             last_result = TierResult(
                 attempted=True,
                 skipped=False,
@@ -1174,6 +1251,90 @@ def _recover_external_file(
                 pass
 
 
+# micro-agent progress patterns, compiled once for every tier run
+_FILES_WRITTEN_RE = re.compile(r'Code written\s*\{[^}]*"file":\s*"([^"]+)"')
+# Literal-led so the engine can skip straight to each "error"; whether it
+# starts its line (after whitespace only) is checked by the caller
+_ERROR_LINE_RE = re.compile(r"error(?:\[E\d+\])?:[^\n]*")
+_TESTS_FAILED_RE = re.compile(
+    r'Tests completed\s*(\{[^}]*"failed":\s*[1-9]\d*[^}]*\})'
+)
+
+
+def _scan_metric(
+    lowered: str,
+    label: str,
+    *,
+    integer: bool = False,
+    dollar: bool = False,
+    suffix: str = "",
+) -> "str | None":
+    """Number token after the first `label` in lowered that is followed by one.
+
+    Hand-rolled, case-insensitive equivalent of the pattern
+    label, whitespace, optional '$', digits/dots, suffix: str.find jumps
+    between label occurrences and only the few characters after each are
+    inspected. One find sweep per metric still beats a single combined
+    Iterations|Cost|Duration alternation with finditer, which has no literal
+    prefix and is tried at every offset (~20x slower on a 60 KB log).
+
+    Args:
+        lowered: Lower-cased micro-agent output.
+        label: Label to find, e.g. "cost:".
+        integer: Digits only (no '.').
+        dollar: Allow one '$' before the number.
+        suffix: Text that must directly follow the number (e.g. "s").
+
+    Returns:
+        The number as text, or None if no occurrence is followed by one.
+    """
+    n = len(lowered)
+    pos = lowered.find(label)
+    while pos >= 0:
+        i = pos + len(label)
+        while i < n and lowered[i].isspace():
+            i += 1
+        if dollar and i < n and lowered[i] == "$":
+            i += 1
+        j = i
+        while j < n and (
+            lowered[j].isdecimal() or (lowered[j] == "." and not integer)
+        ):
+            j += 1
+        if j > i and lowered.startswith(suffix, j):
+            return lowered[i:j]
+        pos = lowered.find(label, pos + 1)
+    return None
+
+
+def _update_parsed_inplace(parsed: dict, line: str) -> None:
+    """Fold one streamed output line into running summary metrics.
+
+    Cost keeps the highest value seen, so a running total printed after each
+    iteration keeps raising it and the budget check sees the latest spend.
+    Iterations and duration keep the earlier value, like
+    _parse_micro_agent_output: once non-zero they are not scanned for again.
+    """
+    lowered = _strip_ansi(line).lower()
+    if not parsed["iterations"]:
+        iterations = _scan_metric(lowered, "iterations:", integer=True)
+        if iterations is not None:
+            parsed["iterations"] = int(iterations)
+    cost = _scan_metric(lowered, "cost:", dollar=True)
+    if cost is not None:
+        try:
+            parsed["cost_usd"] = max(parsed["cost_usd"], float(cost))
+        except ValueError:
+            pass
+    if not parsed["duration_sec"]:
+        duration = _scan_metric(lowered, "duration:", suffix="s")
+        if duration is not None:
+            try:
+                parsed["duration_sec"] = float(duration)
+            except ValueError:
+                pass
+
+
 def _parse_micro_agent_output(stdout: str) -> dict:
     """Extract summary metrics from micro-agent stdout.
 
@@ -1193,31 +1354,35 @@ def _parse_micro_agent_output(stdout: str) -> dict:
     # Strip PTY/ANSI noise first so the regexes can actually match.
     stdout = _strip_ansi(stdout)
 
-    iter_match = re.search(r"Iterations:\s*(\d+)", stdout, re.IGNORECASE)
-    if iter_match:
-        result["iterations"] = int(iter_match.group(1))
-
-    cost_match = re.search(r"Cost:\s*\$?([\d.]+)", stdout, re.IGNORECASE)
-    if cost_match:
-        result["cost_usd"] = float(cost_match.group(1))
-
-    dur_match = re.search(r"Duration:\s*([\d.]+)s", stdout, re.IGNORECASE)
-    if dur_match:
-        result["duration_sec"] = float(dur_match.group(1))
+    # Summary metrics: literal scan, no regex engine (lower() only folds case;
+    # digits, '.', '$' and whitespace come through unchanged)
+    lowered = stdout.lower()
+    iterations = _scan_metric(lowered, "iterations:", integer=True)
+    if iterations is not None:
+        result["iterations"] = int(iterations)
+    cost = _scan_metric(lowered, "cost:", dollar=True)
+    if cost is not None:
+        result["cost_usd"] = float(cost)
+    duration = _scan_metric(lowered, "duration:", suffix="s")
+    if duration is not None:
+        result["duration_sec"] = float(duration)
 
     # Files the artisan wrote (per iteration), e.g.:
     #   [artisan] Code written {"file":"src/foo.rs","size":2466}
-    files = re.findall(r'Code written\s*\{[^}]*"file":\s*"([^"]+)"', stdout)
+    files = _FILES_WRITTEN_RE.findall(stdout) if "Code written" in stdout else []
     result["files_written"] = list(dict.fromkeys(files))  # dedupe, keep order
 
     # Test errors driving the loop: compiler error lines + failed-test summaries.
     errors: list = []
-    for m in re.finditer(r"^\s*(error(?:\[E\d+\])?:.*)$", stdout, re.MULTILINE):
-        errors.append(m.group(1).strip())
-    for m in re.finditer(
-        r'Tests completed\s*(\{[^}]*"failed":\s*[1-9]\d*[^}]*\})', stdout
-    ):
-        errors.append("tests failed: " + m.group(1))
+    if "error" in stdout:
+        for m in _ERROR_LINE_RE.finditer(stdout):
+            start = m.start()
+            line_start = stdout.rfind("\n", 0, start) + 1
+            if line_start == start or stdout[line_start:start].isspace():
+                errors.append(m.group().strip())
+    if "Tests completed" in stdout:
+        for m in _TESTS_FAILED_RE.finditer(stdout):
+            errors.append("tests failed: " + m.group(1))
     result["errors"] = errors[:50]  # cap to keep the row small
 
     return result
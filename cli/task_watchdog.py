@@ -17,6 +17,7 @@ Task Timing Guidelines:
 """
 
 import json
+import os
 import time
 from pathlib import Path
 from datetime import datetime
@@ -26,22 +27,49 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from resolver import resolve_tasks_file  # noqa: E402
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup — stdlib json is the fallback
+    _orjson = None
+
+try:
+    from inotify_simple import INotify as _INotify, flags as _inotify_flags
+except ImportError:  # optional (Linux) — plain sleep between checks is the fallback
+    _INotify = None
+
 
 class TaskWatchdog:
     """Monitors task execution and prevents loss during context compression"""
 
-    def __init__(self, state_file: str = ".claude/task_timers.json"):
+    def __init__(
+        self, state_file: str = ".claude/task_timers.json", pretty: bool = False
+    ):
         self.state_file = Path(state_file)
+        self.pretty = pretty  # indented JSON for debugging; compact otherwise
         resolved, _reason = resolve_tasks_file()
         self.tasks_file = resolved if resolved else Path("tasks.md")
         self.state: Dict = {}
         self.check_interval = 300  # 5 minutes
+        # tasks.md lines marked [x], re-read only when the file's mtime changes
+        self._tasks_mtime: int = None
+        self._done_lines: list = []
+        # (mtime_ns, size) of the state file as last read or written by us
+        self._state_stamp: tuple = None
+        # Set by mutations; save_state writes only when there is something new
+        # (check_tasks batches a tick's completions into one write)
+        self._dirty = False
 
     def load_state(self) -> None:
         """Load task timer state from disk"""
+        stamp = self._stat_stamp(self.state_file)
+        if stamp is not None and stamp == self._state_stamp and self.state:
+            return  # unchanged since we last read or wrote it
+        self._state_stamp = None
         if self.state_file.exists():
             try:
                 self.state = json.loads(self.state_file.read_text(encoding="utf-8"))
+                self._backfill_epochs()
+                self._state_stamp = stamp
             except json.JSONDecodeError as e:
                 print("⚠️  Warning: Corrupted watchdog state file")
                 print(f"   Error: {e}")
@@ -69,54 +97,132 @@ class TaskWatchdog:
         else:
             self.state = {"running_tasks": {}, "completed_tasks": {}, "warnings": []}
 
+    def _backfill_epochs(self) -> None:
+        """Add epoch-second timestamps to running tasks saved with ISO strings only
+
+        Each timestamp is converted on its own: one that does not parse is
+        replaced by the current time with a warning, so a single bad entry
+        never discards the rest of the state.
+        """
+        now_ts = datetime.now().timestamp()
+        for task_id, task in self.state.get("running_tasks", {}).items():
+            for field in ("started_at", "last_checked"):
+                if f"{field}_epoch" in task or field not in task:
+                    continue
+                try:
+                    epoch = datetime.fromisoformat(task[field]).timestamp()
+                except (TypeError, ValueError):
+                    print(
+                        f"⚠️  Warning: {task_id} has an unreadable {field} "
+                        f"({task[field]!r}); timing it from now"
+                    )
+                    epoch = now_ts
+                task[f"{field}_epoch"] = epoch
+
     def save_state(self) -> None:
-        """Persist state to disk (survives context compression)"""
+        """Persist pending state changes to disk (survives context compression)"""
+        if not self._dirty:
+            return
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic write: fsync a temp file, then os.replace it over the
+        # state file so a crash never leaves a zero-length state behind
+        temp_file = self.state_file.with_suffix(".tmp")
         try:
-            # Atomic write: write to temp file, then rename
-            temp_file = self.state_file.with_suffix(".tmp")
-            temp_file.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
-            temp_file.rename(self.state_file)
+            data = self._encode_state()
+            with open(temp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.state_file)
+            self._fsync_dir(self.state_file.parent)
+            # In-memory state now matches disk; the next load_state can skip it
+            self._state_stamp = self._stat_stamp(self.state_file)
+            self._dirty = False
         except Exception as e:
             print(f"⚠️  Warning: Failed to save watchdog state: {e}")
-            # Don't crash, just log the error
+            # Don't crash, just log the error; the previous state file stays
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    def _encode_state(self) -> bytes:
+        """Serialize state, compact unless pretty output was requested"""
+        if _orjson is not None:
+            return _orjson.dumps(
+                self.state, option=_orjson.OPT_INDENT_2 if self.pretty else 0
+            )
+        if self.pretty:
+            return json.dumps(self.state, indent=2).encode("utf-8")
+        return json.dumps(self.state, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _stat_stamp(path: Path):
+        """(mtime_ns, size) of path, or None if it cannot be stat'ed"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Flush the directory entry so the rename itself is durable (POSIX only)"""
+        try:
+            dfd = os.open(str(directory), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            return
+        try:
+            os.fsync(dfd)
+        except OSError:
             pass
+        finally:
+            os.close(dfd)
 
     def start_task(self, task_id: str, description: str) -> None:
         """Start timer for a task"""
-        now = datetime.now().isoformat()
+        now_ts = time.time()
+        now = datetime.fromtimestamp(now_ts).isoformat()
 
+        # ISO strings are kept for display; the *_epoch fields drive the math
         self.state["running_tasks"][task_id] = {
             "description": description,
             "started_at": now,
             "last_checked": now,
+            "started_at_epoch": now_ts,
+            "last_checked_epoch": now_ts,
             "status": "running",
         }
 
         print(f"⏱️  Started timer for {task_id}: {description}")
+        self._dirty = True
         self.save_state()
 
     def complete_task(self, task_id: str) -> None:
         """Complete a task and record timing"""
+        self._complete_task(task_id)
+        self.save_state()
+
+    def _complete_task(self, task_id: str) -> None:
+        """Move a running task to completed_tasks without writing the state file"""
         if task_id not in self.state["running_tasks"]:
             print(f"⚠️  Warning: Task {task_id} not found in running tasks")
             return
 
         task = self.state["running_tasks"].pop(task_id)
-        started = datetime.fromisoformat(task["started_at"])
-        completed = datetime.now()
-        duration = (completed - started).total_seconds()
+        completed_ts = time.time()
+        duration = completed_ts - task["started_at_epoch"]
 
         self.state["completed_tasks"][task_id] = {
             "description": task["description"],
             "started_at": task["started_at"],
-            "completed_at": completed.isoformat(),
+            "completed_at": datetime.fromtimestamp(completed_ts).isoformat(),
             "duration_seconds": duration,
             "duration_human": self._format_duration(duration),
         }
 
         print(f"✅ Completed {task_id} in {self._format_duration(duration)}")
-        self.save_state()
+        self._dirty = True
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable form"""
@@ -131,7 +237,8 @@ class TaskWatchdog:
 
     def check_tasks(self) -> None:
         """Check for forgotten/lost/overdue tasks"""
-        now = datetime.now()
+        now_ts = time.time()
+        now_iso = datetime.fromtimestamp(now_ts).isoformat()
         warnings = []
 
         # Update tasks.md status
@@ -139,12 +246,12 @@ class TaskWatchdog:
 
         # Check running tasks
         for task_id, task in list(self.state["running_tasks"].items()):
-            started = datetime.fromisoformat(task["started_at"])
-            last_checked = datetime.fromisoformat(task["last_checked"])
-            duration = (now - started).total_seconds()
+            duration = now_ts - task["started_at_epoch"]
+            time_since_check = now_ts - task["last_checked_epoch"]
 
             # Update last checked
-            task["last_checked"] = now.isoformat()
+            task["last_checked"] = now_iso
+            task["last_checked_epoch"] = now_ts
 
             # Check if task exceeds 15-minute guideline
             if duration > 900:  # 15 minutes
@@ -153,7 +260,7 @@ class TaskWatchdog:
                     "task_id": task_id,
                     "description": task["description"],
                     "duration": self._format_duration(duration),
-                    "timestamp": now.isoformat(),
+                    "timestamp": now_iso,
                     "message": "Task exceeds 15-minute guideline - investigate what's happening",
                 }
                 warnings.append(warning)
@@ -163,14 +270,13 @@ class TaskWatchdog:
                 print(f"   → Investigate: {task['description']}")
 
             # Check if task might be stalled (> 15 min since last check)
-            time_since_check = (now - last_checked).total_seconds()
             if time_since_check > 900:  # 15 minutes
                 warning = {
                     "type": "possibly_stalled",
                     "task_id": task_id,
                     "description": task["description"],
                     "time_since_check": self._format_duration(time_since_check),
-                    "timestamp": now.isoformat(),
+                    "timestamp": now_iso,
                     "message": "No activity detected - task may be stalled",
                 }
                 warnings.append(warning)
@@ -179,38 +285,77 @@ class TaskWatchdog:
                 )
 
         self.state["warnings"] = warnings
+        # One write per tick, covering every completion detected above
+        self._dirty = True
         self.save_state()
 
     def _sync_with_tasks_md(self) -> None:
         """Synchronize with tasks.md to detect completed tasks"""
-        if not self.tasks_file.exists():
+        try:
+            mtime = self.tasks_file.stat().st_mtime_ns
+        except OSError:
             return
 
-        content = self.tasks_file.read_text()
+        if mtime != self._tasks_mtime:
+            content = self.tasks_file.read_text()
+            self._done_lines = [ln for ln in content.splitlines() if "[x]" in ln]
+            self._tasks_mtime = mtime
 
-        # Check each running task to see if it's marked done in tasks.md
+        # Check each running task to see if it's marked done in tasks.md.
+        # Cached lines are still consulted so tasks started since the last
+        # read are matched without re-reading an unchanged file.
         for task_id, task in list(self.state["running_tasks"].items()):
             description = task["description"]
-
-            # Look for this task in tasks.md
-            for line in content.split("\n"):
-                if description in line and "[x]" in line:
-                    # Task is marked complete!
-                    print(f"✅ Detected completion of {task_id} in tasks.md")
-                    self.complete_task(task_id)
-                    break
+            if any(description in line for line in self._done_lines):
+                # Task is marked complete!
+                print(f"✅ Detected completion of {task_id} in tasks.md")
+                self._complete_task(task_id)  # check_tasks saves once per tick
+
+    def _watch_tasks_md(self):
+        """Open an inotify watch on the tasks.md directory, or None if unavailable"""
+        if _INotify is None:
+            return None
+        try:
+            ino = _INotify()
+            ino.add_watch(
+                str(self.tasks_file.parent.resolve()),
+                _inotify_flags.CLOSE_WRITE
+                | _inotify_flags.MOVED_TO
+                | _inotify_flags.CREATE,
+            )
+        except OSError:
+            return None
+        return ino
+
+    def _wait_for_change(self, ino, timeout: float) -> None:
+        """Sleep up to `timeout` seconds, waking early when tasks.md is written"""
+        if ino is None:
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            events = ino.read(timeout=int(remaining * 1000))
+            if any(event.name == self.tasks_file.name for event in events):
+                return
 
     def run_watchdog(self, duration_minutes: int = None) -> None:
         """Run watchdog in continuous mode"""
-        print("🐕 Task Watchdog started (checking every 5 minutes)")
+        ino = self._watch_tasks_md()
+        if ino is None:
+            print("🐕 Task Watchdog started (checking every 5 minutes)")
+        else:
+            print("🐕 Task Watchdog started (checking every 5 minutes or on tasks.md change)")
         print(f"   State file: {self.state_file}")
         print("   Press Ctrl+C to stop\n")
 
         iterations = 0
-        max_iterations = (
+        deadline = (
             None
             if duration_minutes is None
-            else (duration_minutes * 60) // self.check_interval
+            else time.monotonic() + duration_minutes * 60
         )
 
         try:
@@ -226,17 +371,25 @@ class TaskWatchdog:
                 print(f"   Warnings: {len(self.state['warnings'])}")
 
                 iterations += 1
-                if max_iterations and iterations >= max_iterations:
-                    print(f"\n✅ Watchdog completed {iterations} checks")
-                    break
+                wait = self.check_interval
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        print(f"\n✅ Watchdog completed {iterations} checks")
+                        break
 
                 print("\n💤 Next check in 5 minutes...")
-                time.sleep(self.check_interval)
+                # Still ticks on timeout so the 15-minute guideline warnings fire
+                self._wait_for_change(ino, wait)
 
         except KeyboardInterrupt:
+            self.save_state()
             print("\n\n🛑 Watchdog stopped by user")
             print(f"   Completed {iterations} checks")
             sys.exit(0)
+        finally:
+            if ino is not None:
+                ino.close()
 
     def report(self) -> None:
         """Generate task timing report"""
@@ -248,9 +401,10 @@ class TaskWatchdog:
         # Running tasks
         if self.state["running_tasks"]:
             print(f"\n⏱️  Running Tasks ({len(self.state['running_tasks'])})")
+            now_ts = time.time()
             for task_id, task in self.state["running_tasks"].items():
-                started = datetime.fromisoformat(task["started_at"])
-                duration = (datetime.now() - started).total_seconds()
+                started = datetime.fromtimestamp(task["started_at_epoch"])
+                duration = now_ts - task["started_at_epoch"]
                 print(f"  {task_id}: {task['description']}")
                 print(f"    Started: {started.strftime('%Y-%m-%d %H:%M')}")
                 print(f"    Duration: {self._format_duration(duration)}")
@@ -291,10 +445,13 @@ def main():
     parser.add_argument("--task-id", help="Task ID (for start/complete)")
     parser.add_argument("--description", help="Task description (for start)")
     parser.add_argument("--duration", type=int, help="Duration in minutes (for run)")
+    parser.add_argument(
+        "--pretty", action="store_true", help="Write indented state JSON (debugging)"
+    )
 
     args = parser.parse_args()
 
-    watchdog = TaskWatchdog()
+    watchdog = TaskWatchdog(pretty=args.pretty)
     watchdog.load_state()
 
     if args.command == "start":
@@ -6,7 +6,6 @@ Tests verify that parse_task() correctly extracts constitution rules
 from task descriptions and stores them in task.constitution_rules.
 """
 
-import tempfile
 from pathlib import Path
 import sys
 
@@ -23,16 +22,12 @@ def test_basic_constitution_extraction():
   - **Constitution**: rule1, rule2, rule3
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
-
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].constitution_rules == ["rule1", "rule2", "rule3"]
-        print("✅ Basic constitution extraction: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].constitution_rules == ["rule1", "rule2", "rule3"]
+    print("✅ Basic constitution extraction: PASS")
 
 
 def test_single_constitution_rule():
@@ -42,16 +37,12 @@ def test_single_constitution_rule():
   - **Constitution**: single-rule
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
-
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].constitution_rules == ["single-rule"]
-        print("✅ Single constitution rule: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].constitution_rules == ["single-rule"]
+    print("✅ Single constitution rule: PASS")
 
 
 def test_constitution_with_spaces():
@@ -61,20 +52,16 @@ def test_constitution_with_spaces():
   - **Constitution**: rule-one, rule two with spaces, rule-three
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
-
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].constitution_rules == [
-            "rule-one",
-            "rule two with spaces",
-            "rule-three",
-        ]
-        print("✅ Constitution with spaces: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].constitution_rules == [
+        "rule-one",
+        "rule two with spaces",
+        "rule-three",
+    ]
+    print("✅ Constitution with spaces: PASS")
 
 
 def test_no_constitution_metadata():
@@ -83,16 +70,12 @@ def test_no_constitution_metadata():
 - [ ] Task without constitution
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
-
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].constitution_rules == []
-        print("✅ No constitution metadata: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].constitution_rules == []
+    print("✅ No constitution metadata: PASS")
 
 
 def test_empty_constitution():
@@ -102,16 +85,12 @@ def test_empty_constitution():
   - **Constitution**:
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
-
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].constitution_rules == []
-        print("✅ Empty constitution: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].constitution_rules == []
+    print("✅ Empty constitution: PASS")
 
 
 def test_completed_task_with_constitution():
@@ -121,17 +100,13 @@ def test_completed_task_with_constitution():
   - **Constitution**: done, verified
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
-
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        assert len(orch.tasks) == 1
-        assert orch.tasks[0].completed == True
-        assert orch.tasks[0].constitution_rules == ["done", "verified"]
-        print("✅ Completed task with constitution: PASS")
+    assert len(orch.tasks) == 1
+    assert orch.tasks[0].completed == True
+    assert orch.tasks[0].constitution_rules == ["done", "verified"]
+    print("✅ Completed task with constitution: PASS")
 
 
 def test_constitution_in_execution_plan():
@@ -141,22 +116,18 @@ def test_constitution_in_execution_plan():
   - **Constitution**: verify-before-commit, run-tests
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
+    orch.create_waves()
+    plan = orch.generate_execution_plan("test-phase")
 
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
-        orch.create_waves()
-        plan = orch.generate_execution_plan("test-phase")
+    # Verify constitution_rules in JSON output
+    wave = plan["execution_plan"]["waves"][0]
+    task = wave["tasks"][0]
 
-        # Verify constitution_rules in JSON output
-        wave = plan["execution_plan"]["waves"][0]
-        task = wave["tasks"][0]
-
-        assert "constitution_rules" in task
-        assert task["constitution_rules"] == ["verify-before-commit", "run-tests"]
-        print("✅ Constitution in execution plan: PASS")
+    assert "constitution_rules" in task
+    assert task["constitution_rules"] == ["verify-before-commit", "run-tests"]
+    print("✅ Constitution in execution plan: PASS")
 
 
 def test_multiple_tasks_mixed_constitutions():
@@ -171,18 +142,14 @@ def test_multiple_tasks_mixed_constitutions():
   - **Constitution**: rule-x, rule-y, rule-z
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(test_tasks)
-        f.flush()
-
-        orch = TaskOrchestrator(f.name)
-        orch.parse_tasks()
+    orch = TaskOrchestrator()
+    orch.parse_tasks_from_string(test_tasks)
 
-        assert len(orch.tasks) == 3
-        assert orch.tasks[0].constitution_rules == ["rule-a", "rule-b"]
-        assert orch.tasks[1].constitution_rules == []
-        assert orch.tasks[2].constitution_rules == ["rule-x", "rule-y", "rule-z"]
-        print("✅ Multiple tasks with mixed constitutions: PASS")
+    assert len(orch.tasks) == 3
+    assert orch.tasks[0].constitution_rules == ["rule-a", "rule-b"]
+    assert orch.tasks[1].constitution_rules == []
+    assert orch.tasks[2].constitution_rules == ["rule-x", "rule-y", "rule-z"]
+    print("✅ Multiple tasks with mixed constitutions: PASS")
 
 
 if __name__ == "__main__":
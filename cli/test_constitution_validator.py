@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Test suite for Constitution.validate_output() method
+Test suite for Constitution.validate_output() and validate_source()
 
 Tests comprehensive file validation including:
 - Type hints validation
@@ -15,9 +15,13 @@ from pathlib import Path
 from constitution_parser import Constitution, ConstitutionViolation
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_constitution():
-    """Create a temporary constitution file for testing"""
+    """Create a temporary constitution file for testing
+
+    Module-scoped: written and parsed once. validate_output only reads the
+    parsed sections, so sharing one instance across tests is safe.
+    """
     constitution_content = """
 # Test Constitution
 
@@ -68,6 +72,21 @@ class TestValidateOutput:
         finally:
             Path(txt_file).unlink()
 
+    def test_validate_output_skips_without_stat_or_read(
+        self, temp_constitution, tmp_path
+    ):
+        """Unsupported extensions are not stat'ed; directories are not read"""
+        import os
+        from unittest.mock import patch
+
+        (tmp_path / "pkg.py").mkdir()
+        with patch("os.path.isfile", wraps=os.path.isfile) as isfile:
+            violations = temp_constitution.validate_output(
+                [str(tmp_path / "notes.txt"), str(tmp_path / "pkg.py")]
+            )
+        assert violations == []
+        assert [c.args[0] for c in isfile.call_args_list] == [str(tmp_path / "pkg.py")]
+
     def test_validate_output_returns_structured_violations(self, temp_constitution):
         """validate_output should return ConstitutionViolation objects"""
         # Create a Python file with violations
@@ -101,98 +120,70 @@ class TestTypeHintsValidation:
 
     def test_detects_missing_return_type_hint(self, temp_constitution):
         """Should detect functions without return type hints"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def function_without_return_type(x: int):
     return x * 2
 """)
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should find violation
-            type_hint_violations = [
-                v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
-            ]
-            assert (
-                len(type_hint_violations) > 0
-            ), "Should detect missing return type hint"
 
-            # Check message
-            assert any(
-                "return type hint" in v.message.lower() for v in type_hint_violations
-            )
-        finally:
-            Path(py_file).unlink()
+        # Should find violation
+        type_hint_violations = [
+            v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
+        ]
+        assert (
+            len(type_hint_violations) > 0
+        ), "Should detect missing return type hint"
+
+        # Check message
+        assert any(
+            "return type hint" in v.message.lower() for v in type_hint_violations
+        )
 
     def test_detects_missing_parameter_type_hints(self, temp_constitution):
         """Should detect parameters without type hints"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def function_with_untyped_param(x, y: int) -> int:
     return x + y
 """)
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
 
-            # Should find violation for parameter 'x'
-            param_violations = [
-                v for v in violations if "parameter" in v.message.lower()
-            ]
-            assert (
-                len(param_violations) > 0
-            ), "Should detect missing parameter type hint"
-        finally:
-            Path(py_file).unlink()
+        # Should find violation for parameter 'x'
+        param_violations = [
+            v for v in violations if "parameter" in v.message.lower()
+        ]
+        assert (
+            len(param_violations) > 0
+        ), "Should detect missing parameter type hint"
 
     def test_allows_properly_typed_functions(self, temp_constitution):
         """Should not flag functions with proper type hints"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def properly_typed_function(x: int, y: str) -> bool:
     '''Check something'''
     return len(y) > x
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should not have type hint violations
-            type_hint_violations = [
-                v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
-            ]
-            assert (
-                len(type_hint_violations) == 0
-            ), "Should not flag properly typed function"
-        finally:
-            Path(py_file).unlink()
+        # Should not have type hint violations
+        type_hint_violations = [
+            v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
+        ]
+        assert (
+            len(type_hint_violations) == 0
+        ), "Should not flag properly typed function"
 
     def test_skips_private_methods(self, temp_constitution):
         """Should not check type hints on private methods"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def _private_function(x):
     return x * 2
 
 def __dunder_method__(self):
     return "test"
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should not flag private methods
-            type_hint_violations = [
-                v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
-            ]
-            assert len(type_hint_violations) == 0, "Should skip private methods"
-        finally:
-            Path(py_file).unlink()
+        # Should not flag private methods
+        type_hint_violations = [
+            v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"
+        ]
+        assert len(type_hint_violations) == 0, "Should skip private methods"
 
 
 class TestDocstringValidation:
@@ -200,91 +191,63 @@ class TestDocstringValidation:
 
     def test_detects_missing_function_docstring(self, temp_constitution):
         """Should detect functions without docstrings"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def function_without_docstring(x: int) -> int:
     return x * 2
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should find docstring violation
-            docstring_violations = [
-                v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
-            ]
-            assert len(docstring_violations) > 0, "Should detect missing docstring"
-            assert any("function" in v.message.lower() for v in docstring_violations)
-        finally:
-            Path(py_file).unlink()
+        # Should find docstring violation
+        docstring_violations = [
+            v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
+        ]
+        assert len(docstring_violations) > 0, "Should detect missing docstring"
+        assert any("function" in v.message.lower() for v in docstring_violations)
 
     def test_detects_missing_class_docstring(self, temp_constitution):
         """Should detect classes without docstrings"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 class MyClass:
     def method(self) -> None:
         pass
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should find docstring violation
-            docstring_violations = [
-                v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
-            ]
-            assert (
-                len(docstring_violations) > 0
-            ), "Should detect missing class docstring"
-        finally:
-            Path(py_file).unlink()
+        # Should find docstring violation
+        docstring_violations = [
+            v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
+        ]
+        assert (
+            len(docstring_violations) > 0
+        ), "Should detect missing class docstring"
 
     def test_allows_functions_with_docstrings(self, temp_constitution):
         """Should not flag functions with docstrings"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def documented_function(x: int) -> int:
     '''This function has a docstring'''
     return x * 2
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should not have docstring violations
-            docstring_violations = [
-                v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
-            ]
-            assert len(docstring_violations) == 0, "Should not flag documented function"
-        finally:
-            Path(py_file).unlink()
+        # Should not have docstring violations
+        docstring_violations = [
+            v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
+        ]
+        assert len(docstring_violations) == 0, "Should not flag documented function"
 
     def test_skips_private_functions_and_classes(self, temp_constitution):
         """Should not check docstrings on private entities"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 def _private_function(x: int) -> int:
     return x * 2
 
 class _PrivateClass:
     pass
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should not flag private entities
-            docstring_violations = [
-                v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
-            ]
-            assert len(docstring_violations) == 0, "Should skip private entities"
-        finally:
-            Path(py_file).unlink()
+        # Should not flag private entities
+        docstring_violations = [
+            v for v in violations if v.rule == "DOCSTRINGS_REQUIRED"
+        ]
+        assert len(docstring_violations) == 0, "Should skip private entities"
 
 
 class TestHardcodedSecretsDetection:
@@ -292,85 +255,57 @@ class TestHardcodedSecretsDetection:
 
     def test_detects_hardcoded_password(self, temp_constitution):
         """Should detect hardcoded passwords"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 password = "secret123"
 api_key = "abc123xyz"
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should find secret violations
-            secret_violations = [
-                v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
-            ]
-            assert len(secret_violations) >= 1, "Should detect hardcoded secrets"
-        finally:
-            Path(py_file).unlink()
+        # Should find secret violations
+        secret_violations = [
+            v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
+        ]
+        assert len(secret_violations) >= 1, "Should detect hardcoded secrets"
 
     def test_allows_environment_variable_usage(self, temp_constitution):
         """Should not flag environment variable usage"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 import os
 password = os.getenv("PASSWORD")
 api_key = os.environ.get("API_KEY")
 """)
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
 
-            # Should not have secret violations
-            secret_violations = [
-                v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
-            ]
-            assert len(secret_violations) == 0, "Should not flag env var usage"
-        finally:
-            Path(py_file).unlink()
+        # Should not have secret violations
+        secret_violations = [
+            v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
+        ]
+        assert len(secret_violations) == 0, "Should not flag env var usage"
 
     def test_allows_empty_or_none_values(self, temp_constitution):
         """Should not flag empty or None values"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 password = None
 api_key = ""
 token = ''
 """)
-            py_file = f.name
 
-        try:
-            violations = temp_constitution.validate_output([py_file])
-
-            # Should not have secret violations
-            secret_violations = [
-                v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
-            ]
-            assert len(secret_violations) == 0, "Should not flag empty/None values"
-        finally:
-            Path(py_file).unlink()
+        # Should not have secret violations
+        secret_violations = [
+            v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
+        ]
+        assert len(secret_violations) == 0, "Should not flag empty/None values"
 
     def test_skips_comments(self, temp_constitution):
         """Should not flag secrets in comments"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("""
+        violations = temp_constitution.validate_source("""
 # password = "test123"
 # This is a comment about api_key usage
 """)
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
 
-            # Should not have secret violations
-            secret_violations = [
-                v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
-            ]
-            assert len(secret_violations) == 0, "Should skip comments"
-        finally:
-            Path(py_file).unlink()
+        # Should not have secret violations
+        secret_violations = [
+            v for v in violations if v.rule == "NO_HARDCODED_SECRETS"
+        ]
+        assert len(secret_violations) == 0, "Should skip comments"
 
 
 class TestTestCoverageValidation:
@@ -378,25 +313,19 @@ class TestTestCoverageValidation:
 
     def test_detects_empty_test_file(self, temp_constitution):
         """Should detect test files with no test functions"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", prefix="test_", delete=False
-        ) as f:
-            f.write("""
+        violations = temp_constitution.validate_source(
+            """
 # Empty test file
 pass
-""")
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
+""",
+            "test_empty.py",
+        )
 
-            # Should find test coverage violation
-            coverage_violations = [
-                v for v in violations if v.rule == "TEST_COVERAGE_REQUIRED"
-            ]
-            assert len(coverage_violations) > 0, "Should detect empty test file"
-        finally:
-            Path(py_file).unlink()
+        # Should find test coverage violation
+        coverage_violations = [
+            v for v in violations if v.rule == "TEST_COVERAGE_REQUIRED"
+        ]
+        assert len(coverage_violations) > 0, "Should detect empty test file"
 
     def test_detects_missing_test_file(self, temp_constitution):
         """Should detect Python files without corresponding test files"""
@@ -462,15 +391,8 @@ def test_function() -> None:
 
     def test_skips_special_files(self, temp_constitution):
         """Should skip __init__.py, setup.py, and other special files"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.name = f.name.replace(".py", "__init__.py")
-            f.write("""
-# __init__.py file
-""")
-            py_file = f.name
-
-        try:
-            violations = temp_constitution.validate_output([py_file])
+        for name in ("__init__.py", "setup.py", "conftest.py"):
+            violations = temp_constitution.validate_source("# special file\n", name)
 
             # Should not have test coverage violations
             coverage_violations = [
@@ -480,9 +402,6 @@ def test_function() -> None:
                 and "No test file found" in v.message
             ]
             assert len(coverage_violations) == 0, "Should skip special files"
-        finally:
-            if Path(py_file).exists():
-                Path(py_file).unlink()
 
 
 class TestMultipleFilesValidation:
@@ -562,5 +481,88 @@ def bad_function():
             shutil.rmtree(temp_dir)
 
 
+    def test_parallel_validation_matches_serial(self, temp_constitution, tmp_path):
+        """Pool-validated batches should report the same violations in file order"""
+        from unittest.mock import patch
+
+        import constitution_parser
+
+        files = []
+        for i in range(6):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def f{i}(x):\n    return x\n")
+            files.append(str(path))
+        files.insert(3, str(tmp_path / "missing.py"))
+
+        serial = temp_constitution.validate_output(files, workers=1)
+        with patch.object(constitution_parser, "_PARALLEL_MIN_FILES", 2):
+            parallel = temp_constitution.validate_output(files, workers=2)
+
+        assert parallel == serial
+        assert [v.file for v in parallel] == sorted(
+            (v.file for v in parallel), key=files.index
+        )
+
+    def test_unchanged_files_not_reread(self, temp_constitution, tmp_path):
+        """Repeat validation should reuse the source until the file changes"""
+        import os
+        from unittest.mock import patch
+
+        path = tmp_path / "mod.py"
+        path.write_text("def f(x):\n    return x\n")
+        first = temp_constitution.validate_output([str(path)])
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert temp_constitution.validate_output([str(path)]) == first
+
+        path.write_text("def g(x: int) -> int:\n    return x\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        violations = temp_constitution.validate_output([str(path)])
+        assert not [v for v in violations if v.rule == "TYPE_HINTS_REQUIRED"]
+
+
+class TestActiveSqlRules:
+    """Test get_active_sql_rules() detection and caching"""
+
+    def test_active_rules_cached_until_file_changes(self, tmp_path):
+        """Should re-read the constitution only after it changes on disk"""
+        import os
+        from unittest.mock import patch
+
+        path = tmp_path / "constitution.md"
+        path.write_text("## SQL Standards\n- NO_SELECT_STAR\n- not a rule id\n")
+        constitution = Constitution(str(path))
+        assert constitution.get_active_sql_rules() == ["NO_SELECT_STAR"]
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert constitution.get_active_sql_rules() == ["NO_SELECT_STAR"]
+
+        path.write_text("## SQL Standards\n- MIGRATION_NEEDS_ROLLBACK\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert constitution.get_active_sql_rules() == ["MIGRATION_NEEDS_ROLLBACK"]
+
+
+class TestSqlFileScan:
+    """Test the batch .sql scan used by the sentinel runner"""
+
+    def test_batch_scan_matches_per_file_scan(self, tmp_path):
+        """Should report the same violations as scan_sql_file, in file order"""
+        path = tmp_path / "constitution.md"
+        path.write_text("## SQL Standards\n- NO_SELECT_STAR\n")
+        constitution = Constitution(str(path))
+        files = []
+        for i in range(4):
+            sql = tmp_path / f"m{i}.sql"
+            sql.write_text("SELECT * FROM t" if i % 2 else "SELECT id FROM t")
+            files.append(str(sql))
+
+        expected = [v for f in files for v in constitution.scan_sql_file(f)]
+        assert constitution.scan_sql_files(files) == expected
+        assert [v.file for v in expected] == files[1::2]
+        assert constitution.scan_sql_files([]) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
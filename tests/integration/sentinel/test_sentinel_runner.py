@@ -153,3 +153,57 @@ class TestPlaceholderBlocking:
         assert result.result == "FAIL"
         assert result.should_halt_wave is True
         assert len(result.placeholder_violations) > 0
+
+
+# ---------------------------------------------------------------------------
+# Scenario 6: Duplicate file_locks are scanned once
+# ---------------------------------------------------------------------------
+
+class TestDuplicateFileLocks:
+    def test_duplicate_locks_reported_once(self):
+        config = _make_config(sentinel_placeholder_fail_on_detect=True)
+        runner = SentinelRunner(config, PROJECT_ROOT)
+
+        placeholder_content = (FIXTURES / "tasks_with_placeholder.py").read_text()
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.py', prefix='sentinel_prod_', dir='/tmp', delete=False
+        ) as f:
+            f.write(placeholder_content)
+            tmp_path = f.name
+
+        once = runner.run(_task(file_locks=[tmp_path]))
+        twice = runner.run(_task(file_locks=[tmp_path, tmp_path]))
+
+        assert len(twice.placeholder_violations) == len(once.placeholder_violations)
+
+
+# ---------------------------------------------------------------------------
+# Scenario 7: full_report enumerates every placeholder violation
+# ---------------------------------------------------------------------------
+
+class TestPlaceholderFullReport:
+    def _prod_file(self, content: str) -> str:
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.py', prefix='sentinel_prod_', dir='/tmp', delete=False
+        ) as f:
+            f.write(content)
+            return f.name
+
+    def test_fail_stops_at_first_violation_by_default(self):
+        config = _make_config(sentinel_placeholder_fail_on_detect=True)
+        path = self._prod_file("# TODO: a\n# FIXME: b\n")
+        result = SentinelRunner(config, PROJECT_ROOT).run(_task(file_locks=[path]))
+        assert result.result == "FAIL"
+        assert len(result.placeholder_violations) == 1
+        assert result.placeholder_scan_stopped_early is True
+        assert "first placeholder violation (scan stopped early)" in result.error_message.lower()
+
+    def test_full_report_lists_all_violations(self):
+        config = _make_config(sentinel_placeholder_fail_on_detect=True)
+        config.sentinel_placeholder_full_report = True
+        path = self._prod_file("# TODO: a\n# FIXME: b\n")
+        result = SentinelRunner(config, PROJECT_ROOT).run(_task(file_locks=[path]))
+        assert result.result == "FAIL"
+        assert len(result.placeholder_violations) == 2
+        assert result.placeholder_scan_stopped_early is False
+        assert result.error_message.startswith("2 placeholder violation(s)")
@@ -7,6 +7,7 @@ Tests:
   - Rust regex: detects pub fn
   - Unknown file type returns empty report (no exception)
   - SyntaxError in Python content returns empty report (no exception)
+  - Bytes content: Python parsed undecoded, other languages decoded
 """
 
 import sys
@@ -170,3 +171,23 @@ class TestUnknownFileType:
         report = DIFF.compare(Path("Makefile"), "old", "new")
 
         assert report.is_breaking is False
+
+
+# ---------------------------------------------------------------------------
+# Bytes content (git blobs / read_bytes)
+# ---------------------------------------------------------------------------
+
+class TestBytesContent:
+    def test_python_bytes_parsed_directly(self):
+        pre = b"def foo(): pass\n"
+        post = b"# -*- coding: latin-1 -*-\ndef foo(): pass\ndef caf\xe9(): pass\n"
+        report = DIFF.compare(Path("src/module.py"), pre, post)
+        assert report.detection_method == "ast"
+        assert "café" in report.non_breaking_changes
+
+    def test_typescript_bytes_decoded(self):
+        report = DIFF.compare(
+            Path("src/a.ts"), b"export function a() {}\n", b"export function b() {}\n"
+        )
+        assert report.breaking_changes == ["a"]
+        assert report.non_breaking_changes == ["b"]
@@ -6,6 +6,7 @@ Tests:
   - diff.patch written (empty bytes when no files)
   - summary.md written for PASS and FAIL cases
   - No exception raised on FAIL result
+  - A placeholder scan that stopped early is labelled in manifest.json and summary.md
   - Output directory created if it does not exist
 """
 
@@ -20,7 +21,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from cli.sentinel.manifest_writer import ManifestWriter
-from cli.sentinel import ManifestData, ManifestPaths, TierResult
+from cli.sentinel import ManifestData, ManifestPaths, PlaceholderViolation, TierResult
 
 
 # ---------------------------------------------------------------------------
@@ -113,6 +114,18 @@ class TestManifestJson:
         assert len(manifest["files_changed"]) == 1
         assert manifest["files_changed"][0]["path"] == "src/auth.py"
 
+    def test_placeholder_scan_stopped_early_stored(self):
+        out = _tmp_dir() / "SENTINEL-T016"
+        data = _make_data(result="FAIL")
+        data.placeholder_violations = [
+            PlaceholderViolation("src/auth.py", 3, r"TODO", "TODO")
+        ]
+        data.placeholder_scan_stopped_early = True
+        paths = ManifestWriter(out).write(data)
+        manifest = json.loads(paths.manifest_json.read_text())
+        assert manifest["placeholder_scan_stopped_early"] is True
+        assert "first violation — scan stopped early" in paths.summary_md.read_text()
+
 
 # ---------------------------------------------------------------------------
 # diff.patch
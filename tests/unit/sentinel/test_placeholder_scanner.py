@@ -6,6 +6,8 @@ Tests:
   - Excluded paths (tests/, __mocks__/, *.test.py, *.spec.ts) are never flagged
   - fail_on_detect=false: violations returned but caller decides (scanner just returns list)
   - Clean file → empty violation list
+  - Pre-read contents are scanned without touching disk
+  - stop_on_first returns after the first violation
 """
 
 import sys
@@ -16,7 +18,7 @@ from unittest.mock import MagicMock
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from cli.sentinel.placeholder_scanner import PlaceholderScanner
+from cli.sentinel.placeholder_scanner import PlaceholderScanner, scan_sql_file
 
 
 def _make_scanner(extra_patterns=None, extra_excludes=None):
@@ -169,3 +171,38 @@ class TestContextLines:
         # Should have context lines
         assert len(violations[0].context_lines) > 1
         f.unlink()
+
+
+# ---------------------------------------------------------------------------
+# Pre-read contents
+# ---------------------------------------------------------------------------
+
+class TestPreReadContents:
+    def test_contents_used_instead_of_disk(self):
+        f = _tmp_file("x = 1\n")
+        scanner = _make_scanner()
+        violations = scanner.scan([f], {f: b"# TODO: from memory\n"})
+        assert len(violations) == 1
+        assert violations[0].matched_text == "TODO"
+        f.unlink()
+
+    def test_sql_content_used_instead_of_disk(self):
+        violations = scan_sql_file("missing.sql", "SELECT 1\n-- TODO: real model\n")
+        assert {v.pattern_type for v in violations} == {"SELECT_ONE", "TODO_COMMENT"}
+
+
+# ---------------------------------------------------------------------------
+# Early exit
+# ---------------------------------------------------------------------------
+
+class TestStopOnFirst:
+    def test_stops_after_first_violation(self):
+        f = _tmp_file("# TODO: one\n# FIXME: two\n")
+        g = _tmp_file("# HACK: three\n")
+        scanner = _make_scanner()
+        assert len(scanner.scan([f, g])) == 3
+        violations = scanner.scan([f, g], stop_on_first=True)
+        assert len(violations) == 1
+        assert violations[0].line_number == 1
+        f.unlink()
+        g.unlink()
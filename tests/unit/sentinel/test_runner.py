@@ -0,0 +1,325 @@
+"""
+Unit tests for cli/sentinel/runner.py helpers
+
+Tests:
+  - detect_test_command auto-detects from project markers
+  - Config override wins over auto-detect
+  - file_locks entries need a real file extension
+  - Auto-detect result is cached and invalidated when a marker changes
+  - A SentinelRunner resolves its test command once
+  - HEAD blob lookup batches every path through one git process
+  - git calls see the live environment plus the read-only overrides
+  - files_changed line counts come from one git diff --numstat call
+  - Cascade interface reports keep file order when diffed concurrently
+  - Files unchanged since HEAD or without a diffable extension are skipped
+  - Interface diffs are memoized across runners by file stat + HEAD blob
+  - File bytes read for the placeholder scan are reused by the cascade diff
+  - Prefetched HEAD blobs / execution plan feed the cascade phase
+  - Prefetch reads HEAD blobs only for files changed since HEAD
+  - A file changed after the prefetch is still diffed against HEAD
+  - A health-check SKIP never starts the prefetch; the pool is always shut down
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.sentinel import SentinelResult
+from cli.sentinel import runner as runner_mod
+from cli.sentinel.runner import SentinelRunner, _has_extension, detect_test_command
+
+
+def _project(**files: str) -> Path:
+    """Create a temp project dir containing the given marker files."""
+    root = Path(tempfile.mkdtemp())
+    for name, content in files.items():
+        (root / name.replace("__", ".")).write_text(content, encoding="utf-8")
+    return root
+
+
+def _git_repo(**files: str) -> Path:
+    """Create a temp git repo with the given files committed at HEAD."""
+    root = _project(**files)
+    git = ["git", "-c", "user.email=t@t", "-c", "user.name=t"]
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=root, check=True)
+    return root
+
+
+# ---------------------------------------------------------------------------
+# detect_test_command
+# ---------------------------------------------------------------------------
+
+class TestDetectTestCommand:
+    def test_pyproject_detected(self):
+        root = _project(pyproject__toml="[project]\n")
+        assert detect_test_command(root) == "python -m pytest"
+
+    def test_vitest_detected(self):
+        root = _project(package__json='{"devDependencies": {"vitest": "1"}}')
+        assert detect_test_command(root) == "npx vitest run"
+
+    def test_vitest_detected_without_orjson(self):
+        root = _project(package__json='{"dependencies": {"vitest": "1"}}')
+        with patch.object(runner_mod, "_orjson", None):
+            assert detect_test_command(root) == "npx vitest run"
+
+    def test_nothing_detected(self):
+        assert detect_test_command(_project()) is None
+
+    def test_config_override_wins(self):
+        root = _project(pyproject__toml="[project]\n")
+        config = SimpleNamespace(sentinel_test_command="make test")
+        assert detect_test_command(root, config) == "make test"
+
+    def test_result_cached_between_calls(self):
+        root = _project(Cargo__toml="[package]\n")
+        assert detect_test_command(root) == "cargo test"
+        with patch.object(runner_mod, "_autodetect_test_command") as detect:
+            assert detect_test_command(root) == "cargo test"
+        detect.assert_not_called()
+
+    def test_cache_invalidated_when_marker_changes(self):
+        root = _project(package__json='{"scripts": {"test": "jest"}}')
+        assert detect_test_command(root) == "npm test"
+        pkg = root / "package.json"
+        pkg.write_text('{"dependencies": {"vitest": "1"}}', encoding="utf-8")
+        st = pkg.stat()
+        os.utime(pkg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert detect_test_command(root) == "npx vitest run"
+
+
+    def test_runner_resolves_command_once(self):
+        runner = SentinelRunner(None, _project(pyproject__toml="[project]\n"))
+        with patch.object(
+            runner_mod, "detect_test_command", return_value="python -m pytest"
+        ) as detect:
+            assert runner._test_command() == "python -m pytest"
+            assert runner._test_command() == "python -m pytest"
+        detect.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# file_locks filtering
+# ---------------------------------------------------------------------------
+
+class TestHasExtension:
+    def test_regular_files_accepted(self):
+        assert _has_extension("src/auth.py")
+        assert _has_extension("models/orders.sql")
+
+    def test_dotted_dirs_and_dotfiles_rejected(self):
+        assert not _has_extension("a.b/c")
+        assert not _has_extension(".git")
+        assert not _has_extension("")
+        assert not _has_extension(None)
+
+
+# ---------------------------------------------------------------------------
+# HEAD blob lookup
+# ---------------------------------------------------------------------------
+
+class TestReadHeadBlobs:
+    def test_returns_committed_content_and_omits_missing(self):
+        root = _git_repo(a__py="def a():\n    pass\n", b__py="x = 1\n")
+        (root / "a.py").write_text("def b():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(None, root)
+        blobs = runner._read_head_blobs(["a.py", "new.py", "b.py"])
+        assert blobs == {"a.py": b"def a():\n    pass\n", "b.py": b"x = 1\n"}
+
+    def test_single_git_process(self):
+        root = _git_repo(a__py="a = 1\n", b__py="b = 2\n")
+        runner = SentinelRunner(None, root)
+        runner._repo = None  # force the git CLI path even if pygit2 is installed
+        with patch("cli.sentinel.runner.subprocess.run", wraps=subprocess.run) as run:
+            runner._read_head_blobs(["a.py", "b.py"])
+        assert run.call_count == 1
+
+    def test_not_a_repo_returns_empty(self):
+        runner = SentinelRunner(None, _project(a__py="a = 1\n"))
+        assert runner._read_head_blobs(["a.py"]) == {}
+
+    def test_git_sees_current_environment(self):
+        runner = SentinelRunner(None, _project())
+        with patch.dict(os.environ, {"DK_TEST_MARKER": "late"}), \
+                patch("cli.sentinel.runner.subprocess.run") as run:
+            runner._git("status")
+        env = run.call_args.kwargs["env"]
+        assert env["DK_TEST_MARKER"] == "late"
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+
+
+# ---------------------------------------------------------------------------
+# files_changed (git diff --numstat)
+# ---------------------------------------------------------------------------
+
+class TestComputeFilesChanged:
+    def test_line_counts_from_single_numstat_call(self):
+        root = _git_repo(a__py="a = 1\n", b__py="b = 1\n")
+        (root / "a.py").write_text("a = 2\nc = 3\n", encoding="utf-8")
+        (root / "new.py").write_text("n = 1\n", encoding="utf-8")
+        runner = SentinelRunner(None, root)
+        files = [root / "a.py", root / "b.py", root / "new.py", root / "gone.py"]
+        with patch("cli.sentinel.runner.subprocess.run", wraps=subprocess.run) as run:
+            changed = runner._compute_files_changed(files)
+        assert run.call_count == 1
+        assert changed == [
+            {"path": "a.py", "lines_added": 2, "lines_removed": 1},
+            {"path": "b.py", "lines_added": 0, "lines_removed": 0},
+            {"path": "new.py", "lines_added": 0, "lines_removed": 0},
+        ]
+
+
+    def test_non_ascii_path_matched(self):
+        root = _git_repo(**{"café__py": "a = 1\n"})
+        (root / "café.py").write_text("a = 2\nb = 3\n", encoding="utf-8")
+        runner = SentinelRunner(None, root)
+        changed = runner._compute_files_changed([root / "café.py"])
+        assert changed == [{"path": "café.py", "lines_added": 2, "lines_removed": 1}]
+        assert runner._changed_since_head(["café.py"]) == {"café.py"}
+
+
+# ---------------------------------------------------------------------------
+# Cascade phase interface diff
+# ---------------------------------------------------------------------------
+
+class TestCascadeInterfaceDiff:
+    def test_reports_follow_file_order(self):
+        root = _git_repo(
+            a__py="def keep():\n    pass\n\ndef old():\n    pass\n",
+            b__py="def b():\n    pass\n",
+        )
+        (root / "a.py").write_text("def keep():\n    pass\n", encoding="utf-8")
+        (root / "b.py").write_text("def b(x):\n    pass\n", encoding="utf-8")
+        (root / "c.py").write_text("def c():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        files = [root / "c.py", root / "a.py", root / "b.py"]
+        runner._run_cascade_phase(result, files)
+        reports = result.interface_reports
+        assert [Path(r.file_path).name for r in reports] == ["c.py", "a.py", "b.py"]
+        assert reports[0].non_breaking_changes == ["c"]
+        assert reports[1].breaking_changes == ["old"]
+        assert reports[2].modified_signatures[0]["name"] == "b"
+
+    def test_unchanged_files_not_diffed(self):
+        root = _git_repo(a__py="def a():\n    pass\n", b__py="def b():\n    pass\n")
+        (root / "a.py").write_text("def a2():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        runner._run_cascade_phase(result, [root / "a.py", root / "b.py"])
+        assert [Path(r.file_path).name for r in result.interface_reports] == ["a.py"]
+
+    def test_diff_reused_across_runners(self):
+        root = _git_repo(a__py="def a():\n    pass\n")
+        (root / "a.py").write_text("def b():\n    pass\n", encoding="utf-8")
+        first = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        SentinelRunner(SimpleNamespace(), root)._run_cascade_phase(first, [root / "a.py"])
+        second = SentinelResult(task_id="T2", sentinel_id="SENTINEL-T2")
+        with patch("cli.sentinel.runner.InterfaceDiff.compare") as compare:
+            SentinelRunner(SimpleNamespace(), root)._run_cascade_phase(
+                second, [root / "a.py"]
+            )
+        compare.assert_not_called()
+        assert second.interface_reports == first.interface_reports
+
+    def test_file_read_once_across_phases(self):
+        root = _git_repo(a__py="def a():\n    pass\n")
+        (root / "a.py").write_text("def fresh():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        runner._read_files([root / "a.py"])
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            runner._run_cascade_phase(result, [root / "a.py"])
+        assert result.interface_reports[0].non_breaking_changes == ["fresh"]
+
+    def test_prefetched_inputs_used(self):
+        root = _git_repo(a__py="def a():\n    pass\n")
+        (root / "a.py").write_text("def b():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        prefetch = Future()
+        prefetch.set_result(runner._prefetch_cascade_inputs([root / "a.py"]))
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        with patch.object(SentinelRunner, "_read_head_blobs") as blobs:
+            runner._run_cascade_phase(result, [root / "a.py"], prefetch)
+        blobs.assert_not_called()
+        assert result.interface_reports[0].breaking_changes == ["a"]
+        assert result.files_changed[0]["path"] == "a.py"
+
+    def test_non_code_files_not_diffed(self):
+        root = _git_repo(a__md="# a\n")
+        (root / "a.md").write_text("# b\n", encoding="utf-8")
+        (root / "notes.json").write_text("{}", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        with patch.object(SentinelRunner, "_read_head_blobs") as blobs:
+            runner._run_cascade_phase(result, [root / "a.md", root / "notes.json"])
+        blobs.assert_called_once_with([])
+        assert result.interface_reports == []
+
+    def test_changed_since_head_includes_untracked(self):
+        root = _git_repo(a__py="a = 1\n", b__py="b = 1\n")
+        (root / "a.py").write_text("a = 2\n", encoding="utf-8")
+        (root / "new.py").write_text("n = 1\n", encoding="utf-8")
+        runner = SentinelRunner(None, root)
+        assert runner._changed_since_head(["a.py", "b.py", "new.py"]) == {"a.py", "new.py"}
+
+    def test_prefetch_reads_only_changed_files(self):
+        root = _git_repo(a__py="def a():\n    pass\n", b__py="def b():\n    pass\n")
+        (root / "a.py").write_text("def a2():\n    pass\n", encoding="utf-8")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        blobs, looked_up, _plan = runner._prefetch_cascade_inputs(
+            [root / "a.py", root / "b.py"]
+        )
+        assert blobs == {"a.py": b"def a():\n    pass\n"}
+        assert looked_up == {"a.py"}
+
+    def test_file_changed_after_prefetch_still_diffed(self):
+        root = _git_repo(a__py="def a():\n    pass\n")
+        runner = SentinelRunner(SimpleNamespace(), root)
+        prefetch = Future()
+        prefetch.set_result(runner._prefetch_cascade_inputs([root / "a.py"]))
+        (root / "a.py").write_text("def b():\n    pass\n", encoding="utf-8")
+        result = SentinelResult(task_id="T1", sentinel_id="SENTINEL-T1")
+        runner._run_cascade_phase(result, [root / "a.py"], prefetch)
+        assert result.interface_reports[0].breaking_changes == ["a"]
+
+
+# ---------------------------------------------------------------------------
+# run() prefetch lifecycle
+# ---------------------------------------------------------------------------
+
+class TestRunPrefetch:
+    def _run(self, root: Path, health: dict):
+        runner = SentinelRunner(None, root)
+        task = {"task_id": "T1", "file_locks": ["a.py"]}
+        with patch.object(SentinelRunner, "_test_command", return_value="pytest"), \
+                patch.object(SentinelRunner, "_safe_write_manifest"), \
+                patch.object(runner_mod, "sentinel_health_check", return_value=health), \
+                patch.object(runner_mod, "ThreadPoolExecutor") as pool_cls, \
+                patch.object(runner_mod, "TierRunner", side_effect=RuntimeError("x")), \
+                patch.object(SentinelRunner, "_run_cascade_phase"):
+            result = runner.run(task)
+        return result, pool_cls
+
+    def test_skip_before_test_loop_starts_no_prefetch(self):
+        root = _git_repo(a__py="a = 1\n")
+        result, pool_cls = self._run(root, {"any_tier_available": False, "warnings": []})
+        assert result.result == "SKIP"
+        pool_cls.assert_not_called()
+
+    def test_prefetch_pool_shut_down_after_cascade(self):
+        root = _git_repo(a__py="a = 1\n")
+        _result, pool_cls = self._run(root, {"any_tier_available": True, "warnings": []})
+        pool_cls.return_value.shutdown.assert_called_once_with(
+            wait=False, cancel_futures=True
+        )
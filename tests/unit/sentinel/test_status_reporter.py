@@ -0,0 +1,75 @@
+"""
+Unit tests for cli/sentinel/status_reporter.py
+
+Tests:
+  - Manifests found one level below .claude/sentinel/, oldest first
+  - Missing sentinel directory yields no manifests
+  - Manifests load concurrently in order; unreadable ones are dropped
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.sentinel import status_reporter
+from cli.sentinel.status_reporter import _find_manifests, _load_manifests, render_table
+
+
+# ---------------------------------------------------------------------------
+# _find_manifests
+# ---------------------------------------------------------------------------
+
+class TestFindManifests:
+    def test_sorted_by_manifest_mtime(self, tmp_path):
+        sentinel_dir = tmp_path / ".claude" / "sentinel"
+        for i, name in enumerate(["SENTINEL-T2", "SENTINEL-T1", "SENTINEL-T3"]):
+            run = sentinel_dir / name
+            run.mkdir(parents=True)
+            manifest = run / "manifest.json"
+            manifest.write_text("{}", encoding="utf-8")
+            os.utime(manifest, (1_000 + i, 1_000 + i))
+        (sentinel_dir / "no-manifest").mkdir()
+        (sentinel_dir / "stray.json").write_text("{}", encoding="utf-8")
+
+        manifests = _find_manifests(tmp_path)
+        assert [p.parent.name for p in manifests] == [
+            "SENTINEL-T2",
+            "SENTINEL-T1",
+            "SENTINEL-T3",
+        ]
+
+    def test_missing_sentinel_dir(self, tmp_path):
+        assert _find_manifests(tmp_path) == []
+
+
+# ---------------------------------------------------------------------------
+# Manifest loading
+# ---------------------------------------------------------------------------
+
+class TestLoadManifests:
+    def _manifests(self, tmp_path):
+        paths = []
+        for i, body in enumerate(['{"task_id": "T1"}', "not json", '{"task_id": "T3"}']):
+            path = tmp_path / f"m{i}.json"
+            path.write_text(body, encoding="utf-8")
+            paths.append(path)
+        return paths + [tmp_path / "missing.json"]
+
+    def test_order_kept_and_bad_manifests_dropped(self, tmp_path):
+        loaded = _load_manifests(self._manifests(tmp_path))
+        assert [d["task_id"] for d in loaded] == ["T1", "T3"]
+
+    def test_stdlib_json_fallback(self, tmp_path):
+        with patch.object(status_reporter, "_orjson", None):
+            loaded = _load_manifests(self._manifests(tmp_path))
+        assert [d["task_id"] for d in loaded] == ["T1", "T3"]
+
+    def test_render_table_rows(self, tmp_path, capsys):
+        render_table(self._manifests(tmp_path))
+        out = capsys.readouterr().out
+        assert "T1" in out and "T3" in out
+        assert "Session totals: 2 run(s)" in out
@@ -2,16 +2,24 @@
 Unit tests for cli/sentinel/tier_runner.py
 
 Tests:
-  - check_ollama_available: reachable vs unreachable
+  - check_ollama_available: reachable vs unreachable, TTL-cached probe
   - TierRunner.run_tier1: success, failure, Ollama unreachable → skip
   - TierRunner.run_tier2: success, failure, no API key
   - _parse_micro_agent_output: various stdout formats
+  - Streaming: metrics parsed per line, on_line can stop the run early
+  - Streamed cost follows a running total so the budget kill can fire
+  - _tier_skip_reason: first unreachable / unconfigured provider per tier
+  - run_tiered re-probes Ollama after a tier fails with a connection error
+  - run_tiered records the streamed running cost of a budget-killed tier
 """
 
 import sys
 import os
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 import subprocess
 
 # Ensure project root is on sys.path
@@ -21,7 +29,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from cli.sentinel.tier_runner import (
     TierRunner,
     check_ollama_available,
+    invalidate_probe_cache,
+    _check_ollama_model,
     _parse_micro_agent_output,
+    _run_streaming_tee,
+    _tier_skip_reason,
+    _update_parsed_inplace,
 )
 
 
@@ -50,6 +63,35 @@ def _make_config(
     return cfg
 
 
+def _response(status=200):
+    """urlopen() stand-in: a context manager yielding a response with status."""
+    resp = MagicMock()
+    resp.__enter__.return_value.status = status
+    return resp
+
+
+def _serve(routes: dict) -> ThreadingHTTPServer:
+    """Serve {path: body} on an ephemeral localhost port in a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = routes.get(self.path)
+            self.send_response(200 if body is not None else 404)
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+        def do_HEAD(self):
+            self.send_response(200 if self.path in routes else 404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
 def _completed(returncode=0, stdout="", stderr=""):
     proc = MagicMock()
     proc.returncode = returncode
@@ -63,22 +105,69 @@ def _completed(returncode=0, stdout="", stderr=""):
 # ---------------------------------------------------------------------------
 
 class TestCheckOllamaAvailable:
+    def setup_method(self):
+        invalidate_probe_cache()
+
     def test_reachable_returns_true(self):
-        with patch("subprocess.run", return_value=_completed(0)):
+        with patch("urllib.request.urlopen", return_value=_response(200)):
             assert check_ollama_available("http://localhost:11434") is True
 
-    def test_non_zero_exit_returns_false(self):
-        with patch("subprocess.run", return_value=_completed(1)):
+    def test_http_error_returns_false(self):
+        error = urllib.error.HTTPError("http://x", 500, "boom", {}, None)
+        with patch("urllib.request.urlopen", side_effect=error):
             assert check_ollama_available("http://localhost:11434") is False
 
+    def test_head_request_to_root(self):
+        with patch("urllib.request.urlopen", return_value=_response(200)) as probe:
+            check_ollama_available("http://localhost:11434")
+        request = probe.call_args.args[0]
+        assert (request.get_method(), request.full_url) == (
+            "HEAD",
+            "http://localhost:11434/",
+        )
+
+    def test_head_not_allowed_still_reachable(self):
+        error = urllib.error.HTTPError("http://x", 405, "Method Not Allowed", {}, None)
+        with patch("urllib.request.urlopen", side_effect=error):
+            assert check_ollama_available("http://localhost:11434") is True
+
     def test_exception_returns_false(self):
-        with patch("subprocess.run", side_effect=Exception("connection refused")):
+        with patch("urllib.request.urlopen", side_effect=ConnectionRefusedError()):
             assert check_ollama_available("http://localhost:11434") is False
 
     def test_timeout_returns_false(self):
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("curl", 5)):
+        with patch("urllib.request.urlopen", side_effect=TimeoutError()):
             assert check_ollama_available("http://localhost:11434") is False
 
+    def test_probe_runs_in_process(self):
+        server = _serve({"/": b"", "/api/tags": b'{"models": [{"name": "qwen:7b"}]}'})
+        url = f"http://127.0.0.1:{server.server_port}"
+        try:
+            with patch("subprocess.run", side_effect=AssertionError("forked")):
+                assert check_ollama_available(url) is True
+                assert _check_ollama_model(url, "qwen:7b") is True
+                assert _check_ollama_model(url, "llama:70b") is False
+        finally:
+            server.shutdown()
+            server.server_close()
+        invalidate_probe_cache()
+        assert check_ollama_available(url) is False
+
+    def test_probe_cached_within_ttl(self):
+        with patch("urllib.request.urlopen", return_value=_response(200)) as probe:
+            assert check_ollama_available("http://localhost:11434") is True
+            assert check_ollama_available("http://localhost:11434") is True
+            assert check_ollama_available("http://other:11434") is True
+        assert probe.call_count == 2
+
+    def test_expired_or_invalidated_probe_repeated(self):
+        with patch("urllib.request.urlopen", side_effect=OSError()) as probe:
+            check_ollama_available("http://localhost:11434", ttl=0)
+            check_ollama_available("http://localhost:11434", ttl=0)
+            invalidate_probe_cache("http://localhost:11434")
+            check_ollama_available("http://localhost:11434")
+        assert probe.call_count == 3
+
 
 # ---------------------------------------------------------------------------
 # TierRunner.run_tier1
@@ -193,3 +282,222 @@ class TestParseMicroAgentOutput:
         parsed = _parse_micro_agent_output("ITERATIONS: 2 Total\nCOST: $1.00 TOTAL")
         assert parsed["iterations"] == 2
         assert parsed["cost_usd"] == 1.0
+
+    def test_patterns_precompiled(self):
+        stdout = (
+            "Iterations: 2 total\nCost: $0.5 total\nDuration: 3.0s\n"
+            '[artisan] Code written {"file":"src/a.rs","size":1}\n'
+            "error[E0425]: cannot find value `x`\n"
+        )
+        with patch("re.search", side_effect=AssertionError("recompiled")), \
+             patch("re.finditer", side_effect=AssertionError("recompiled")), \
+             patch("re.findall", side_effect=AssertionError("recompiled")):
+            parsed = _parse_micro_agent_output(stdout)
+        assert (parsed["iterations"], parsed["cost_usd"], parsed["duration_sec"]) == (
+            2, 0.5, 3.0
+        )
+        assert parsed["files_written"] == ["src/a.rs"]
+        assert parsed["errors"] == ["error[E0425]: cannot find value `x`"]
+
+    def test_error_lines_must_start_the_line(self):
+        stdout = (
+            "note: no error: here\n"
+            "  \terror: indented counts  \n"
+            "\n\nerror[E1]: after blank lines\n"
+            "error[E]: malformed code\n"
+            "error: last line without newline"
+        )
+        assert _parse_micro_agent_output(stdout)["errors"] == [
+            "error: indented counts",
+            "error[E1]: after blank lines",
+            "error: last line without newline",
+        ]
+
+    def test_later_occurrence_used_when_first_does_not_parse(self):
+        stdout = "cost: n/a\nDuration: pending\nİ Cost: $0.25 total\nduration: 4s\n"
+        parsed = _parse_micro_agent_output(stdout)
+        assert (parsed["cost_usd"], parsed["duration_sec"]) == (0.25, 4.0)
+        parsed = _parse_micro_agent_output(stdout.replace("İ", "-"))
+        assert (parsed["cost_usd"], parsed["duration_sec"]) == (0.25, 4.0)
+
+
+# ---------------------------------------------------------------------------
+# _tier_skip_reason
+# ---------------------------------------------------------------------------
+
+class TestTierSkipReason:
+    URL = "http://localhost:11434"
+
+    def test_all_providers_available(self):
+        models = {"coder": "ollama/qwen", "reviewer": "google/gemini", "x": None}
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "k"}), patch(
+            "cli.sentinel.tier_runner.check_ollama_available", return_value=True
+        ):
+            assert _tier_skip_reason(models, self.URL, 30.0) is None
+
+    def test_ollama_unreachable_reported_first(self):
+        models = {"coder": "ollama/qwen", "reviewer": "openai/gpt"}
+        with patch.dict(os.environ, {}, clear=True), patch(
+            "cli.sentinel.tier_runner.check_ollama_available", return_value=False
+        ):
+            reason = _tier_skip_reason(models, self.URL, 30.0)
+        assert reason == f"Ollama not reachable at {self.URL} (needed for: coder)"
+
+    def test_missing_key_names_roles(self):
+        models = {"coder": "groq/llama", "tester": "groq/llama", "a": "anthropic/c"}
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "k"}, clear=True):
+            reason = _tier_skip_reason(models, self.URL, 30.0)
+        assert reason == "GROQ_API_KEY not set (needed for: coder, tester)"
+        with patch.dict(os.environ, {}, clear=True):
+            reason = _tier_skip_reason({"r": "google/gemini"}, self.URL, 30.0)
+        assert reason == "GOOGLE_API_KEY / GEMINI_API_KEY not set (needed for: r)"
+
+
+# ---------------------------------------------------------------------------
+# Streaming micro-agent output
+# ---------------------------------------------------------------------------
+
+class TestStreaming:
+    def test_metrics_folded_line_by_line(self):
+        parsed = {"iterations": 0, "cost_usd": 0.0, "duration_sec": 0.0}
+        for line in ["[tier] Iterations: 2\n", "\x1b[1mCost: $0.40\x1b[0m\n",
+                     "Iterations: 5\n", "Duration: 12.5s\n"]:
+            _update_parsed_inplace(parsed, line)
+        assert parsed == {"iterations": 2, "cost_usd": 0.4, "duration_sec": 12.5}
+
+    def test_streamed_cost_keeps_running_total(self):
+        parsed = {"iterations": 0, "cost_usd": 0.0, "duration_sec": 0.0}
+        for line in ["Cost: $0.40\n", "Cost: $1.20\n", "Cost: $0.05\n"]:
+            _update_parsed_inplace(parsed, line)
+        assert parsed["cost_usd"] == 1.2
+
+    def test_increasing_streamed_cost_stops_process(self, tmp_path):
+        script = (
+            "import time\n"
+            "for total in ('0.30', '0.60', '1.10'):\n"
+            "    print(f'Cost: ${total} total', flush=True)\n"
+            "time.sleep(30)\n"
+            "print('late', flush=True)\n"
+        )
+        parsed = {"iterations": 0, "cost_usd": 0.0, "duration_sec": 0.0}
+
+        def over_budget(line):
+            _update_parsed_inplace(parsed, line)
+            return parsed["cost_usd"] > 1.0
+
+        with patch("builtins.print"):
+            rc, out = _run_streaming_tee(
+                [sys.executable, "-c", script], dict(os.environ), 60,
+                tmp_path / "ma.log", on_line=over_budget,
+            )
+        assert rc != 0
+        assert parsed["cost_usd"] == 1.1
+        assert out.splitlines()[-1] == "Cost: $1.10 total"
+
+    def test_on_line_stops_process_early(self, tmp_path):
+        script = (
+            "import time\n"
+            "print('Cost: $1.50', flush=True)\n"
+            "time.sleep(30)\n"
+            "print('late', flush=True)\n"
+        )
+        parsed = {"iterations": 0, "cost_usd": 0.0, "duration_sec": 0.0}
+
+        def over_budget(line):
+            _update_parsed_inplace(parsed, line)
+            return parsed["cost_usd"] > 1.0
+
+        with patch("builtins.print"):
+            rc, out = _run_streaming_tee(
+                [sys.executable, "-c", script], dict(os.environ), 60,
+                tmp_path / "ma.log", on_line=over_budget,
+            )
+        assert rc != 0
+        assert out == "Cost: $1.50\n"
+        assert (tmp_path / "ma.log").read_text() == out
+
+
+# ---------------------------------------------------------------------------
+# run_tiered probe cache
+# ---------------------------------------------------------------------------
+
+class TestRunTieredProbeCache:
+    def _run(self, tmp_path, monkeypatch, output: str) -> int:
+        """Run two local tiers that both fail with output; return probe count."""
+        import json
+
+        # run_tiered imports the budget tracker as top-level `sentinel`
+        monkeypatch.syspath_prepend(str(PROJECT_ROOT / "cli"))
+
+        tiers = [
+            {"name": f"local-{i}", "models": {"artisan": "ollama/qwen"}}
+            for i in range(2)
+        ]
+        (tmp_path / "tiers.json").write_text(json.dumps({"tiers": tiers}))
+        config = _make_config()
+        config.sentinel_tiers_file = "tiers.json"
+        config.sentinel_min_tier = ""
+        config.sentinel_max_total_cost_usd = 5.0
+        config.sentinel_max_total_duration_min = 30
+        config.sentinel_tier1_probe_ttl = 30.0
+        invalidate_probe_cache()
+        with patch("urllib.request.urlopen", return_value=_response(200)) as probe, \
+                patch("cli.sentinel.tier_runner._run_streaming_tee", return_value=(1, output)), \
+                patch("cli.sentinel.tier_runner._write_tier_config", return_value=None), \
+                patch("builtins.print"):
+            result = TierRunner(config).run_tiered(
+                "fix", "pytest", config, tmp_path, target_files=["a.py"]
+            )
+        invalidate_probe_cache()
+        assert result.final_status == "FAIL"
+        return probe.call_count
+
+    def test_connection_error_forces_reprobe(self, tmp_path, monkeypatch):
+        out = "Error: connect ECONNREFUSED 127.0.0.1:11434\n"
+        assert self._run(tmp_path, monkeypatch, out) == 2
+
+    def test_ordinary_failure_keeps_cached_probe(self, tmp_path, monkeypatch):
+        assert self._run(tmp_path, monkeypatch, "1 test failed\n") == 1
+
+
+# ---------------------------------------------------------------------------
+# run_tiered budget kill
+# ---------------------------------------------------------------------------
+
+class TestRunTieredBudgetKill:
+    def test_killed_tier_records_streamed_total(self, tmp_path, monkeypatch):
+        import json
+
+        monkeypatch.syspath_prepend(str(PROJECT_ROOT / "cli"))
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        tiers = [{"name": "paid", "models": {"artisan": "anthropic/claude"}}]
+        (tmp_path / "tiers.json").write_text(json.dumps({"tiers": tiers}))
+        config = _make_config()
+        config.sentinel_tiers_file = "tiers.json"
+        config.sentinel_min_tier = ""
+        config.sentinel_max_total_cost_usd = 1.0
+        config.sentinel_max_total_duration_min = 30
+
+        def fake_tee(cmd, env, timeout, log_path, on_line=None):
+            out = ""
+            for line in ("Cost: $0.30\n", "Cost: $0.60\n", "Cost: $1.10\n"):
+                out += line
+                if on_line(line):
+                    return -9, out
+            return 0, out
+
+        tracker = MagicMock(task_count=0)
+        tracker.is_exhausted.return_value = False
+        tracker.would_exceed.return_value = False
+        tracker.warn_if_approaching.return_value = None
+        with patch("sentinel.budget_tracker.get_tracker", return_value=tracker), \
+                patch("cli.sentinel.tier_runner._run_streaming_tee", side_effect=fake_tee), \
+                patch("cli.sentinel.tier_runner._write_tier_config", return_value=None), \
+                patch("builtins.print"):
+            result = TierRunner(config).run_tiered(
+                "fix", "pytest", config, tmp_path, target_files=["a.py"]
+            )
+
+        assert result.final_status == "FAIL"
+        assert result.cost_usd == 1.10
+        tracker.record.assert_called_once_with(1.10, ANY, None)
@@ -82,7 +82,96 @@ def test_multiple_tables_in_one_file():
 
 def test_regex_fallback_when_sqlglot_absent():
     """Parser must still work when sqlglot is unavailable."""
-    with patch("sentinel.sql_utils.try_import_sqlglot", return_value=(None, None)):
+    with patch("sentinel.sql_schema_diff.try_import_sqlglot", return_value=(None, None)):
         ddl = "CREATE TABLE products (sku VARCHAR(32) NOT NULL, price DECIMAL(8,2));"
         result = DDLParser().parse_ddl(ddl)
         assert isinstance(result, dict)
+        assert [c.name for c in result["products"]] == ["sku", "price"]
+
+
+def test_sqlglot_resolved_once_per_parser():
+    with patch(
+        "sentinel.sql_schema_diff.try_import_sqlglot", return_value=(None, None)
+    ) as resolve:
+        parser = DDLParser()
+        parser.parse_ddl("CREATE TABLE a (id INT);")
+        parser.parse_ddl("CREATE TABLE b (id INT);")
+    resolve.assert_called_once()
+
+
+def test_parse_memoized_by_cleaned_sql():
+    from sentinel import sql_schema_diff
+
+    ddl = "CREATE TABLE t (id INT NOT NULL);"
+    sql_schema_diff._parse_cleaned.cache_clear()
+    with patch.object(
+        DDLParser, "_parse_with_regex", wraps=DDLParser._parse_with_regex
+    ) as regex, patch("sentinel.sql_schema_diff.try_import_sqlglot", return_value=(None, None)):
+        first = DDLParser().parse_ddl(ddl)
+        second = DDLParser().parse_ddl(ddl)
+    sql_schema_diff._parse_cleaned.cache_clear()
+    assert regex.call_count == 1
+    assert first == second and first is not second
+    first["t"].clear()
+    assert second["t"] == [ColumnDef("id", "INT", nullable=False)]
+
+
+def test_regex_parser_tokenizes_column_definitions():
+    ddl = (
+        "CREATE TABLE orders (\n"
+        "  id BIGINT PRIMARY KEY NOT NULL,\n"
+        "  total DECIMAL( 10 , 2 ) not  null,\n"
+        "  note VARCHAR(MAX),\n"
+        "  placed_at TIMESTAMP DEFAULT now(),\n"
+        "  CONSTRAINT fk FOREIGN KEY (id) REFERENCES t(id)\n"
+        ");"
+    )
+    cols = DDLParser._parse_with_regex(ddl)["orders"]
+    assert cols == [
+        ColumnDef("id", "BIGINT", nullable=False, is_pk=True),
+        ColumnDef("total", "DECIMAL( 10 , 2 )", nullable=False),
+        ColumnDef("note", "VARCHAR(MAX)"),
+        ColumnDef("placed_at", "TIMESTAMP"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "coldef, nullable, is_pk",
+    [
+        ("status VARCHAR(10) DEFAULT 'NOT NULL'", True, False),
+        ('status VARCHAR(10) DEFAULT "PRIMARY KEY"', True, False),
+        ("status VARCHAR(10) -- NOT NULL later", True, False),
+        ("status VARCHAR(10) /* PRIMARY KEY */", True, False),
+        ("status INT CHECK (status IS NOT NULL)", True, False),
+        ("status INT NOT NULL DEFAULT 'x' PRIMARY KEY", False, False),
+        ("status INT NOT NULL PRIMARY KEY -- id", False, True),
+    ],
+)
+def test_regex_parser_constraints_only_outside_literals(coldef, nullable, is_pk):
+    from sentinel.sql_schema_diff import _tokenize_coldef
+
+    _, _, got_nullable, got_pk = _tokenize_coldef(coldef)
+    assert (got_nullable, got_pk) == (nullable, is_pk)
+
+
+def test_column_list_split_only_on_top_level_commas():
+    from sentinel.sql_schema_diff import _split_top_level
+
+    assert _split_top_level("a INT, b DECIMAL(10,2), c NUMERIC(f(1,2),3),") == [
+        "a INT",
+        " b DECIMAL(10,2)",
+        " c NUMERIC(f(1,2),3)",
+        "",
+    ]
+    assert _split_top_level("a (b, c") == ["a (b, c"]
+
+
+def test_regex_parser_column_list_spans_first_to_last_paren():
+    ddl = (
+        "CREATE TABLE a (id INT, PRIMARY KEY (id)) PARTITION BY (id);\n"
+        "CREATE TABLE b ();\n"
+        "create view c AS SELECT 1;"
+    )
+    result = DDLParser._parse_with_regex(ddl)
+    assert list(result) == ["a"]
+    assert result["a"][0] == ColumnDef("id", "INT", is_pk=True)
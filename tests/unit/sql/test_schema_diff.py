@@ -1,6 +1,7 @@
 """Unit tests for SchemaDiff in cli/sentinel/sql_schema_diff.py."""
 
 import json
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -124,3 +125,310 @@ def test_no_changes_empty_report(tmp_path):
 
     report = SchemaDiff.compare_post_wave(5, [str(sql_file)], str(snap_dir))
     assert report.has_breaking_changes is False
+
+
+def _git_repo(root: Path, **files: str) -> None:
+    """Init a git repo in root with the given <name>_sql files committed."""
+    git = ["git", "-c", "user.email=t@t", "-c", "user.name=t"]
+    for name, content in files.items():
+        (root / name.replace("_sql", ".sql")).write_text(content, encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=root, check=True)
+
+
+def test_capture_pre_wave_reads_head_in_one_git_call(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    _git_repo(
+        tmp_path,
+        a_sql="CREATE TABLE a (id INT NOT NULL);",
+        b_sql="CREATE TABLE b (id INT);",
+    )
+    (tmp_path / "a.sql").write_text("CREATE TABLE a (id BIGINT);", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    with patch("sentinel.sql_schema_diff.subprocess.run", wraps=subprocess.run) as run:
+        SchemaSnapshot.capture_pre_wave(1, ["a.sql", "new.sql", "b.sql"], "snaps")
+    assert run.call_count == 1
+    files = SchemaSnapshot.load_pre_wave(1, "snaps")
+    assert files["a.sql"]["a"][0][:3] == ["id", "INT", False]
+    assert files["new.sql"] == {}
+    assert list(files["b.sql"]) == ["b"]
+
+
+def test_find_affected_bulk_matches_single_lookups(tmp_path):
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import AffectedModelFinder
+
+    models = tmp_path / "models"
+    (models / "marts").mkdir(parents=True)
+    (models / "fct_orders.sql").write_text(
+        "SELECT order_id, Discount_Pct FROM {{ ref('orders') }}", encoding="utf-8"
+    )
+    (models / "marts" / "dim_users.sql").write_text(
+        "SELECT u.id FROM {{ source('raw', 'users') }} u JOIN {{ ref('ORDERS') }} o",
+        encoding="utf-8",
+    )
+    (models / "unrelated.sql").write_text("SELECT discount_pct FROM x", encoding="utf-8")
+    refs = [("orders", "discount_pct"), ("orders", ""), ("users", "id"), ("users", "email")]
+
+    with patch("pathlib.Path.read_text", autospec=True, side_effect=Path.read_text) as read:
+        bulk = AffectedModelFinder.find_affected_bulk(refs, str(models))
+    assert read.call_count == 3
+    for table, column in refs:
+        assert sorted(bulk[(table, column)]) == sorted(
+            AffectedModelFinder.find_affected(table, column, str(models))
+        )
+    assert bulk[("orders", "discount_pct")] == ["fct_orders"]
+    assert bulk[("users", "email")] == []
+
+
+def test_unchanged_files_skip_parse(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import DDLParser
+
+    _git_repo(
+        tmp_path,
+        a_sql="CREATE TABLE a (id INT, note TEXT);",
+        b_sql="CREATE TABLE b (id INT);",
+    )
+    (tmp_path / "a.sql").write_text("CREATE TABLE a (id INT);", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    SchemaSnapshot.capture_pre_wave(7, ["a.sql", "b.sql"], "snaps")
+
+    with patch.object(DDLParser, "parse_many", wraps=DDLParser().parse_many) as parse:
+        report = SchemaDiff.compare_post_wave(7, ["a.sql", "b.sql"], "snaps")
+    assert parse.call_args.args[0] == ["CREATE TABLE a (id INT);"]
+    assert report.files_skipped == 1
+    assert [(c.table_name, c.column_name, c.change_type) for c in report.changes] == [
+        ("a", "note", "COLUMN_REMOVED")
+    ]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_snapshot_written_gzipped(tmp_path, monkeypatch, use_orjson):
+    import gzip
+    from unittest.mock import patch
+
+    _git_repo(tmp_path, a_sql="CREATE TABLE a (id INT);")
+    monkeypatch.chdir(tmp_path)
+    orjson_mod = None
+    if use_orjson:
+        orjson_mod = pytest.importorskip("orjson")
+    with patch("sentinel.sql_schema_diff._orjson", orjson_mod):
+        SchemaSnapshot.capture_pre_wave(8, ["a.sql"], "snaps")
+        files = SchemaSnapshot.load_pre_wave(8, "snaps")
+    snap = tmp_path / "snaps" / "wave_8_pre.json.gz"
+    assert not (tmp_path / "snaps" / "wave_8_pre.json").exists()
+    assert json.loads(gzip.decompress(snap.read_bytes()))["files"] == files
+    assert list(files["a.sql"]) == ["a"]
+
+
+def test_find_affected_reuses_compiled_patterns(tmp_path):
+    from sentinel import sql_schema_diff
+    from sentinel.sql_schema_diff import AffectedModelFinder
+
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "fct.sql").write_text("SELECT id FROM {{ ref('Orders') }}", encoding="utf-8")
+    (models / "other.sql").write_text("SELECT 1", encoding="utf-8")
+    sql_schema_diff._affected_patterns.cache_clear()
+    for _ in range(3):
+        assert AffectedModelFinder.find_affected("orders", "ID", str(models)) == ["fct"]
+    info = sql_schema_diff._affected_patterns.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_find_affected_uses_unicode_matching(tmp_path):
+    from sentinel.sql_schema_diff import AffectedModelFinder
+
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "fct.sql").write_text(
+        "-- café\nSELECT GRÖSSE FROM {{ source('raw', 'Bestellungen') }}",
+        encoding="utf-8",
+    )
+    (models / "glued.sql").write_text(
+        "SELECT éid FROM {{ ref('bestellungen') }}", encoding="utf-8"
+    )
+    (models / "bad.sql").write_bytes(b"\xff\xfe SELECT id FROM {{ ref('orders') }}")
+    (models / "empty.sql").write_bytes(b"")
+    refs = [("BESTELLUNGEN", "grösse"), ("bestellungen", "id"), ("orders", "id")]
+    expected = {
+        ("BESTELLUNGEN", "grösse"): ["fct"],  # Ö/ö fold only under Unicode rules
+        ("bestellungen", "id"): [],  # é is a word character: no \b before id
+        ("orders", "id"): ["bad"],  # undecodable bytes are replaced, not skipped
+    }
+    bulk = AffectedModelFinder.find_affected_bulk(refs, str(models))
+    for ref in refs:
+        assert AffectedModelFinder.find_affected(*ref, str(models)) == expected[ref]
+        assert bulk[ref] == expected[ref]
+
+
+def test_find_affected_reuses_model_listing(tmp_path):
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import AffectedModelFinder
+
+    models = tmp_path / "models"
+    (models / "marts").mkdir(parents=True)
+    (models / "marts" / "fct.sql").write_text(
+        "SELECT id, email FROM {{ ref('users') }}", encoding="utf-8"
+    )
+    files = AffectedModelFinder.list_model_files(str(models))
+    assert AffectedModelFinder.list_model_files(str(tmp_path / "missing")) == []
+    with patch("pathlib.Path.rglob", side_effect=AssertionError("re-walked")):
+        for column in ("id", "email", "name"):
+            AffectedModelFinder.find_affected("users", column, str(models), files)
+        bulk = AffectedModelFinder.find_affected_bulk(
+            [("users", "id")], str(models), files
+        )
+    assert bulk == {("users", "id"): ["fct"]}
+
+
+def test_compare_post_wave_indexes_models_once(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import AffectedModelFinder
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "fct.sql").write_text(
+        "SELECT a, b FROM {{ ref('orders') }}", encoding="utf-8"
+    )
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    _write_snapshot(snap_dir, 9, {
+        "mig.sql": {
+            "orders": [["id", "INT", True, False], ["a", "INT", True, False], ["b", "INT", True, False]],
+            "legacy": [["id", "INT", True, False]],
+        }
+    })
+    (tmp_path / "mig.sql").write_text("CREATE TABLE orders (id INT);", encoding="utf-8")
+
+    with patch.object(
+        AffectedModelFinder, "build_index", wraps=AffectedModelFinder.build_index
+    ) as build:
+        report = SchemaDiff.compare_post_wave(9, ["mig.sql"], str(snap_dir))
+    build.assert_called_once()
+    affected = {(c.table_name, c.column_name): c.affected_models for c in report.changes}
+    assert affected == {("legacy", None): [], ("orders", "a"): ["fct"], ("orders", "b"): ["fct"]}
+
+
+def test_schema_change_is_slotted():
+    from sentinel.sql_schema_diff import ColumnDef, SchemaChange
+
+    change = SchemaChange(file_path="a.sql", table_name="t", change_type="TABLE_ADDED")
+    assert not hasattr(change, "__dict__")
+    assert not hasattr(ColumnDef("id", "INT"), "__dict__")
+    change.affected_models = ["fct"]
+    assert change.affected_models == ["fct"]
+
+
+def test_snapshot_matched_by_exact_path_then_basename(tmp_path):
+    snap_dir = tmp_path / "snapshots"
+    snap_dir.mkdir()
+    (tmp_path / "b").mkdir()
+    exact = tmp_path / "b" / "mig.sql"
+    _write_snapshot(snap_dir, 9, {
+        "a/mig.sql": {"orders": [["id", "INT", False, False]]},
+        str(exact): {"users": [["id", "INT", False, False]]},
+        "c/mig.sql": {"items": [["id", "INT", False, False]]},
+    })
+    exact.write_text("CREATE TABLE users (id INT);", encoding="utf-8")
+    (tmp_path / "mig.sql").write_text("CREATE TABLE orders (id INT);", encoding="utf-8")
+
+    report = SchemaDiff.compare_post_wave(
+        9, [str(exact), str(tmp_path / "mig.sql")], str(snap_dir)
+    )
+    assert report.changes == []
+
+
+@pytest.mark.parametrize(
+    "old_type, new_type, narrowing",
+    [
+        ("VARCHAR(100)", "varchar(50)", True),
+        ("VARCHAR(50)", "VARCHAR(100)", False),
+        ("DECIMAL(10,2)", "DECIMAL(8, 4)", True),
+        ("VARCHAR(MAX)", "VARCHAR(10)", True),
+        ("VARCHAR(10)", "VARCHAR(MAX)", False),
+        ("BIGINT", "INT", True),
+        ("Double Precision", "FLOAT", True),
+        ("INT", "BIGINT", False),
+    ],
+)
+def test_is_narrowing_type_change(old_type, new_type, narrowing):
+    from sentinel.sql_schema_diff import _is_narrowing_type_change
+
+    assert _is_narrowing_type_change(old_type, new_type) is narrowing
+
+
+def test_blocking_message_lists_and_counts_breaking_changes():
+    from sentinel.sql_schema_diff import SchemaChange, SchemaDiffReport
+
+    report = SchemaDiffReport(
+        wave_id=3,
+        has_breaking_changes=True,
+        changes=[
+            SchemaChange("m.sql", "orders", "COLUMN_REMOVED", "note", is_breaking=True,
+                         affected_models=["fct", "dim"]),
+            SchemaChange("m.sql", "orders", "COLUMN_ADDED", "extra"),
+            SchemaChange("m.sql", "users", "TABLE_DROPPED", is_breaking=True),
+        ],
+    )
+    lines = report.format_blocking_message().splitlines()
+    assert lines[1:4] == [
+        "   m.sql: orders.note COLUMN_REMOVED",
+        "   Affected downstream models: fct, dim",
+        "   m.sql: users.None TABLE_DROPPED",
+    ]
+    assert "Checkpoint BLOCKED: 2 breaking schema change(s)" in lines[5]
+    assert [c.table_name for c in report._breaking] == ["orders", "users"]
+
+
+def _many_sources():
+    return [
+        f"CREATE TABLE t{i} (id INT NOT NULL, v{{{{ var('x') }}}} DECIMAL(10,2));"
+        for i in range(5)
+    ] + ["CREATE TABLE t0 (id INT NOT NULL, v1 DECIMAL(10,2));", "SELECT 1"]
+
+
+def test_parse_many_pool_matches_serial_parse():
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import DDLParser
+
+    parser = DDLParser()
+    sources = _many_sources()
+    serial = [parser.parse_ddl(sql) for sql in sources]
+    assert parser.parse_many(sources, workers=1) == serial
+    with patch("sentinel.sql_schema_diff.PARALLEL_MIN_FILES", 2):
+        assert parser.parse_many(sources, workers=2) == serial
+    assert parser.parse_many([]) == []
+
+
+def test_parse_many_sqlglot_pool_matches_serial_parse():
+    pytest.importorskip("sqlglot")
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import DDLParser
+
+    parser = DDLParser()
+    assert parser._sqlglot is not None
+    sources = _many_sources()
+    serial = [parser.parse_ddl(sql) for sql in sources]
+    with patch("sentinel.sql_schema_diff.PARALLEL_MIN_FILES", 2):
+        assert parser.parse_many(sources, workers=2) == serial
+
+
+def test_parse_many_small_batch_stays_serial():
+    from unittest.mock import patch
+
+    from sentinel.sql_schema_diff import DDLParser
+
+    with patch("sentinel.sql_schema_diff.ProcessPoolExecutor") as pool:
+        DDLParser().parse_many(_many_sources(), workers=4)
+    pool.assert_not_called()
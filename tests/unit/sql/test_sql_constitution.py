@@ -1,14 +1,21 @@
 """Unit tests for SQLConstitutionScanner and DBTSchemaYAMLScanner."""
 
+import re
 import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parents[3] / "cli"))
 
-from sentinel.sql_constitution import SQLConstitutionScanner, DBTSchemaYAMLScanner
+from sentinel.sql_constitution import (
+    DBTSchemaYAMLScanner,
+    SQLConstitutionScanner,
+    SQLScanCache,
+    SQLViolation,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +38,72 @@ def test_explicit_columns_pass(tmp_path):
     assert not any(v.rule == "NO_SELECT_STAR" for v in violations)
 
 
+def test_select_star_violations_share_message(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM a\nUNION ALL\nSELECT * FROM b\n")
+    violations = SQLConstitutionScanner().scan_file(str(f), ["NO_SELECT_STAR"])
+    assert len(violations) == 2
+    assert violations[0].message is violations[1].message
+
+
+def test_violation_is_frozen_and_slotted():
+    v = SQLViolation(rule="NO_SELECT_STAR", file_path="a.sql", line=1, message="m")
+    assert not hasattr(v, "__dict__")
+    assert {v, SQLViolation("NO_SELECT_STAR", "a.sql", 1, "m")} == {v}
+    with pytest.raises(AttributeError):
+        v.line = 2
+
+
+def test_sqlglot_parse_memoized_by_content():
+    from sentinel import sql_constitution
+
+    fake = MagicMock()
+    fake.parse.return_value = []
+    sql_constitution._parse_sql.cache_clear()
+    with patch("sentinel.sql_constitution._sqlglot", fake):
+        sql_constitution._parse_sql("SELECT a FROM t")
+        sql_constitution._parse_sql("SELECT a FROM t")
+        sql_constitution._parse_sql("SELECT b FROM t")
+    sql_constitution._parse_sql.cache_clear()
+    assert fake.parse.call_count == 2
+
+
+def test_sqlglot_stars_get_their_own_lines(tmp_path):
+    from sentinel import sql_constitution
+
+    class Select:
+        def __init__(self, expressions):
+            self.expressions = expressions
+
+    class Star:
+        pass
+
+    exp = MagicMock(Select=Select, Star=Star)
+    stmt = MagicMock()
+    stmt.find_all.return_value = [Select([Star()]), Select(["id"]), Select([Star()])]
+    fake = MagicMock()
+    fake.parse.return_value = [stmt]
+
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM a\nUNION ALL\nSELECT id FROM b\nUNION ALL\nselect *\nFROM c\n")
+    sql_constitution._parse_sql.cache_clear()
+    with patch("sentinel.sql_constitution._sqlglot", fake), \
+            patch("sentinel.sql_constitution._sqlglot_exp", exp):
+        violations = SQLConstitutionScanner().scan_file(str(f), ["NO_SELECT_STAR"])
+    sql_constitution._parse_sql.cache_clear()
+    assert [v.line for v in violations] == [1, 5]
+
+
+def test_jinja_not_stripped_without_sqlglot(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM {{ ref('stg_orders') }}")
+    with patch("sentinel.sql_constitution._sqlglot", None), \
+            patch("sentinel.sql_constitution.strip_jinja") as strip:
+        violations = SQLConstitutionScanner().scan_file(str(f), ["NO_SELECT_STAR"])
+    strip.assert_not_called()
+    assert [v.rule for v in violations] == ["NO_SELECT_STAR"]
+
+
 # ---------------------------------------------------------------------------
 # NO_HARDCODED_CREDENTIALS
 # ---------------------------------------------------------------------------
@@ -51,6 +124,36 @@ def test_parameterised_query_passes(tmp_path):
     assert not any(v.rule == "NO_HARDCODED_CREDENTIALS" for v in violations)
 
 
+def test_credentials_reported_in_file_order(tmp_path):
+    f = tmp_path / "grants.sql"
+    f.write_text(
+        'SET api_key = "abcdefgh12";\n'
+        "CREATE USER etl PASSWORD = 'supersecret123';\n"
+        "SET token = 'short';\n"
+    )
+    scanner = SQLConstitutionScanner()
+    violations = scanner.scan_file(str(f), ["NO_HARDCODED_CREDENTIALS"])
+    assert [(v.line, v.message.split("(")[1].split(")")[0]) for v in violations] == [
+        (1, "API_KEY"),
+        (2, "PASSWORD"),
+    ]
+
+
+def test_violation_lines_on_multiline_file(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text(
+        "-- header\n"
+        "SELECT * FROM a;\n"
+        "\n"
+        "SELECT id FROM b;\n"
+        "SELECT * FROM c;\n"
+    )
+    scanner = SQLConstitutionScanner()
+    with patch("sentinel.sql_constitution._sqlglot", None):
+        violations = scanner.scan_file(str(f), ["NO_SELECT_STAR"])
+    assert [v.line for v in violations] == [2, 5]
+
+
 # ---------------------------------------------------------------------------
 # INCREMENTAL_NEEDS_UNIQUE_KEY
 # ---------------------------------------------------------------------------
@@ -99,6 +202,37 @@ def test_migration_with_rollback_passes(tmp_path):
     assert not any(v.rule == "MIGRATION_NEEDS_ROLLBACK" for v in violations)
 
 
+# Neutral temp dirs: tmp_path embeds the test name, which mentions migrations
+@pytest.mark.parametrize(
+    "rel, applies",
+    [
+        ("migrations/001.sql", True),
+        ("schema_migrations/001.sql", True),
+        ("db/migration/001.sql", False),
+        ("V1__migration.sql", False),
+        ("Migrations/001.sql", False),
+    ],
+)
+def test_rollback_rule_scope_matches_migrations_substring(rel, applies):
+    f = Path(tempfile.mkdtemp(prefix="dk-sql-")) / rel
+    f.parent.mkdir(parents=True, exist_ok=True)
+    f.write_text("ALTER TABLE orders ADD COLUMN coupon_code VARCHAR(32);")
+    violations = SQLConstitutionScanner().scan_file(str(f), ["MIGRATION_NEEDS_ROLLBACK"])
+    assert [v.rule for v in violations] == (["MIGRATION_NEEDS_ROLLBACK"] if applies else [])
+
+
+def test_rollback_rule_skipped_outside_migrations():
+    root = Path(tempfile.mkdtemp(prefix="dk-sql-"))
+    (root / "models").mkdir()
+    f = root / "models" / "orders_report.sql"
+    f.write_text("ALTER TABLE orders ADD COLUMN coupon_code VARCHAR(32);")
+    scanner = SQLConstitutionScanner()
+    with patch.object(SQLConstitutionScanner, "_check_migration_rollback") as check:
+        violations = scanner.scan_file(str(f), ["MIGRATION_NEEDS_ROLLBACK"])
+    check.assert_not_called()
+    assert violations == []
+
+
 # ---------------------------------------------------------------------------
 # MODEL_DESCRIPTION_REQUIRED (YAML)
 # ---------------------------------------------------------------------------
@@ -121,6 +255,390 @@ def test_model_with_description_passes(tmp_path):
     assert not any(v.rule == "MODEL_DESCRIPTION_REQUIRED" for v in violations)
 
 
+def test_yaml_violation_lines_per_model(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text(
+        "version: 2\n"
+        "models:\n"
+        "  - name: orders_v2\n"
+        "    description: 'v2'\n"
+        "  - name: orders\n"
+        "    config:\n"
+        "      materialized: incremental\n"
+        '  - name: "customers"\n'
+    )
+    scanner = DBTSchemaYAMLScanner()
+    violations = scanner.scan_yaml(
+        str(f), ["MODEL_DESCRIPTION_REQUIRED", "INCREMENTAL_NEEDS_UNIQUE_KEY"]
+    )
+    assert [(v.rule, v.line) for v in violations] == [
+        ("MODEL_DESCRIPTION_REQUIRED", 5),
+        ("INCREMENTAL_NEEDS_UNIQUE_KEY", 5),
+        ("MODEL_DESCRIPTION_REQUIRED", 8),
+    ]
+
+
+def test_missing_description_found_without_pyyaml(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text("models:\n  - name: fct_orders\n    config:\n      tags: ['daily']\n")
+    scanner = DBTSchemaYAMLScanner()
+    with patch("sentinel.sql_constitution._yaml", None):
+        violations = scanner.scan_yaml(str(f), ["MODEL_DESCRIPTION_REQUIRED"])
+    assert [(v.rule, v.line) for v in violations] == [("MODEL_DESCRIPTION_REQUIRED", 2)]
+
+
+def test_yaml_loader_prefers_libyaml():
+    import yaml
+    from sentinel import sql_constitution
+
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert sql_constitution._YAML_LOADER is expected
+
+
+def test_schema_models_read_through_pyyaml(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text(
+        "version: 2\n"
+        "models:\n"
+        "  - name: fct_orders\n"
+        "    description: >\n"
+        "      Daily order fact.\n"
+        "    config:\n"
+        "      materialized: incremental\n"
+        "      unique_key:\n"
+        "        - order_id\n"
+        "    columns:\n"
+        "      - name: id\n"
+        "  - name: stg_orders  # staging\n"
+        "    description: ''\n"
+        "    config:\n"
+        "      materialized: 'incremental'\n"
+    )
+    violations = DBTSchemaYAMLScanner().scan_yaml(
+        str(f), ["MODEL_DESCRIPTION_REQUIRED", "INCREMENTAL_NEEDS_UNIQUE_KEY"]
+    )
+    assert [(v.rule, v.line) for v in violations] == [
+        ("MODEL_DESCRIPTION_REQUIRED", 12),
+        ("INCREMENTAL_NEEDS_UNIQUE_KEY", 12),
+    ]
+
+
+@pytest.mark.parametrize("value", ["'   '", "''", "~", "Null"])
+def test_blank_description_counts_as_missing(tmp_path, value):
+    f = tmp_path / "schema.yml"
+    f.write_text(f"models:\n  - name: fct_orders\n    description: {value}\n")
+    violations = DBTSchemaYAMLScanner().scan_yaml(str(f), ["MODEL_DESCRIPTION_REQUIRED"])
+    assert [v.rule for v in violations] == ["MODEL_DESCRIPTION_REQUIRED"]
+
+
+def test_schema_pyyaml_rejects_goes_to_regex_fallback(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text(
+        "models:\n"
+        "  - name: fct_orders\n"
+        "    config:\n"
+        "      materialized: incremental\n"
+        "    columns:\n"
+        "      - name: id\n"
+        "        description: x:\n"
+    )
+    scanner = DBTSchemaYAMLScanner()
+    with patch.object(scanner, "_check_yaml_regex", return_value=[]) as regex:
+        scanner.scan_yaml(str(f), ["INCREMENTAL_NEEDS_UNIQUE_KEY"])
+    regex.assert_called_once()
+
+
+def test_regex_fallback_tracks_model_blocks(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text(
+        "models:\n"
+        "  - name: fct_orders\n"
+        "    description: Daily order fact.\n"
+        "  - name: stg_orders\n"
+        "    config:\n"
+        "      materialized: incremental\n"
+        "    columns:\n"
+        "      - name: id\n"
+        "        description: Order id.\n"
+        "  - name: dim_users\n"
+        "    config:\n"
+        "      materialized: incremental\n"
+        "      unique_key: user_id\n"
+        "    description: >\n"
+        "      Users.\n"
+    )
+    scanner = DBTSchemaYAMLScanner()
+    with patch("sentinel.sql_constitution._yaml", None):
+        violations = scanner.scan_yaml(
+            str(f), ["MODEL_DESCRIPTION_REQUIRED", "INCREMENTAL_NEEDS_UNIQUE_KEY"]
+        )
+    assert [(v.rule, v.line) for v in violations] == [
+        ("MODEL_DESCRIPTION_REQUIRED", 4),
+        ("INCREMENTAL_NEEDS_UNIQUE_KEY", 4),
+    ]
+
+
+def test_regex_fallback_reads_inline_mappings(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text(
+        "models:\n"
+        "  - name: fct_orders, description: Daily order fact.\n"
+        "    config: {materialized: incremental}\n"
+        "  - {name: dim_users, config: {materialized: incremental, unique_key: id}}\n"
+    )
+    scanner = DBTSchemaYAMLScanner()
+    with patch("sentinel.sql_constitution._yaml", None):
+        violations = scanner.scan_yaml(
+            str(f), ["MODEL_DESCRIPTION_REQUIRED", "INCREMENTAL_NEEDS_UNIQUE_KEY"]
+        )
+    assert [(v.rule, v.line) for v in violations] == [
+        ("INCREMENTAL_NEEDS_UNIQUE_KEY", 2),
+        ("MODEL_DESCRIPTION_REQUIRED", 4),
+    ]
+    assert "'dim_users'" in violations[1].message
+
+
+# ---------------------------------------------------------------------------
+# Substring prefilter
+# ---------------------------------------------------------------------------
+
+def test_clean_file_skips_rule_checks(tmp_path, monkeypatch):
+    f = tmp_path / "stg.sql"
+    f.write_text("with src as (values (1)) table src")
+    scanner = SQLConstitutionScanner()
+
+    def fail(*_args):
+        raise AssertionError("rule check ran on a file without trigger tokens")
+
+    monkeypatch.setattr(scanner, "_check_no_select_star", fail)
+    monkeypatch.setattr(scanner, "_check_no_hardcoded_credentials", fail)
+    monkeypatch.setattr(scanner, "_check_incremental_unique_key", fail)
+    violations = scanner.scan_file(
+        str(f),
+        ["NO_SELECT_STAR", "NO_HARDCODED_CREDENTIALS", "INCREMENTAL_NEEDS_UNIQUE_KEY"],
+    )
+    assert violations == []
+
+
+def test_prefilter_is_case_insensitive(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SeLeCt * FROM stg_orders;\nSET PWD = 'hunter22';")
+    scanner = SQLConstitutionScanner()
+    rules = {
+        v.rule
+        for v in scanner.scan_file(str(f), ["NO_SELECT_STAR", "NO_HARDCODED_CREDENTIALS"])
+    }
+    assert rules == {"NO_SELECT_STAR", "NO_HARDCODED_CREDENTIALS"}
+
+
+def test_absent_literals_drop_tokens_from_scan():
+    from sentinel import sql_constitution
+
+    rules = frozenset({"INCREMENTAL_NEEDS_UNIQUE_KEY", "MIGRATION_NEEDS_ROLLBACK"})
+    lowered = "{{ config(materialized='incremental') }}\nselect id from t"
+    assert sql_constitution._token_groups(rules, lowered) == {"incremental"}
+
+
+# ---------------------------------------------------------------------------
+# Combined single-pass scan
+# ---------------------------------------------------------------------------
+
+def test_all_rules_in_one_scan(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    f = migrations_dir / "002_backfill.sql"
+    f.write_text(
+        "{{ config(materialized='incremental') }}\n"
+        "SELECT * FROM stg_orders\n"
+        "-- secret = 'abcdefghij'\n"
+        "SELECT * , 1 FROM stg_items\n"
+    )
+    scanner = SQLConstitutionScanner()
+    with patch("sentinel.sql_constitution._sqlglot", None):
+        violations = scanner.scan_file(
+            str(f),
+            [
+                "NO_SELECT_STAR",
+                "NO_HARDCODED_CREDENTIALS",
+                "INCREMENTAL_NEEDS_UNIQUE_KEY",
+                "MIGRATION_NEEDS_ROLLBACK",
+            ],
+        )
+    assert [(v.rule, v.line) for v in violations] == [
+        ("NO_SELECT_STAR", 2),
+        ("NO_HARDCODED_CREDENTIALS", 3),
+        ("INCREMENTAL_NEEDS_UNIQUE_KEY", 1),
+        ("MIGRATION_NEEDS_ROLLBACK", 1),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Multi-file scanning
+# ---------------------------------------------------------------------------
+
+def _sql_files(tmp_path, n):
+    files = []
+    for i in range(n):
+        f = tmp_path / f"m{i}.sql"
+        f.write_text("SELECT * FROM t" if i % 2 else "SELECT id FROM t")
+        files.append(str(f))
+    return files
+
+
+def test_scan_paths_matches_per_file_scan(tmp_path):
+    files = _sql_files(tmp_path, 6)
+    scanner = SQLConstitutionScanner()
+    expected = [v for f in files for v in scanner.scan_file(f, ["NO_SELECT_STAR"])]
+    with patch("sentinel.sql_constitution.PARALLEL_MIN_FILES", 2):
+        assert scanner.scan_paths(files, ["NO_SELECT_STAR"], workers=2) == expected
+    assert scanner.scan_paths(files, ["NO_SELECT_STAR"], workers=1) == expected
+    assert [v.file_path for v in expected] == files[1::2]
+
+
+def test_scan_paths_serves_cache_hits_in_process(tmp_path):
+    files = _sql_files(tmp_path, 4)
+    cache = SQLScanCache(tmp_path / "cache.db")
+    scanner = SQLConstitutionScanner(cache)
+    first = scanner.scan_paths(files, ["NO_SELECT_STAR"], workers=1)
+    with patch("sentinel.sql_constitution.ProcessPoolExecutor") as pool:
+        second = scanner.scan_paths(files, ["NO_SELECT_STAR"], workers=4)
+    cache.close()
+    pool.assert_not_called()
+    assert second == first
+
+
+def test_scan_paths_small_batch_stays_serial(tmp_path):
+    files = _sql_files(tmp_path, 6)
+    with patch("sentinel.sql_constitution.ProcessPoolExecutor") as pool:
+        SQLConstitutionScanner().scan_paths(files, ["NO_SELECT_STAR"], workers=4)
+    pool.assert_not_called()
+
+
+def test_rule_scanner_uses_re2_when_installed():
+    from sentinel import sql_constitution
+
+    fake_re2 = MagicMock()
+    fake_re2.compile.side_effect = lambda pattern, flags: re.compile(pattern, re.I)
+    sql_constitution._rule_scanner.cache_clear()
+    with patch("sentinel.sql_constitution._re2", fake_re2):
+        scanner = sql_constitution._rule_scanner(frozenset({"star"}))
+    sql_constitution._rule_scanner.cache_clear()
+    fake_re2.compile.assert_called_once()
+    assert scanner.search("select * from t").lastgroup == "star"
+
+
+def test_rule_scanner_falls_back_when_re2_rejects_pattern():
+    from sentinel import sql_constitution
+
+    fake_re2 = MagicMock()
+    fake_re2.compile.side_effect = ValueError("unsupported")
+    sql_constitution._rule_scanner.cache_clear()
+    with patch("sentinel.sql_constitution._re2", fake_re2):
+        scanner = sql_constitution._rule_scanner(frozenset({"star"}))
+    sql_constitution._rule_scanner.cache_clear()
+    assert isinstance(scanner, re.Pattern)
+
+
+# ---------------------------------------------------------------------------
+# On-disk scan cache
+# ---------------------------------------------------------------------------
+
+def test_scan_cache_hit_skips_scan(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM stg_orders")
+    cache = SQLScanCache(tmp_path / SQLScanCache.DB_REL)
+    first = SQLConstitutionScanner(cache).scan_file(str(f), ["NO_SELECT_STAR"])
+    with patch.object(SQLConstitutionScanner, "_scan_content") as scan:
+        second = SQLConstitutionScanner(cache).scan_file(str(f), ["NO_SELECT_STAR"])
+    cache.close()
+    scan.assert_not_called()
+    assert second == first and first[0].rule == "NO_SELECT_STAR"
+
+
+def test_scan_cache_keyed_by_content_and_rules(tmp_path):
+    f = tmp_path / "schema.yml"
+    f.write_text("models:\n  - name: fct_orders\n")
+    cache = SQLScanCache(tmp_path / "cache.db")
+    scanner = DBTSchemaYAMLScanner(cache)
+    assert len(scanner.scan_yaml(str(f), ["MODEL_DESCRIPTION_REQUIRED"])) == 1
+    assert scanner.scan_yaml(str(f), ["INCREMENTAL_NEEDS_UNIQUE_KEY"]) == []
+    f.write_text("models:\n  - name: fct_orders\n    description: Orders.\n")
+    assert scanner.scan_yaml(str(f), ["MODEL_DESCRIPTION_REQUIRED"]) == []
+    cache.close()
+
+
+def test_scan_cache_unusable_path_falls_back(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM stg_orders")
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    cache = SQLScanCache(blocker / "cache.db")
+    violations = SQLConstitutionScanner(cache).scan_file(str(f), ["NO_SELECT_STAR"])
+    assert [v.rule for v in violations] == ["NO_SELECT_STAR"]
+
+
+# ---------------------------------------------------------------------------
+# Large files
+# ---------------------------------------------------------------------------
+
+def test_oversized_file_skipped_with_warning(tmp_path):
+    f = tmp_path / "huge.sql"
+    f.write_text("SELECT * FROM t\n" * 10)
+    with patch("sentinel.sql_constitution.MAX_SCAN_BYTES", 16):
+        with pytest.warns(UserWarning, match="skipping SQL constitution scan"):
+            violations = SQLConstitutionScanner().scan_file(str(f), ["NO_SELECT_STAR"])
+    assert violations == []
+
+
+def test_large_file_scanned_through_mmap(tmp_path):
+    f = tmp_path / "big.sql"
+    f.write_bytes(b"SELECT id FROM a\r\n" * 50 + b"SELECT * FROM b\r\n")
+    cache = SQLScanCache(tmp_path / "cache.db")
+    with patch("sentinel.sql_constitution._MMAP_MIN_BYTES", 64), \
+            patch("sentinel.sql_constitution._sqlglot", None):
+        first = SQLConstitutionScanner(cache).scan_file(str(f), ["NO_SELECT_STAR"])
+        second = SQLConstitutionScanner(cache).scan_file(str(f), ["NO_SELECT_STAR"])
+    cache.close()
+    assert [v.line for v in first] == [51]
+    assert second == first
+
+
+# ---------------------------------------------------------------------------
+# fail_fast
+# ---------------------------------------------------------------------------
+
+def test_fail_fast_stops_at_first_violation(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("{{ config(materialized='incremental') }}\nSELECT * FROM stg_orders\n")
+    rules = ["NO_SELECT_STAR", "INCREMENTAL_NEEDS_UNIQUE_KEY"]
+    scanner = SQLConstitutionScanner()
+    assert len(scanner.scan_file(str(f), rules)) == 2
+    with patch.object(SQLConstitutionScanner, "_check_incremental_unique_key") as inc:
+        violations = scanner.scan_file(str(f), rules, fail_fast=True)
+    inc.assert_not_called()
+    assert [v.rule for v in violations] == ["NO_SELECT_STAR"]
+
+
+def test_fail_fast_credential_reports_its_line(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT id\nFROM users\nWHERE password = 'hunter2'\nAND api_key = 'abc'\n")
+    violations = SQLConstitutionScanner().scan_file(
+        str(f), ["NO_HARDCODED_CREDENTIALS"], fail_fast=True
+    )
+    assert [(v.rule, v.line) for v in violations] == [("NO_HARDCODED_CREDENTIALS", 3)]
+
+
+def test_fail_fast_results_not_cached(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM a\nUNION ALL\nSELECT * FROM b\n")
+    cache = SQLScanCache(tmp_path / "cache.db")
+    scanner = SQLConstitutionScanner(cache)
+    assert len(scanner.scan_file(str(f), ["NO_SELECT_STAR"], fail_fast=True)) == 1
+    assert len(scanner.scan_file(str(f), ["NO_SELECT_STAR"])) == 2
+    assert len(scanner.scan_file(str(f), ["NO_SELECT_STAR"], fail_fast=True)) == 1
+    cache.close()
+
+
 # ---------------------------------------------------------------------------
 # Rule not enabled -- no violations emitted for disabled rule
 # ---------------------------------------------------------------------------
@@ -132,3 +650,11 @@ def test_rule_not_enabled_no_violation(tmp_path):
     # NO_SELECT_STAR not in enabled rules
     violations = scanner.scan_file(str(f), ["NO_HARDCODED_CREDENTIALS"])
     assert not any(v.rule == "NO_SELECT_STAR" for v in violations)
+
+
+def test_enabled_rules_accepts_any_collection(tmp_path):
+    f = tmp_path / "fct.sql"
+    f.write_text("SELECT * FROM stg_orders")
+    scanner = SQLConstitutionScanner()
+    for rules in (["NO_SELECT_STAR"], ("NO_SELECT_STAR",), {"NO_SELECT_STAR"}):
+        assert [v.rule for v in scanner.scan_file(str(f), rules)] == ["NO_SELECT_STAR"]
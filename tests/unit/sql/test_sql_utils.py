@@ -0,0 +1,29 @@
+"""Unit tests for strip_jinja in cli/sentinel/sql_utils.py."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[3] / "cli"))
+
+from sentinel.sql_utils import strip_jinja
+
+
+def test_ref_and_source_replaced_by_names():
+    sql = "SELECT * FROM {{ ref('stg_orders') }} JOIN {{ source('raw', 'users') }}"
+    assert strip_jinja(sql) == "SELECT * FROM stg_orders JOIN raw__users"
+
+
+def test_other_expressions_become_literal():
+    sql = "SELECT {{ var('x') }} AS x, {{\n  ref( 'a' )\n}} AS a"
+    assert strip_jinja(sql) == "SELECT 1 AS x, a AS a"
+
+
+def test_tags_removed():
+    sql = "{{ config(materialized='table') }}\n{% if is_incremental() %}WHERE x{%- endif %}"
+    assert strip_jinja(sql) == "1\nWHERE x"
+
+
+def test_plain_braces_and_unterminated_tokens_kept():
+    sql = "SELECT '{a}', 50 % 2 FROM t {{ unterminated"
+    assert strip_jinja(sql) == sql
+    assert strip_jinja("{% if x %}a{{ b") == "a{{ b"
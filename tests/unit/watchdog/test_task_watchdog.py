@@ -0,0 +1,228 @@
+"""
+Unit tests for cli/task_watchdog.py
+
+Tests:
+  - start_task / complete_task persist immediately
+  - check_tasks batches tasks.md completions into one state write
+  - State is replaced atomically, leaving no temp file behind
+  - Compact (default) and --pretty state files round-trip, with or without orjson
+  - Old state files without *_epoch fields are backfilled on load
+  - An unparsable timestamp keeps every other tracked task
+  - An unchanged state file is not re-read; an external change is picked up
+  - tasks.md is re-read only when its mtime changes
+  - The wait between checks wakes early on a tasks.md write
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parents[3] / "cli"))
+
+import task_watchdog
+from task_watchdog import TaskWatchdog
+
+
+def _watchdog(tmp_path, monkeypatch, **kwargs) -> TaskWatchdog:
+    """A watchdog with its state file and tasks.md inside tmp_path."""
+    tasks = tmp_path / "tasks.md"
+    tasks.write_text("- [ ] T001: first\n- [ ] T002: second\n", encoding="utf-8")
+    monkeypatch.setenv("DK_TASKS_FILE", str(tasks))
+    watchdog = TaskWatchdog(str(tmp_path / ".claude" / "task_timers.json"), **kwargs)
+    watchdog.load_state()
+    return watchdog
+
+
+def _on_disk(watchdog: TaskWatchdog) -> dict:
+    return json.loads(watchdog.state_file.read_text(encoding="utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+class TestPersistence:
+    def test_start_and_complete_written_immediately(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        assert "T001" in _on_disk(watchdog)["running_tasks"]
+
+        watchdog.complete_task("T001")
+        state = _on_disk(watchdog)
+        assert state["running_tasks"] == {}
+        assert state["completed_tasks"]["T001"]["description"] == "first"
+
+    def test_check_tasks_writes_once_for_many_completions(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        watchdog.start_task("T002", "second")
+        watchdog.tasks_file.write_text(
+            "- [x] T001: first\n- [x] T002: second\n", encoding="utf-8"
+        )
+        with patch.object(
+            TaskWatchdog, "_encode_state", autospec=True,
+            side_effect=TaskWatchdog._encode_state,
+        ) as encode:
+            watchdog.check_tasks()
+        assert encode.call_count == 1
+        assert sorted(_on_disk(watchdog)["completed_tasks"]) == ["T001", "T002"]
+
+    def test_save_without_changes_skips_write(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        with patch.object(task_watchdog.os, "replace") as replace:
+            watchdog.save_state()
+        replace.assert_not_called()
+
+
+class TestAtomicWrite:
+    def test_replace_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        with patch.object(task_watchdog.os, "replace", wraps=os.replace) as replace:
+            watchdog.start_task("T001", "first")
+        tmp_file = watchdog.state_file.with_suffix(".tmp")
+        replace.assert_called_once_with(tmp_file, watchdog.state_file)
+        assert not tmp_file.exists()
+        assert sorted(p.name for p in watchdog.state_file.parent.iterdir()) == [
+            "task_timers.json"
+        ]
+
+    def test_failed_write_keeps_previous_state(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        before = watchdog.state_file.read_bytes()
+        with patch.object(task_watchdog.os, "fsync", side_effect=OSError("disk")):
+            watchdog.start_task("T002", "second")
+        assert watchdog.state_file.read_bytes() == before
+        assert not watchdog.state_file.with_suffix(".tmp").exists()
+
+
+# ---------------------------------------------------------------------------
+# State file format
+# ---------------------------------------------------------------------------
+
+class TestStateFormat:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_round_trip(self, tmp_path, monkeypatch, pretty, use_orjson):
+        if use_orjson and task_watchdog._orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(task_watchdog, "_orjson", None)
+        watchdog = _watchdog(tmp_path, monkeypatch, pretty=pretty)
+        watchdog.start_task("T001", "first — ünïcode")
+        raw = watchdog.state_file.read_text(encoding="utf-8")
+        assert ("\n" in raw) is pretty
+
+        reloaded = TaskWatchdog(str(watchdog.state_file))
+        reloaded.load_state()
+        assert reloaded.state == watchdog.state
+
+    def test_pretty_flag_reaches_watchdog(self, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["task_watchdog.py", "report", "--pretty"])
+        with patch.object(task_watchdog, "TaskWatchdog") as cls:
+            task_watchdog.main()
+        cls.assert_called_once_with(pretty=True)
+
+    def test_epochs_backfilled_from_iso_fields(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        started = "2026-01-02T03:04:05"
+        watchdog.state_file.parent.mkdir(parents=True, exist_ok=True)
+        watchdog.state_file.write_text(json.dumps({
+            "running_tasks": {"T001": {
+                "description": "first", "started_at": started,
+                "last_checked": started, "status": "running",
+            }},
+            "completed_tasks": {},
+            "warnings": [],
+        }), encoding="utf-8")
+        watchdog.load_state()
+        task = watchdog.state["running_tasks"]["T001"]
+        expected = datetime.fromisoformat(started).timestamp()
+        assert task["started_at_epoch"] == task["last_checked_epoch"] == expected
+
+        watchdog.complete_task("T001")  # duration math runs on the backfilled epoch
+        assert watchdog.state["completed_tasks"]["T001"]["duration_seconds"] > 0
+
+    def test_bad_timestamp_keeps_other_tasks(self, tmp_path, monkeypatch, capsys):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        started = "2026-01-02T03:04:05"
+        watchdog.state_file.parent.mkdir(parents=True, exist_ok=True)
+        watchdog.state_file.write_text(json.dumps({
+            "running_tasks": {
+                "T001": {"description": "first", "started_at": "yesterday",
+                         "last_checked": started, "status": "running"},
+                "T002": {"description": "second", "started_at": started,
+                         "last_checked": started, "status": "running"},
+            },
+            "completed_tasks": {},
+            "warnings": [],
+        }), encoding="utf-8")
+        watchdog.load_state()
+        assert "T001 has an unreadable started_at" in capsys.readouterr().out
+        running = watchdog.state["running_tasks"]
+        assert set(running) == {"T001", "T002"}
+        assert running["T001"]["started_at"] == "yesterday"
+        assert running["T001"]["last_checked_epoch"] == datetime.fromisoformat(started).timestamp()
+
+        watchdog.check_tasks()
+        on_disk = json.loads(watchdog.state_file.read_text(encoding="utf-8"))
+        assert set(on_disk["running_tasks"]) == {"T001", "T002"}
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+class TestChangeDetection:
+    def test_unchanged_state_file_not_reread(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            watchdog.load_state()
+
+        other = TaskWatchdog(str(watchdog.state_file))
+        other.load_state()
+        other.start_task("T002", "second")
+        st = watchdog.state_file.stat()
+        os.utime(watchdog.state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        watchdog.load_state()
+        assert sorted(watchdog.state["running_tasks"]) == ["T001", "T002"]
+
+    def test_tasks_md_reread_only_on_mtime_change(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        watchdog.start_task("T001", "first")
+        watchdog.check_tasks()
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            watchdog.check_tasks()
+        assert "T001" in watchdog.state["running_tasks"]
+
+        tasks = watchdog.tasks_file
+        tasks.write_text("- [x] T001: first\n", encoding="utf-8")
+        st = tasks.stat()
+        os.utime(tasks, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        watchdog.check_tasks()
+        assert "T001" in watchdog.state["completed_tasks"]
+
+    def test_wait_without_inotify_sleeps(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        with patch.object(task_watchdog.time, "sleep") as sleep:
+            watchdog._wait_for_change(None, 12)
+        sleep.assert_called_once_with(12)
+
+    def test_wait_returns_on_tasks_md_event(self, tmp_path, monkeypatch):
+        watchdog = _watchdog(tmp_path, monkeypatch)
+        ino = MagicMock()
+        ino.read.side_effect = [
+            [SimpleNamespace(name="other.md")],
+            [SimpleNamespace(name="tasks.md")],
+            AssertionError("kept waiting"),
+        ]
+        watchdog._wait_for_change(ino, 60)
+        assert ino.read.call_count == 2